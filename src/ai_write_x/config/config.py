@@ -1,8 +1,10 @@
 from typing import Any, Dict
 import os
+import json
 import yaml
 import threading
 import tomlkit
+from contextlib import contextmanager
 
 from ai_write_x.utils import log
 from ai_write_x.utils import utils
@@ -53,6 +55,7 @@ class Config:
         self._initialized = True
         self.config: Dict[Any, Any] = {}
         self.aiforge_config: Dict[Any, Any] = {}
+        self._saved_config_json = None  # 最近一次由 save_config 写入 config.yaml 的内容快照
         self.error_message = None
         self.config_path = self.__get_config_path()
         self.config_aiforge_path = self.__get_config_path("aiforge.toml")
@@ -1426,6 +1429,10 @@ class Config:
                 ],
             },
         }
+        # 缓存默认配置各顶层项的 JSON 序列化结果，恢复默认时反序列化即可得到独立副本
+        self._default_config_json = {
+            key: json.dumps(value, ensure_ascii=False) for key, value in self.default_config.items()
+        }
         # 自定义话题和文章参考链接，根据是否为空判断是否自定义
         self.custom_topic = ""  # 自定义话题（字符串）
         self.urls = []  # 参考链接（列表）
@@ -1750,6 +1757,7 @@ class Config:
         """加载配置，从 config.yaml 或默认配置，不验证"""
         with self._lock:
             ret = True
+            self._saved_config_json = None
             if os.path.exists(self.config_path):
                 try:
                     with open(self.config_path, "r", encoding="utf-8") as f:
@@ -1796,9 +1804,11 @@ class Config:
                         default_flow_style=False,
                         indent=2,
                     )
+                self._saved_config_json = self._config_snapshot(config)
             except Exception as e:
                 self.error_message = f"保存 config.yaml 失败: {e}"
                 log.print_log(self.error_message, "error")
+                self._saved_config_json = None
                 ret = False
 
             # 如果传递了
@@ -1815,6 +1825,27 @@ class Config:
 
             return ret
 
+    def get_default_config(self, key):
+        """获取默认配置中某个顶层项的独立副本（比 deepcopy 快，且不受运行时修改影响）"""
+        return json.loads(self._default_config_json[key])
+
+    def save_config_partial(self, partial_config, aiforge_config=None):
+        """仅替换指定的顶层配置项并保存到 config.yaml，不验证"""
+        with self._lock:
+            config = dict(self.get_config())
+            config.update(partial_config)
+            # 内容与上次写入的完全一致时无需重写文件
+            if aiforge_config is None and self._saved_config_json is not None:
+                if self._config_snapshot(config) == self._saved_config_json:
+                    self.config = config
+                    return True
+            return self.save_config(config, aiforge_config)
+
+    @staticmethod
+    def _config_snapshot(config):
+        """序列化配置用于判断内容是否变化（保留键顺序，与写入 YAML 时一致）"""
+        return json.dumps(config, ensure_ascii=False, default=str)
+
     def save_dimensional_creative_config(self, dimensional_config):
         """保存维度化创意配置到单独的文件"""
         with self._lock:
@@ -1840,6 +1871,12 @@ class Config:
 
             return ret
 
+    @contextmanager
+    def locked(self):
+        """持有配置锁执行代码块：原地修改内存配置或复制配置时使用，避免与后台保存同时进行"""
+        with self._lock:
+            yield self
+
     def get_config(self):
         """获取配置，不验证"""
         with self._lock:
@@ -2114,6 +2151,8 @@ class Config:
 
                 # 更新内存中的配置
                 self.config = merged_config
+                # 只有 save_config 写入后才记录快照，这里的内存配置不作为“未变化”的判断依据
+                self._saved_config_json = None
 
                 log.print_log("配置数据加载成功", "success")
                 return True
@@ -2145,6 +2184,7 @@ class Config:
                     )
 
                 self.config = self.default_config.copy()
+                self._saved_config_json = None
                 return True
 
             except Exception:
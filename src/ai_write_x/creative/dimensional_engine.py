@@ -114,21 +114,23 @@ class DimensionalCreativeEngine:
             # 根据优先级选择维度
             priority_categories = self.config.get("priority_categories", [])
 
+            # 成员判断使用集合，列表仅用于保持维度顺序
+            available_set = frozenset(available_categories)
+            priority_set = frozenset(priority_categories)
+
             # 收集候选维度组合
             candidate_dimensions = []
 
             # 首先从优先维度中选择
             for category in priority_categories:
-                if category in available_categories:
+                if category in available_set:
                     options = self.get_dimension_options(category, ignore_enabled_filter=True)
                     if options:
                         for option in options:
                             candidate_dimensions.append((category, option))
 
             # 如果还需要更多维度，从其他可用维度中选择
-            remaining_categories = [
-                cat for cat in available_categories if cat not in priority_categories
-            ]
+            remaining_categories = [cat for cat in available_categories if cat not in priority_set]
 
             for category in remaining_categories:
                 options = self.get_dimension_options(category, ignore_enabled_filter=True)
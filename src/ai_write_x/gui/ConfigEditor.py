@@ -1,20 +1,136 @@
 import PySimpleGUI as sg
+import queue
 import re
-import copy
 import sys
+import threading
+from collections import namedtuple
 
 from ai_write_x.config.config import Config, DEFAULT_TEMPLATE_CATEGORIES
 from ai_write_x.utils import utils
 from ai_write_x.utils.path_manager import PathManager
 
+# 仅 macOS 需要修正输入框的剪贴板内容
+_IS_MAC = sys.platform == "darwin"
+
+# 删除微信凭证按钮事件，例如：-DELETE_WECHAT_1-
+_DELETE_WECHAT_RE = re.compile(r"-DELETE_WECHAT_(\d+)-")
+# 事件 key 末尾的行 ID，例如：-WECHAT_SENDALL_1-
+_TRAILING_INDEX = re.compile(r"_(\d+)-$")
+# API 类型的界面显示名称与配置键不一致时的映射
+_API_DISPLAY_TO_KEY = {"硅基流动": "SiliconFlow"}
+_API_KEY_TO_DISPLAY = {key: display for display, key in _API_DISPLAY_TO_KEY.items()}
+# 中文逗号统一为英文逗号，列表输入只需按 "," 切分
+_COMMA_TABLE = str.maketrans({"，": ","})
+
+
+def _split_list_input(text):
+    """按中英文逗号切分列表输入，去除空白项"""
+    return [item for item in map(str.strip, text.translate(_COMMA_TABLE).split(",")) if item]
+
+
+def _to_int(value, default=None):
+    """将输入框的值转换为整数，无法转换时返回 default"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# 维度下拉框中的"自动选择"与"自定义"选项
+_AUTO_OPTION = "自动选择"
+_CUSTOM_OPTION = "自定义"
+
+# 维度化创意的可用维度分类与优先分类（固定不变）
+_AVAILABLE_CATEGORIES = (
+    "style",  # 文体风格
+    "culture",  # 文化视角
+    "time",  # 时空背景
+    "personality",  # 人格角色
+    "emotion",  # 情感调性
+    "format",  # 表达格式
+    "scene",  # 场景环境
+    "audience",  # 目标受众
+    "theme",  # 主题内容
+    "technique",  # 表现技法
+    "language",  # 语言风格
+    "tone",  # 语调语气
+    "perspective",  # 叙述视角
+    "structure",  # 文章结构
+    "rhythm",  # 节奏韵律
+)
+_PRIORITY_CATEGORIES = ("emotion", "audience", "style", "theme")
+
+# 后台保存请求：待合并的顶层配置项、AIForge 配置、成功提示及成功后在界面线程执行的回调
+_SaveRequest = namedtuple("_SaveRequest", "partial aiforge_config message on_success")
+# 窗口关闭时放入保存队列，通知后台保存线程处理完积压请求后退出
+_SAVE_STOP = object()
+# 有保存请求未完成时，主循环读取事件的超时（毫秒），超时后取回后台保存结果
+_SAVE_POLL_MS = 50
+
+# 单个创意维度的控件 key：启用勾选框、选项下拉框、自定义输入框
+_DimensionKeys = namedtuple("_DimensionKeys", "enabled combo custom")
+
+# 常用的控件尺寸/边距，各 TAB 构建（含重建）时复用，避免重复创建元组
+_SZ8 = (8, 1)
+_SZ10 = (10, 1)
+_SZ15 = (15, 1)
+_PAD_00 = ((0, 0), (0, 0))
+
 
 class ConfigEditor:
+    # 发布平台配置键与显示名称的映射
+    _PLATFORM_KEY_TO_NAME = {
+        "wechat": "微信公众号",
+        "xiaohongshu": "小红书",
+        "douyin": "抖音",
+        "toutiao": "今日头条",
+        "baijiahao": "百家号",
+        "zhihu": "知乎",
+        "douban": "豆瓣",
+    }
+    _PLATFORM_NAME_TO_KEY = {name: key for key, name in _PLATFORM_KEY_TO_NAME.items()}
+    # 基础 TAB 中与配置项一一对应的控件：控件 key -> 配置项
+    _BASE_VALUE_WIDGETS = {
+        "-AUTO_PUBLISH-": "auto_publish",
+        "-ARTICLE_FORMAT-": "article_format",
+        "-FORMAT_PUBLISH-": "format_publish",
+        "-USE_COMPRESS-": "use_compress",
+        "-AIFORGE_SEARCH_MAX_RESULTS-": "aiforge_search_max_results",
+        "-AIFORGE_SEARCH_MIN_RESULTS-": "aiforge_search_min_results",
+        "-MIN_ARTICLE_LEN-": "min_article_len",
+        "-MAX_ARTICLE_LEN-": "max_article_len",
+    }
+    # 纵向字体的名称特征，这类字体不适合界面显示
+    _VERTICAL_FONT_PATTERNS = (
+        "@",  # 横向字体通常以@开头
+        "Vertical",  # 包含Vertical的字体
+        "V-",  # 以V-开头的字体
+        "縦",  # 日文中的纵向字体标识
+        "Vert",  # 其他可能的纵向标识
+    )
+
     def __init__(self):
         """初始化配置编辑器，使用单例配置"""
         sg.theme("systemdefault")
         self.config = Config.get_instance()
+        self._icon = utils.get_gui_icon()  # 图标只解析一次，所有弹窗复用
         self.platform_count = len(self.config.platforms)
         self.wechat_count = len(self.config.wechat_credentials)
+        self._wechat_keys = {}  # 凭证行 ID -> 该凭证各控件的 key
+        self._wechat_row_ids = []  # 当前显示的凭证行 ID（按显示顺序）
+        self._next_row_id = 0  # 单调递增，保证删除后控件 key 不复用
+        self._mac_clipboard_events = None  # 延迟构建，凭证/API 结构变化时失效
+        self._dimension_widgets = {}  # 维度键 -> (勾选框, 下拉框, 自定义输入框)
+        self._dim_option_index = {}  # 维度键 -> {选项显示文本: 预设选项}
+        self._dim_keys = {}  # 维度键 -> _DimensionKeys
+        self._dim_key_by_event = {}  # 维度下拉框的事件 key -> 维度键
+        self._last_dim_disabled = None  # 各维度控件当前的统一禁用状态
+        self._display_texts = {}  # 滑块数值显示控件 key -> 当前显示文本
+        self._api_tab_ids = {}  # API 子 TAB 标题 -> tab id
+        self._api_tab_titles = {}  # API 子 TAB 的 key -> 标题
+        self._api_saved_inputs = {}  # API 名称 -> 上次成功保存时的输入框内容
+        self._font_ok_cache = {}  # 字体名 -> 是否适合界面显示
+        self._is_template_empty = False  # 构建基础 TAB 时是否没有任何模板分类
         self.fonts = sg.Text.fonts_installed_list()
         # 应用字体过滤
         self.fonts = self._filter_fonts()
@@ -23,18 +139,36 @@ class ConfigEditor:
         if not self._validate_font_selection(self.global_font):
             self.global_font = "Helvetica"
 
+        # 除“基础”外的 TAB 延迟到首次选中时再构建，加快窗口首次显示
+        self._tab_builders = {
+            "-TAB_CREATIVE-": self.create_creative_tab,
+            "-TAB_PLATFORM-": self.create_platforms_tab,
+            "-TAB_WECHAT-": self.create_wechat_tab,
+            "-TAB_API-": self.create_api_tab,
+            "-TAB_IMG_API-": self.create_img_api_tab,
+            "-TAB_AIFORGE-": self.create_aiforge_tab,
+        }
+        self._tab_built = {tab_key: False for tab_key in self._tab_builders}
+
+        self._init_event_handlers()
+
         self.window = sg.Window(
             "AIWriteX - 配置管理",
             self.create_layout(),
             size=(500, 600),
             resizable=False,
             finalize=True,
-            icon=utils.get_gui_icon(),
+            icon=self._icon,
             keep_on_top=True,
         )
 
-        # 设置默认选中的API类型的TAB
-        self.__default_select_api_tab()
+        # 配置文件在后台线程写入，避免保存时阻塞界面
+        # 后台线程不调用任何 Tk 接口，保存结果放入结果队列，由界面线程取回处理
+        self._save_queue = queue.Queue()
+        self._save_results = queue.Queue()
+        self._saves_pending = 0  # 已提交但结果尚未处理的保存请求数（仅界面线程读写）
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
 
     def set_global_font(self, font_name, size=10):
         """设置全局字体"""
@@ -56,36 +190,20 @@ class ConfigEditor:
         if not hasattr(self, "fonts") or not self.fonts:
             return []
 
-        # 定义需要排除的字体模式
-        excluded_patterns = [
-            "@",  # 横向字体通常以@开头
-            "Vertical",  # 包含Vertical的字体
-            "V-",  # 以V-开头的字体
-            "縦",  # 日文中的纵向字体标识
-            "Vert",  # 其他可能的纵向标识
-        ]
-
         # 过滤字体列表
-        filtered_fonts = []
-        for font in self.fonts:
-            # 检查字体名称是否包含排除模式
-            should_exclude = any(pattern in font for pattern in excluded_patterns)
-            if not should_exclude:
-                filtered_fonts.append(font)
-
-        return filtered_fonts
+        return [font for font in self.fonts if self._validate_font_selection(font)]
 
     def _validate_font_selection(self, font_name):
         """验证字体选择是否合适"""
         if not font_name:
             return True
 
-        # 检查是否为横向字体
-        excluded_patterns = ["@", "Vertical", "V-", "縦", "Vert"]
-        if any(pattern in font_name for pattern in excluded_patterns):
-            return False
-
-        return True
+        ok = self._font_ok_cache.get(font_name)
+        if ok is None:
+            # 检查是否为横向字体
+            ok = not any(pattern in font_name for pattern in self._VERTICAL_FONT_PATTERNS)
+            self._font_ok_cache[font_name] = ok
+        return ok
 
     def create_platforms_tab(self):
         """创建平台 TAB 布局"""
@@ -121,73 +239,99 @@ class ConfigEditor:
         # 使用 sg.Column 包裹布局，设置 pad=(0, 0) 确保顶部无额外边距
         return [[sg.Column(layout, scrollable=False, vertical_scroll_only=False, pad=(0, 0))]]
 
+    def _build_wechat_credential_row(self, row_id, i, cred):
+        """
+        创建单个微信凭证的控件行，并缓存该凭证对应的控件 key
+
+        控件 key 使用稳定的行 ID（而非显示序号），删除凭证时只需隐藏该行，无需重建整个 TAB
+
+        Args:
+            row_id: 凭证行 ID
+            i: 凭证在列表中的显示序号
+            cred: 凭证配置
+
+        Returns:
+            包裹该凭证所有控件的单行布局
+        """
+        call_sendall = cred.get("call_sendall", False)
+        sendall = cred.get("sendall", False)
+        keys = (
+            f"-WECHAT_APPID_{row_id}-",
+            f"-WECHAT_SECRET_{row_id}-",
+            f"-WECHAT_AUTHOR_{row_id}-",
+            f"-WECHAT_CALL_SENDALL_{row_id}-",
+            f"-WECHAT_SENDALL_{row_id}-",
+            f"-WECHAT_TAG_ID_{row_id}-",
+        )
+        self._wechat_keys[row_id] = keys
+        appid_key, secret_key, author_key, call_sendall_key, sendall_key, tag_id_key = keys
+
+        rows = [
+            [sg.Text(f"凭证 {i+1}:", size=_SZ8, key=f"-WECHAT_TITLE_{row_id}-")],
+            [
+                sg.Text("AppID*:", size=_SZ8),
+                sg.InputText(
+                    cred["appid"],
+                    key=appid_key,
+                    size=(20, 1),
+                    enable_events=True,
+                ),
+                sg.Text("作者:", size=(4, 1)),
+                sg.InputText(cred["author"], key=author_key, size=(20, 1)),
+            ],
+            [
+                sg.Text("AppSecret*:", size=_SZ8),
+                sg.InputText(
+                    cred["appsecret"],
+                    key=secret_key,
+                    size=(49, 1),
+                    enable_events=True,
+                ),
+            ],
+            [
+                sg.Text("群发选项:", size=_SZ8, tooltip="仅对【已认证公众号】有效"),
+                sg.Checkbox(
+                    "启用群发",
+                    default=call_sendall,
+                    enable_events=True,
+                    key=call_sendall_key,
+                    tooltip="1. 启用群发，群发才有效\n2. 否则不启用，需要网页后台群发",
+                ),
+                sg.Checkbox(
+                    "群发",
+                    enable_events=True,
+                    default=sendall,
+                    disabled=not call_sendall,
+                    key=sendall_key,
+                    tooltip="1. 认证号群发数量有限，群发可控\n2. 非认证号，此选项无效（不支持群发）",
+                ),
+                sg.Text("标签组ID:", size=_SZ8),
+                sg.InputText(
+                    cred.get("tag_id", 0),
+                    key=tag_id_key,
+                    size=_SZ15,
+                    disabled=not call_sendall or sendall,
+                    tooltip="1. 群发时不用填写（填写无效）\n2. 不群发时，必须填写标签组ID",
+                ),
+            ],
+            [sg.Button("删除", key=f"-DELETE_WECHAT_{row_id}-", disabled=i == 0)],
+            [sg.HorizontalSeparator()],
+        ]
+        return [sg.Column(rows, key=f"-WECHAT_ROW_{row_id}-", pad=(0, 0))]
+
     def create_wechat_tab(self):
         """创建微信 TAB 布局 (垂直排列，标签固定宽度对齐，支持滚动)"""
         credentials = self.config.wechat_credentials
         self.wechat_count = len(credentials)
-        label_width = 8
+        self._wechat_keys = {}
+        self._wechat_row_ids = []
+        self._invalidate_mac_clipboard_cache()
         wechat_rows = []
         for i, cred in enumerate(credentials):
-            call_sendall = cred.get("call_sendall", False)
-            sendall = cred.get("sendall", False)
-
-            wechat_rows.append(
-                [sg.Text(f"凭证 {i+1}:", size=(label_width, 1), key=f"-WECHAT_TITLE_{i}-")]
-            )
-            wechat_rows.append(
-                [
-                    sg.Text("AppID*:", size=(label_width, 1)),
-                    sg.InputText(
-                        cred["appid"],
-                        key=f"-WECHAT_APPID_{i}-",
-                        size=(20, 1),
-                        enable_events=True,
-                    ),
-                    sg.Text("作者:", size=(4, 1)),
-                    sg.InputText(cred["author"], key=f"-WECHAT_AUTHOR_{i}-", size=(20, 1)),
-                ]
-            )
-            wechat_rows.append(
-                [
-                    sg.Text("AppSecret*:", size=(label_width, 1)),
-                    sg.InputText(
-                        cred["appsecret"],
-                        key=f"-WECHAT_SECRET_{i}-",
-                        size=(49, 1),
-                        enable_events=True,
-                    ),
-                ]
-            )
-            wechat_rows.append(
-                [
-                    sg.Text("群发选项:", size=(label_width, 1), tooltip="仅对【已认证公众号】有效"),
-                    sg.Checkbox(
-                        "启用群发",
-                        default=call_sendall,
-                        enable_events=True,
-                        key=f"-WECHAT_CALL_SENDALL_{i}-",
-                        tooltip="1. 启用群发，群发才有效\n2. 否则不启用，需要网页后台群发",
-                    ),
-                    sg.Checkbox(
-                        "群发",
-                        enable_events=True,
-                        default=sendall,
-                        disabled=not call_sendall,
-                        key=f"-WECHAT_SENDALL_{i}-",
-                        tooltip="1. 认证号群发数量有限，群发可控\n2. 非认证号，此选项无效（不支持群发）",
-                    ),
-                    sg.Text("标签组ID:", size=(label_width, 1)),
-                    sg.InputText(
-                        cred.get("tag_id", 0),
-                        key=f"-WECHAT_TAG_ID_{i}-",
-                        size=(15, 1),
-                        disabled=not call_sendall or sendall,
-                        tooltip="1. 群发时不用填写（填写无效）\n2. 不群发时，必须填写标签组ID",
-                    ),
-                ]
-            )
-            wechat_rows.append([sg.Button("删除", key=f"-DELETE_WECHAT_{i}-", disabled=i == 0)])
-            wechat_rows.append([sg.HorizontalSeparator()])
+            row_id = self._next_row_id
+            self._next_row_id += 1
+            self._wechat_row_ids.append(row_id)
+            wechat_rows.append(self._build_wechat_credential_row(row_id, i, cred))
 
         layout = [
             [sg.Text("微信公众号凭证")],
@@ -221,29 +365,29 @@ class ConfigEditor:
         layout = [
             [sg.Text(f"{api_name.upper()} 配置")],
             [
-                sg.Text("KEY名称:", size=(15, 1)),
+                sg.Text("KEY名称:", size=_SZ15),
                 sg.InputText(api_data["key"], key=f"-{api_name}_KEY-", disabled=True),
             ],
             [
-                sg.Text("API BASE:", size=(15, 1)),
+                sg.Text("API BASE:", size=_SZ15),
                 sg.InputText(api_data["api_base"], key=f"-{api_name}_API_BASE-", disabled=True),
             ],
             [
-                sg.Text("KEY索引*:", size=(15, 1)),
+                sg.Text("KEY索引*:", size=_SZ15),
                 sg.InputText(api_data["key_index"], key=f"-{api_name}_KEY_INDEX-"),
             ],
             [
-                sg.Text("API KEY*:", size=(15, 1)),
+                sg.Text("API KEY*:", size=_SZ15),
                 sg.InputText(
                     ", ".join(api_data["api_key"]), key=f"-{api_name}_API_KEYS-", enable_events=True
                 ),
             ],
             [
-                sg.Text("模型索引*:", size=(15, 1)),
+                sg.Text("模型索引*:", size=_SZ15),
                 sg.InputText(api_data["model_index"], key=f"-{api_name}_MODEL_INDEX-"),
             ],
             [
-                sg.Text("模型*:", size=(15, 1)),
+                sg.Text("模型*:", size=_SZ15),
                 sg.InputText(", ".join(api_data["model"]), key=f"-{api_name}_MODEL-"),
             ],
             [
@@ -266,27 +410,28 @@ class ConfigEditor:
         api_type = api_data["api_type"]
 
         # 转换为显示名称
-        if api_type == "SiliconFlow":
-            target_tab_text = "硅基流动"
-        else:
-            target_tab_text = api_type
+        target_tab_text = _API_KEY_TO_DISPLAY.get(api_type, api_type)
 
+        # API TAB 构建/重建后，重新建立子 TAB 标题到 tab id 的映射
         tab_group = self.window["-API_TAB_GROUP-"]
-        for tab in tab_group.Widget.tabs():  # type: ignore
-            tab_text = tab_group.Widget.tab(tab, "text")  # type: ignore
-            if tab_text == target_tab_text:
-                tab_group.Widget.select(tab)  # type: ignore
-                break
+        self._api_tab_ids = {
+            tab_group.Widget.tab(tab, "text"): tab  # type: ignore
+            for tab in tab_group.Widget.tabs()  # type: ignore
+        }
+        # 子 TAB 未指定 key，PySimpleGUI 以标题作为 key，重名时会追加序号
+        self._api_tab_titles = {tab.Key: tab.Title for row in tab_group.Rows for tab in row}
+        tab_id = self._api_tab_ids.get(target_tab_text)
+        if tab_id:
+            tab_group.Widget.select(tab_id)  # type: ignore
         self.window.refresh()
 
     def create_api_tab(self):
         """创建 API TAB 布局"""
         api_data = self.config.get_config()["api"]
+        self._invalidate_mac_clipboard_cache()
+        self._api_saved_inputs = {}
         current_api_type = api_data["api_type"]
-        if current_api_type == "SiliconFlow":
-            display_api_type = "硅基流动"
-        else:
-            display_api_type = current_api_type
+        display_api_type = _API_KEY_TO_DISPLAY.get(current_api_type, current_api_type)
 
         layout = [
             [
@@ -344,7 +489,7 @@ class ConfigEditor:
         # API类型配置区块
         api_type_layout = [
             [
-                sg.Text("API类型:", size=(15, 1), tooltip="选择图片生成API类型"),
+                sg.Text("API类型:", size=_SZ15, tooltip="选择图片生成API类型"),
                 sg.Combo(
                     ["picsum", "ali"],
                     default_value=img_api["api_type"],
@@ -359,7 +504,7 @@ class ConfigEditor:
         # 阿里API配置区块
         ali_layout = [
             [
-                sg.Text("API KEY:", size=(15, 1), tooltip="阿里云通义万相API密钥"),
+                sg.Text("API KEY:", size=_SZ15, tooltip="阿里云通义万相API密钥"),
                 sg.InputText(
                     img_api["ali"]["api_key"],
                     key="-ALI_API_KEY-",
@@ -369,7 +514,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("模型:", size=(15, 1), tooltip="图片生成模型"),
+                sg.Text("模型:", size=_SZ15, tooltip="图片生成模型"),
                 sg.InputText(
                     img_api["ali"]["model"],
                     key="-ALI_MODEL-",
@@ -382,7 +527,7 @@ class ConfigEditor:
         # Picsum API配置区块
         picsum_layout = [
             [
-                sg.Text("API KEY:", size=(15, 1), tooltip="Picsum API密钥（免费服务无需配置）"),
+                sg.Text("API KEY:", size=_SZ15, tooltip="Picsum API密钥（免费服务无需配置）"),
                 sg.InputText(
                     img_api["picsum"]["api_key"],
                     key="-PICSUM_API_KEY-",
@@ -392,7 +537,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("模型:", size=(15, 1), tooltip="Picsum模型（免费服务无需配置）"),
+                sg.Text("模型:", size=_SZ15, tooltip="Picsum模型（免费服务无需配置）"),
                 sg.InputText(
                     img_api["picsum"]["model"],
                     key="-PICSUM_MODEL-",
@@ -490,6 +635,7 @@ class ConfigEditor:
 
         # 检查是否有模板
         is_template_empty = len(categories) == 0
+        self._is_template_empty = is_template_empty
 
         if self.global_font:
             # 从保存的字体字符串中提取字体名称
@@ -543,19 +689,19 @@ class ConfigEditor:
         # 发布配置区块
         publish_layout = [
             [
-                sg.Text("发布平台：", size=(15, 1), tooltip="选择内容发布的目标平台"),
+                sg.Text("发布平台：", size=_SZ15, tooltip="选择内容发布的目标平台"),
                 sg.Combo(
-                    ["微信公众号", "小红书", "抖音", "今日头条", "百家号", "知乎", "豆瓣"],
+                    list(self._PLATFORM_KEY_TO_NAME.values()),
                     default_value=self._get_platform_display_name(self.config.publish_platform),
                     key="-PUBLISH_PLATFORM-",
-                    size=(15, 1),
+                    size=_SZ15,
                     readonly=True,
                     tooltip="选择内容发布的目标平台",
                     disabled=True,
                 ),
             ],
             [
-                sg.Text("文章发布：", size=(15, 1), tooltip=tips["auto_publish"]),
+                sg.Text("文章发布：", size=_SZ15, tooltip=tips["auto_publish"]),
                 sg.Checkbox(
                     "自动发布",
                     default=self.config.auto_publish,
@@ -564,7 +710,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("文章格式：", size=(15, 1), tooltip=tips["article_format"]),
+                sg.Text("文章格式：", size=_SZ15, tooltip=tips["article_format"]),
                 sg.Combo(
                     ["html", "markdown", "txt"],
                     default_value=self.config.article_format,
@@ -627,7 +773,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("模板压缩：", size=(15, 1), tooltip=tips["use_compress"]),
+                sg.Text("模板压缩：", size=_SZ15, tooltip=tips["use_compress"]),
                 sg.Checkbox(
                     "压缩模板",
                     default=self.config.use_compress,
@@ -640,34 +786,34 @@ class ConfigEditor:
         # 生成配置区块
         generation_layout = [
             [
-                sg.Text("最大搜索数量：", size=(15, 1), tooltip=tips["aiforge_search_max_results"]),
+                sg.Text("最大搜索数量：", size=_SZ15, tooltip=tips["aiforge_search_max_results"]),
                 sg.InputText(
                     self.config.aiforge_search_max_results,
                     key="-AIFORGE_SEARCH_MAX_RESULTS-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip=tips["aiforge_search_max_results"],
                 ),
-                sg.Text("最小搜索数量：", size=(15, 1), tooltip=tips["aiforge_search_min_results"]),
+                sg.Text("最小搜索数量：", size=_SZ15, tooltip=tips["aiforge_search_min_results"]),
                 sg.InputText(
                     self.config.aiforge_search_min_results,
                     key="-AIFORGE_SEARCH_MIN_RESULTS-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip=tips["aiforge_search_min_results"],
                 ),
             ],
             [
-                sg.Text("最小文章字数：", size=(15, 1), tooltip=tips["min_article_len"]),
+                sg.Text("最小文章字数：", size=_SZ15, tooltip=tips["min_article_len"]),
                 sg.InputText(
                     self.config.min_article_len,
                     key="-MIN_ARTICLE_LEN-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip=tips["min_article_len"],
                 ),
-                sg.Text("最大文章字数：", size=(15, 1), tooltip=tips["max_article_len"]),
+                sg.Text("最大文章字数：", size=_SZ15, tooltip=tips["max_article_len"]),
                 sg.InputText(
                     self.config.max_article_len,
                     key="-MAX_ARTICLE_LEN-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip=tips["max_article_len"],
                 ),
             ],
@@ -676,7 +822,7 @@ class ConfigEditor:
         # 界面配置区块
         ui_layout = [
             [
-                sg.Text("界面字体：", size=(15, 1), tooltip=tips["ui_font"]),
+                sg.Text("界面字体：", size=_SZ15, tooltip=tips["ui_font"]),
                 sg.Combo(
                     filtered_fonts,
                     default_value=font_default_value,
@@ -781,7 +927,7 @@ class ConfigEditor:
         # 通用配置区块
         general_layout = [
             [
-                sg.Text("语言:", size=(15, 1), tooltip="AIForge使用的语言"),
+                sg.Text("语言:", size=_SZ15, tooltip="AIForge使用的语言"),
                 sg.InputText(
                     "中文",
                     key="-AIFORGE_LOCALE-",
@@ -791,14 +937,14 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("最大重试次数:", size=(15, 1)),
+                sg.Text("最大重试次数:", size=_SZ15),
                 sg.InputText(
                     aiforge_config["max_rounds"],
                     key="-AIFORGE_MAXROUNDS-",
                     size=(11, 1),
                     tooltip="代码生成最大重试次数",
                 ),
-                sg.Text("默认最大Tokens:", size=(15, 1)),
+                sg.Text("默认最大Tokens:", size=_SZ15),
                 sg.InputText(
                     aiforge_config.get("max_tokens", 4096),
                     key="-AIFORGE_DEFAULT_MAX_TOKENS-",
@@ -811,26 +957,26 @@ class ConfigEditor:
         # LLM提供商配置区块
         llm_layout = [
             [
-                sg.Text("模型提供商*:", size=(15, 1)),
+                sg.Text("模型提供商*:", size=_SZ15),
                 sg.Combo(
                     llm_providers,
                     default_value=default_provider,
                     key="-AIFORGE_DEFAULT_LLM_PROVIDER-",
-                    size=(15, 1),
+                    size=_SZ15,
                     readonly=True,
                     enable_events=True,
                     tooltip="AIForge使用的LLM 提供商",
                 ),
-                sg.Text("类型:", size=(10, 1)),
+                sg.Text("类型:", size=_SZ10),
                 sg.InputText(
                     provider_config.get("type", ""),
                     key="-AIFORGE_TYPE-",
-                    size=(15, 1),
+                    size=_SZ15,
                     disabled=True,  # 类型通常不可编辑
                 ),
             ],
             [
-                sg.Text("模型*:", size=(15, 1)),
+                sg.Text("模型*:", size=_SZ15),
                 sg.InputText(
                     provider_config.get("model", ""),
                     key="-AIFORGE_MODEL-",
@@ -839,7 +985,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("API KEY*:", size=(15, 1)),
+                sg.Text("API KEY*:", size=_SZ15),
                 sg.InputText(
                     provider_config.get("api_key", ""),
                     key="-AIFORGE_API_KEY-",
@@ -850,7 +996,7 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("Base URL*:", size=(15, 1)),
+                sg.Text("Base URL*:", size=_SZ15),
                 sg.InputText(
                     provider_config.get("base_url", ""),
                     key="-AIFORGE_BASE_URL-",
@@ -859,14 +1005,14 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("超时时间 (秒):", size=(15, 1)),
+                sg.Text("超时时间 (秒):", size=_SZ15),
                 sg.InputText(
                     provider_config.get("timeout", 30),
                     key="-AIFORGE_TIMEOUT-",
                     size=(11, 1),
                     tooltip="API请求的超时时间（秒）",
                 ),
-                sg.Text("最大 Tokens:", size=(15, 1)),
+                sg.Text("最大 Tokens:", size=_SZ15),
                 sg.InputText(
                     provider_config.get("max_tokens", 8192),
                     key="-AIFORGE_MAX_TOKENS-",
@@ -880,7 +1026,7 @@ class ConfigEditor:
         cache_config = aiforge_config.get("cache", {}).get("code", {})
         cache_layout = [
             [
-                sg.Text("启用缓存:", size=(15, 1)),
+                sg.Text("启用缓存:", size=_SZ15),
                 sg.Checkbox(
                     "",
                     default=cache_config.get("enabled", True),
@@ -889,34 +1035,34 @@ class ConfigEditor:
                 ),
             ],
             [
-                sg.Text("最大模块数:", size=(15, 1)),
+                sg.Text("最大模块数:", size=_SZ15),
                 sg.InputText(
                     cache_config.get("max_modules", 20),
                     key="-CACHE_MAX_MODULES-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip="缓存中保存的最大模块数量",
                 ),
-                sg.Text("失败阈值:", size=(10, 1)),
+                sg.Text("失败阈值:", size=_SZ10),
                 sg.InputText(
                     cache_config.get("failure_threshold", 0.8),
                     key="-CACHE_FAILURE_THRESHOLD-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip="缓存失败率阈值（0.0-1.0）",
                 ),
             ],
             [
-                sg.Text("最大保存天数:", size=(15, 1)),
+                sg.Text("最大保存天数:", size=_SZ15),
                 sg.InputText(
                     cache_config.get("max_age_days", 30),
                     key="-CACHE_MAX_AGE_DAYS-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip="缓存数据的最大保存天数",
                 ),
-                sg.Text("清理间隔 (分钟):", size=(15, 1)),
+                sg.Text("清理间隔 (分钟):", size=_SZ15),
                 sg.InputText(
                     cache_config.get("cleanup_interval", 10),
                     key="-CACHE_CLEANUP_INTERVAL-",
-                    size=(10, 1),
+                    size=_SZ10,
                     tooltip="自动清理缓存的时间间隔（分钟）",
                 ),
             ],
@@ -988,89 +1134,106 @@ class ConfigEditor:
 
         # 获取维度选项配置
         dimension_options = dimensional_config.get("dimension_options", {})
+        enabled_dimensions = dimensional_config.get("enabled_dimensions", {})
+
+        # 总开关与自动选择状态在各维度行中反复使用，只读取一次
+        dim_enabled = dimensional_config.get("enabled", True)
+        auto_select = dimensional_config.get("auto_dimension_selection", False)
+        dim_disabled = not dim_enabled or auto_select
 
         # 创建维度选择控件
         dimension_controls = []
+        self._dimension_widgets = {}
+        self._dim_option_index = {}
+        self._dim_keys = {}
+        self._dim_key_by_event = {}
+        self._last_dim_disabled = dim_disabled
+        intensity_text = f"{dimensional_config.get('creative_intensity', 1.0):.1f}"
+        threshold_text = f"{dimensional_config.get('compatibility_threshold', 0.6):.1f}"
+        self._display_texts = {
+            "-INTENSITY_DISPLAY-": intensity_text,
+            "-THRESHOLD_DISPLAY-": threshold_text,
+        }
 
         # 为每个维度创建选择控件（使用勾选框+下拉选项框的设计）
         for dimension_key, dimension_data in dimension_options.items():
             dimension_name = dimension_data.get("name", dimension_key)
+            up = dimension_key.upper()
+            dim_keys = _DimensionKeys(
+                f"-DIMENSION_ENABLED_{up}-", f"-DIMENSION_{up}-", f"-DIMENSION_{up}_CUSTOM-"
+            )
+            self._dim_keys[dimension_key] = dim_keys
+            self._dim_key_by_event[dim_keys.combo] = dimension_key
             preset_options = dimension_data.get("preset_options", [])
 
-            # 创建选项列表，格式为 "显示名称 (描述)"
-            option_list = ["自动选择"]
+            # 创建选项列表，格式为 "显示名称 (描述)"，同时建立显示文本与选项的双向索引
+            display_to_option = {}
+            name_to_display = {}
             for option in preset_options:
                 display_text = f"{option['value']} ({option['description']})"
-                option_list.append(display_text)
+                display_to_option[display_text] = option
+                name_to_display[option["name"]] = display_text
+            self._dim_option_index[dimension_key] = display_to_option
 
-            # 添加自定义选项
-            option_list.append("自定义")
+            # 添加自动选择、自定义选项
+            option_list = [_AUTO_OPTION, *display_to_option, _CUSTOM_OPTION]
 
             # 获取当前选中的选项
             selected_option = dimension_data.get("selected_option", "")
-            selected_display = "自动选择"
+            selected_display = _AUTO_OPTION
 
             # 查找匹配的选项显示文本
             if selected_option:
                 # 检查是否为自定义选项
                 if selected_option == "custom":
-                    selected_display = "自定义"
+                    selected_display = _CUSTOM_OPTION
                 else:
-                    for option in preset_options:
-                        if option["name"] == selected_option:
-                            selected_display = f"{option['value']} ({option['description']})"
-                            break
+                    selected_display = name_to_display.get(selected_option, _AUTO_OPTION)
 
             # 获取自定义输入值
             custom_input = dimension_data.get("custom_input", "")
 
             # 检查该维度是否启用（需要从配置中获取，如果没有则默认启用）
-            enabled_dimensions = dimensional_config.get("enabled_dimensions", {})
             dimension_enabled = enabled_dimensions.get(dimension_key, True)
 
             # 创建该维度的控件行
-            dimension_controls.extend(
+            checkbox = sg.Checkbox(
+                "",
+                default=dimension_enabled,
+                key=dim_keys.enabled,
+                enable_events=True,
+                tooltip=f"启用{dimension_name}维度",
+                size=(1, 1),
+                pad=_PAD_00,
+                disabled=dim_disabled,
+            )
+            combo = sg.Combo(
+                option_list,
+                default_value=selected_display,
+                key=dim_keys.combo,
+                size=(25, 1),
+                readonly=True,
+                tooltip=f"选择{dimension_name}",
+                disabled=dim_disabled,
+                enable_events=True,  # 启用事件处理
+            )
+            custom = sg.InputText(
+                custom_input,
+                key=dim_keys.custom,
+                size=(20, 1),
+                tooltip=f"自定义{dimension_name}输入",
+                disabled=(
+                    not dim_enabled or not dimension_enabled or selected_display != _CUSTOM_OPTION
+                ),
+            )
+            # 缓存控件引用，切换启用状态时无需再经 window[key] 查找
+            self._dimension_widgets[dimension_key] = (checkbox, combo, custom)
+            dimension_controls.append(
                 [
-                    [
-                        sg.Checkbox(
-                            "",
-                            default=dimension_enabled,
-                            key=f"-DIMENSION_ENABLED_{dimension_key.upper()}-",
-                            enable_events=True,
-                            tooltip=f"启用{dimension_name}维度",
-                            size=(1, 1),
-                            pad=((0, 0), (0, 0)),
-                            disabled=(  # 添加禁用逻辑
-                                not dimensional_config.get("enabled", True)
-                                or dimensional_config.get("auto_dimension_selection", False)
-                            ),
-                        ),
-                        sg.Text(f"{dimension_name}:", size=(8, 1), pad=((0, 0), (0, 0))),
-                        sg.Combo(
-                            option_list,
-                            default_value=selected_display,
-                            key=f"-DIMENSION_{dimension_key.upper()}-",
-                            size=(25, 1),
-                            readonly=True,
-                            tooltip=f"选择{dimension_name}",
-                            disabled=(
-                                not dimensional_config.get("enabled", True)
-                                or dimensional_config.get("auto_dimension_selection", False)
-                            ),
-                            enable_events=True,  # 启用事件处理
-                        ),
-                        sg.InputText(
-                            custom_input,
-                            key=f"-DIMENSION_{dimension_key.upper()}_CUSTOM-",
-                            size=(20, 1),
-                            tooltip=f"自定义{dimension_name}输入",
-                            disabled=(
-                                not dimensional_config.get("enabled", True)
-                                or not dimension_enabled
-                                or selected_display != "自定义"
-                            ),
-                        ),
-                    ]
+                    checkbox,
+                    sg.Text(f"{dimension_name}:", size=(8, 1), pad=_PAD_00),
+                    combo,
+                    custom,
                 ]
             )
 
@@ -1080,7 +1243,7 @@ class ConfigEditor:
             [
                 sg.Checkbox(
                     "",
-                    default=dimensional_config.get("enabled", True),
+                    default=dim_enabled,
                     key="-DIMENSIONAL_CREATIVE_ENABLED-",
                     enable_events=True,
                     tooltip="启用维度化创意",
@@ -1095,12 +1258,12 @@ class ConfigEditor:
                     orientation="h",
                     key="-CREATIVE_INTENSITY-",
                     size=(15, 15),
-                    disabled=not dimensional_config.get("enabled", True),
+                    disabled=not dim_enabled,
                     tooltip="创意强度（0.7-1.5）",
                     pad=((0, 8), (0, 0)),
                 ),
                 sg.Text(
-                    f"{dimensional_config.get('creative_intensity', 1.0):.1f}",
+                    intensity_text,
                     key="-INTENSITY_DISPLAY-",
                     size=(4, 1),
                     pad=((0, 3), (0, 0)),
@@ -1112,7 +1275,7 @@ class ConfigEditor:
                     "保持核心信息",
                     default=dimensional_config.get("preserve_core_info", True),
                     key="-PRESERVE_CORE_INFO-",
-                    disabled=not dimensional_config.get("enabled", True),
+                    disabled=not dim_enabled,
                     tooltip="在创意变换中保持文章核心信息不变",
                     pad=((0, 10), (0, 0)),
                 ),
@@ -1120,7 +1283,7 @@ class ConfigEditor:
                     "允许实验性组合",
                     default=dimensional_config.get("allow_experimental", False),
                     key="-ALLOW_EXPERIMENTAL-",
-                    disabled=not dimensional_config.get("enabled", True),
+                    disabled=not dim_enabled,
                     tooltip="允许使用实验性的维度组合",
                     pad=((0, 3), (0, 0)),
                 ),
@@ -1129,28 +1292,27 @@ class ConfigEditor:
                 sg.Text("", size=(2, 1)),  # 空白占位符
                 sg.Checkbox(
                     "自动选择维度",
-                    default=dimensional_config.get("auto_dimension_selection", False),
+                    default=auto_select,
                     key="-AUTO_DIMENSION_SELECTION-",
                     enable_events=True,
-                    disabled=not dimensional_config.get("enabled", True),
+                    disabled=not dim_enabled,
                     tooltip="自动选择最适合的维度组合",
                     pad=((0, 3), (0, 0)),
                 ),
             ],
             [
                 sg.Text("", size=(2, 1)),  # 空白占位符
-                sg.Text("最大维度数:", size=(10, 1), pad=((0, 5), (0, 0))),
+                sg.Text("最大维度数:", size=_SZ10, pad=((0, 5), (0, 0))),
                 sg.Spin(
                     values=list(range(0, 11)),
                     initial_value=dimensional_config.get("max_dimensions", 0),
                     key="-MAX_DIMENSIONS-",
                     size=(5, 1),
-                    disabled=not dimensional_config.get("enabled", True)
-                    or not dimensional_config.get("auto_dimension_selection", False),
+                    disabled=not dim_enabled or not auto_select,
                     tooltip="同时应用的维度最大数量",
                     pad=((0, 10), (0, 0)),
                 ),
-                sg.Text("兼容性阈值:", size=(10, 1), pad=((0, 5), (0, 0))),
+                sg.Text("兼容性阈值:", size=_SZ10, pad=((0, 5), (0, 0))),
                 sg.Slider(
                     range=(0.0, 1.0),
                     default_value=dimensional_config.get("compatibility_threshold", 0.6),
@@ -1158,13 +1320,12 @@ class ConfigEditor:
                     orientation="h",
                     key="-COMPATIBILITY_THRESHOLD-",
                     size=(10, 15),
-                    disabled=not dimensional_config.get("enabled", True)
-                    or not dimensional_config.get("auto_dimension_selection", False),
+                    disabled=not dim_enabled or not auto_select,
                     tooltip="维度组合兼容性阈值（0.0-1.0）",
                     pad=((0, 3), (0, 0)),
                 ),
                 sg.Text(
-                    f"{dimensional_config.get('compatibility_threshold', 0.6):.1f}",
+                    threshold_text,
                     key="-THRESHOLD_DISPLAY-",
                     size=(4, 1),
                     pad=((0, 3), (0, 0)),
@@ -1213,47 +1374,96 @@ class ConfigEditor:
             ]
         ]
 
+    def create_placeholder_tab(self, tab_key):
+        """创建延迟构建 TAB 的占位布局，首次选中时由 ensure_tab_built 替换"""
+        return [[sg.Column([[sg.Text("加载中...")]], key=f"{tab_key}_PLACEHOLDER")]]
+
     def create_layout(self):
-        """创建主布局"""
+        """创建主布局（仅基础 TAB 立即构建，其余 TAB 使用占位布局）"""
         return [
             [
                 sg.TabGroup(
                     [
                         [sg.Tab("基础", self.create_base_tab(), key="-TAB_BASE-")],
-                        [sg.Tab("创意", self.create_creative_tab(), key="-TAB_CREATIVE-")],
-                        [sg.Tab("热搜平台", self.create_platforms_tab(), key="-TAB_PLATFORM-")],
-                        [sg.Tab("微信公众号*", self.create_wechat_tab(), key="-TAB_WECHAT-")],
-                        [sg.Tab("大模型API*", self.create_api_tab(), key="-TAB_API-")],
-                        [sg.Tab("图片生成API", self.create_img_api_tab(), key="-TAB_IMG_API-")],
-                        [sg.Tab("AIForge", self.create_aiforge_tab(), key="-TAB_AIFORGE-")],
+                        [
+                            sg.Tab(
+                                "创意",
+                                self.create_placeholder_tab("-TAB_CREATIVE-"),
+                                key="-TAB_CREATIVE-",
+                            )
+                        ],
+                        [
+                            sg.Tab(
+                                "热搜平台",
+                                self.create_placeholder_tab("-TAB_PLATFORM-"),
+                                key="-TAB_PLATFORM-",
+                            )
+                        ],
+                        [
+                            sg.Tab(
+                                "微信公众号*",
+                                self.create_placeholder_tab("-TAB_WECHAT-"),
+                                key="-TAB_WECHAT-",
+                            )
+                        ],
+                        [
+                            sg.Tab(
+                                "大模型API*",
+                                self.create_placeholder_tab("-TAB_API-"),
+                                key="-TAB_API-",
+                            )
+                        ],
+                        [
+                            sg.Tab(
+                                "图片生成API",
+                                self.create_placeholder_tab("-TAB_IMG_API-"),
+                                key="-TAB_IMG_API-",
+                            )
+                        ],
+                        [
+                            sg.Tab(
+                                "AIForge",
+                                self.create_placeholder_tab("-TAB_AIFORGE-"),
+                                key="-TAB_AIFORGE-",
+                            )
+                        ],
                     ],
                     key="-TAB_GROUP-",
+                    enable_events=True,
                 )
             ],
         ]
 
+    def ensure_tab_built(self, tab_key):
+        """首次选中 TAB 时构建其内容，已构建的 TAB 直接跳过"""
+        if self._tab_built.get(tab_key, True):
+            return
+        self.update_tab(tab_key, self._tab_builders[tab_key]())
+        self._tab_built[tab_key] = True
+        if tab_key == "-TAB_API-":
+            # 设置默认选中的API类型的TAB
+            self.__default_select_api_tab()
+
     def clear_tab(self, tab):
         """清空指定 tab 的内容，并清理相关的 key，但不清理 Tab 本身的 key"""
         tab_widget = tab.Widget
         tab_key = tab.Key  # 获取 Tab 本身的 key，例如 "-TAB_PLATFORM-"
+        # 一次性收集 tab 内所有 tkinter 控件的 id
+        tab_widget_ids = set()
+        pending = [tab_widget]
+        while pending:
+            widget = pending.pop()
+            tab_widget_ids.add(id(widget))
+            pending.extend(widget.winfo_children())
+
         # 收集 tab 内的所有 key，但排除 Tab 本身的 key
-        keys_to_remove = []
-        # 遍历 window 的 key_dict，检查哪些 key 属于当前 tab
-        for key, element in list(self.window.key_dict.items()):  # 使用 list 避免运行时修改字典
-            if key == tab_key:  # 跳过 Tab 本身的 key
-                continue
-            if hasattr(element, "Widget") and element.Widget:
-                try:
-                    # 获取元素所在的父容器
-                    parent = element.Widget
-                    # 向上遍历父容器，直到找到顶层容器
-                    while parent:
-                        if parent == tab_widget:
-                            keys_to_remove.append(key)
-                            break
-                        parent = parent.master  # 继续向上查找父容器
-                except Exception as e:  # noqa 841
-                    continue
+        keys_to_remove = [
+            key
+            for key, element in self.window.key_dict.items()
+            if key != tab_key
+            and getattr(element, "Widget", None) is not None
+            and id(element.Widget) in tab_widget_ids
+        ]
 
         # 从 window 的 key_dict 中移除这些 key
         for key in keys_to_remove:
@@ -1269,18 +1479,35 @@ class ConfigEditor:
         # 清空现有内容
         tab = self.window[tab_key]
         self.clear_tab(tab)
-        # 直接使用 new_layout（已经是 [[sg.Column(...)]]
-        self.window.extend_layout(self.window[tab_key], new_layout)
-        # 强制刷新布局，确保内容正确渲染
+        # 构建期间关闭 tab 的几何传播，避免每添加一行都触发整窗重新布局
+        tab.Widget.pack_propagate(False)
+        try:
+            # 直接使用 new_layout（已经是 [[sg.Column(...)]]
+            self.window.extend_layout(tab, new_layout)
+        finally:
+            tab.Widget.pack_propagate(True)
+        # 构建完成后统一刷新一次布局，确保内容正确渲染
         self.window.refresh()
 
+    def _invalidate_mac_clipboard_cache(self):
+        """凭证增删或 API 列表变化后，使剪贴板事件集合失效"""
+        self._mac_clipboard_events = None
+
     def get_mac_clipboard_events(self):
-        """获取需要适配macOS剪贴板问题的输入框事件列表"""
+        """获取需要适配macOS剪贴板问题的输入框事件集合（缓存至结构变化）"""
+        if self._mac_clipboard_events is not None:
+            return self._mac_clipboard_events
+
+        # 非 macOS 无需处理
+        if not _IS_MAC:
+            self._mac_clipboard_events = frozenset()
+            return self._mac_clipboard_events
+
         mac_clipboard_events = []
 
-        # 微信凭证 - 根据实际数量动态生成
-        for i in range(self.wechat_count):
-            mac_clipboard_events.extend([f"-WECHAT_APPID_{i}-", f"-WECHAT_SECRET_{i}-"])
+        # 微信凭证 - 根据当前显示的凭证行动态生成
+        for row_id in self._wechat_row_ids:
+            mac_clipboard_events.extend(self._wechat_keys[row_id][:2])
 
         # 大模型API - 根据配置中实际存在的API提供商动态生成
         for api in self.config.api_list:
@@ -1289,1191 +1516,1043 @@ class ConfigEditor:
         # 图片API和AIForge
         mac_clipboard_events.extend(["-ALI_API_KEY-", "-AIFORGE_API_KEY-"])
 
-        return mac_clipboard_events
+        self._mac_clipboard_events = frozenset(mac_clipboard_events)
+        return self._mac_clipboard_events
 
-    def _get_platform_display_name(self, platform_key):
-        """获取平台的显示名称"""
-        platform_mapping = {
-            "wechat": "微信公众号",
-            "xiaohongshu": "小红书",
-            "douyin": "抖音",
-            "toutiao": "今日头条",
-            "baijiahao": "百家号",
-            "zhihu": "知乎",
-            "douban": "豆瓣",
-        }
-        return platform_mapping.get(platform_key, "微信公众号")
+    def _info(self, message):
+        """弹出普通提示"""
+        sg.popup(message, title="系统提示", icon=self._icon, keep_on_top=True)
 
-    def _get_platform_key(self, display_name):
-        """获取平台的配置键"""
-        display_mapping = {
-            "微信公众号": "wechat",
-            "小红书": "xiaohongshu",
-            "抖音": "douyin",
-            "今日头条": "toutiao",
-            "百家号": "baijiahao",
-            "知乎": "zhihu",
-            "豆瓣": "douban",
-        }
-        return display_mapping.get(display_name, "wechat")
-
-    def _collect_selected_dimensions(self, values, dimension_options):
-        """
-        收集用户选择的维度
+    def _err(self, message):
+        """弹出错误提示"""
+        sg.popup_error(message, title="系统提示", icon=self._icon, keep_on_top=True)
 
-        Args:
-            values: GUI中的值字典
-            dimension_options: 维度选项配置
+    def _save_async(self, partial, message, on_success=None, aiforge_config=None):
+        """提交后台保存请求，结果由主循环轮询取回后在界面线程处理"""
+        from copy import deepcopy
 
-        Returns:
-            选中的维度列表
-        """
-        selected_dimensions = []
+        # 只把深拷贝的快照交给后台线程，界面线程之后对配置的修改不会影响正在写入的内容
+        with self.config.locked():
+            partial = deepcopy(partial)
+            if aiforge_config is not None:
+                aiforge_config = deepcopy(aiforge_config)
+        self._saves_pending += 1
+        self._save_queue.put(_SaveRequest(partial, aiforge_config, message, on_success))
 
-        # 获取启用的维度
-        enabled_dimensions = {}
-        for dimension_key in dimension_options.keys():
-            enabled_state = values.get(f"-DIMENSION_ENABLED_{dimension_key.upper()}-", False)
-            enabled_dimensions[dimension_key] = enabled_state
+    def _save_worker(self):
+        """后台保存线程：合并积压的保存请求后只写一次文件，收到停止标记后退出"""
+        while True:
+            items = [self._save_queue.get()]
+            while True:
+                try:
+                    items.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            requests = [item for item in items if item is not _SAVE_STOP]
+            try:
+                ok, error = self._write_saves(requests) if requests else (True, None)
+            finally:
+                for _ in items:
+                    self._save_queue.task_done()
+
+            for request in requests:
+                self._save_results.put((request, ok, error))
+            if len(requests) != len(items):
+                return
+
+    def _write_saves(self, requests):
+        """合并多个保存请求写入配置文件，返回 (是否成功, 错误信息)"""
+        partial, aiforge_config = {}, None
+        for request in requests:
+            partial.update(request.partial)
+            if request.aiforge_config is not None:
+                aiforge_config = request.aiforge_config
 
-        # 收集每个启用维度的选择
-        for dimension_key, dimension_data in dimension_options.items():
-            # 检查维度是否启用
-            if enabled_dimensions.get(dimension_key, False):
-                # 获取选中的选项显示文本
-                selected_display = values.get(f"-DIMENSION_{dimension_key.upper()}-", "自动选择")
-
-                # 如果不是"自动选择"，则添加到选中维度列表
-                if selected_display != "自动选择":
-                    # 从显示文本中提取选项名称
-                    for option in dimension_data.get("preset_options", []):
-                        display_text = f"{option['value']} ({option['description']})"
-                        if display_text == selected_display:
-                            selected_dimensions.append(
-                                {"category": dimension_key, "option": option["name"]}
-                            )
-                            break
+        try:
+            ok = self.config.save_config_partial(partial, aiforge_config)
+            return ok, None if ok else self.config.error_message
+        except Exception as e:
+            return False, f"保存配置时发生错误: {e}"
 
-        return selected_dimensions
+    def _on_save_poll(self, event, values):
+        """读取超时时取回已完成的后台保存结果"""
+        self._handle_save_results()
 
-    def run(self):
+    def _handle_save_results(self, closing=False):
+        """处理已完成的保存：执行成功回调并提示结果；窗口关闭后只提示失败"""
         while True:
-            event, values = self.window.read()  # type: ignore
-            if event in (sg.WIN_CLOSED, "-EXIT-"):
-                break
-            # 在事件循环中使用
-            elif event in self.get_mac_clipboard_events():
-                if sys.platform == "darwin" and values[event]:
-                    fixed_value = utils.fix_mac_clipboard(values[event])
-                    if fixed_value != values[event]:  # 只有内容真正改变时才更新
-                        self.window[event].update(fixed_value)
-                        self.window.refresh()
-                        # 可选：重新设置焦点确保用户体验
-                        self.window[event].set_focus()
-            elif event == "-ARTICLE_FORMAT-":
-                if values["-ARTICLE_FORMAT-"] == "html":
-                    # HTML格式禁用格式化勾选框
-                    self.window["-FORMAT_PUBLISH-"].update(disabled=True)
-                else:
-                    # 其他格式（markdown, text）启用格式化勾选框
-                    self.window["-FORMAT_PUBLISH-"].update(disabled=False)
-
-            # 动态启用/禁用下拉列表
-            elif event == "-USE_TEMPLATE-":
-                is_enabled = values["-USE_TEMPLATE-"]
-                self.window["-TEMPLATE_CATEGORY-"].update(disabled=not is_enabled)
-                self.window["-TEMPLATE-"].update(disabled=not is_enabled)
-                if not is_enabled:
-                    self.window["-TEMPLATE_CATEGORY-"].update(value="随机分类")
-                    self.window["-TEMPLATE-"].update(value="随机模板")
-                self.window.refresh()
+            try:
+                request, ok, error = self._save_results.get_nowait()
+            except queue.Empty:
+                return
+            self._saves_pending -= 1
+            if not ok:
+                self._err(error)
+            elif not closing:
+                if request.on_success is not None:
+                    request.on_success()
+                self._info(request.message)
+
+    def _set(self, key, value):
+        """仅在控件当前值与目标值不同时更新，避免无谓的 Tk 重绘"""
+        element = self.window[key]
+        if str(element.get()) != str(value):
+            element.update(value=value)
+
+    def _clone_subtree(self, key):
+        """深拷贝配置中的单个顶层配置项，保存时只需复制被修改的部分"""
+        from copy import deepcopy
+
+        return deepcopy(self.config.get_config().get(key, {}))
 
-            elif event == "-TEMPLATE_CATEGORY-":
-                selected_category = values["-TEMPLATE_CATEGORY-"]
+    def _get_platform_display_name(self, platform_key):
+        """获取平台的显示名称"""
+        return self._PLATFORM_KEY_TO_NAME.get(platform_key, "微信公众号")
 
-                if selected_category == "随机分类":
-                    templates = ["随机模板"]
-                    self.window["-TEMPLATE-"].update(
-                        values=templates, value="随机模板", disabled=False
-                    )
-                else:
-                    templates = PathManager.get_templates_by_category(selected_category)
-
-                    if not templates:
-                        sg.popup_error(
-                            f"分类 『{selected_category}』 的模板数量为0，不可选择",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        self.window["-TEMPLATE_CATEGORY-"].update(value="随机分类")
-                        self.window["-TEMPLATE-"].update(
-                            values=["随机模板"], value="随机模板", disabled=False
-                        )
-                    else:
-                        template_options = ["随机模板"] + templates
-                        self.window["-TEMPLATE-"].update(
-                            values=template_options, value="随机模板", disabled=False
-                        )
+    def _get_platform_key(self, display_name):
+        """获取平台的配置键"""
+        return self._PLATFORM_NAME_TO_KEY.get(display_name, "wechat")
+
+    def _apply_dimension_disabled_state(self, master_enabled, auto_select):
+        """按维度化创意总开关和自动选择状态，批量更新各维度勾选框与下拉框"""
+        disabled = not master_enabled or auto_select
+        # 状态未变化时跳过，避免对每个维度控件重复发起 Tk configure
+        if disabled == self._last_dim_disabled:
+            return
+        self._last_dim_disabled = disabled
+        for checkbox, combo, _ in self._dimension_widgets.values():
+            combo.update(disabled=disabled)
+            checkbox.update(disabled=disabled)
+
+    def _init_event_handlers(self):
+        """建立事件分发表：固定 key 的事件直接查表，带行 ID/维度键的事件按前缀匹配"""
+        self._event_handlers = {
+            "-TAB_GROUP-": self._on_tab_group,
+            "-ARTICLE_FORMAT-": self._on_article_format,
+            "-USE_TEMPLATE-": self._on_use_template,
+            "-TEMPLATE_CATEGORY-": self._on_template_category,
+            "-API_TYPE-": self._on_api_type,
+            "-ADD_WECHAT-": self._on_add_wechat,
+            "-SAVE_PLATFORMS-": self._on_save_platforms,
+            "-SAVE_WECHAT-": self._on_save_wechat,
+            "-SAVE_API-": self._on_save_api,
+            "-API_TAB_GROUP-": self._on_api_tab_group,
+            "-SAVE_IMG_API-": self._on_save_img_api,
+            "-SYS_FONT-": self._on_sys_font,
+            "-SAVE_BASE-": self._on_save_base,
+            "-RESET_PLATFORMS-": self._on_reset_platforms,
+            "-RESET_WECHAT-": self._on_reset_wechat,
+            "-RESET_API-": self._on_reset_api,
+            "-RESET_IMG_API-": self._on_reset_img_api,
+            "-RESET_BASE-": self._on_reset_base,
+            "-AIFORGE_DEFAULT_LLM_PROVIDER-": self._on_aiforge_provider,
+            "-SAVE_AIFORGE-": self._on_save_aiforge,
+            "-RESET_AIFORGE-": self._on_reset_aiforge,
+            "-DIMENSIONAL_CREATIVE_ENABLED-": self._on_dimensional_creative_enabled,
+            "-AUTO_DIMENSION_SELECTION-": self._on_auto_dimension_selection,
+            "-CREATIVE_INTENSITY-": self._on_creative_intensity,
+            "-COMPATIBILITY_THRESHOLD-": self._on_compatibility_threshold,
+            "-SMART_RECOMMENDATION-": self._on_smart_recommendation,
+            "-SAVE_CREATIVE_CONFIG-": self._on_save_creative_config,
+            "-RESET_CREATIVE_CONFIG-": self._on_reset_creative_config,
+            sg.TIMEOUT_KEY: self._on_save_poll,
+        }
+        # 按顺序匹配；维度勾选框事件（-DIMENSION_ENABLED_X-）也会匹配 -DIMENSION_，
+        # 由 _on_dimension_option 忽略，勾选状态只在保存配置时读取
+        self._prefix_handlers = (
+            ("-DELETE_WECHAT_", self._on_delete_wechat),
+            ("-WECHAT_CALL_SENDALL_", self._on_wechat_sendall),
+            ("-WECHAT_SENDALL_", self._on_wechat_sendall),
+            ("-DIMENSION_", self._on_dimension_option),
+        )
 
+    def _get_event_handler(self, event):
+        """查找事件对应的处理方法，未注册的事件返回 None"""
+        handler = self._event_handlers.get(event)
+        if handler is not None:
+            return handler
+        if not isinstance(event, str):
+            return None
+        if _IS_MAC and event in self.get_mac_clipboard_events():
+            return self._on_mac_clipboard
+        for prefix, prefix_handler in self._prefix_handlers:
+            if event.startswith(prefix) and event.endswith("-"):
+                return prefix_handler
+        return None
+
+    def _on_tab_group(self, event, values):
+        """切换主 TAB 时按需构建"""
+        self.ensure_tab_built(values["-TAB_GROUP-"])
+
+    def _on_mac_clipboard(self, event, values):
+        """修正 macOS 剪贴板粘贴到输入框的内容"""
+        if values[event]:
+            fixed_value = utils.fix_mac_clipboard(values[event])
+            if fixed_value != values[event]:  # 只有内容真正改变时才更新
+                self.window[event].update(fixed_value)
                 self.window.refresh()
+                # 可选：重新设置焦点确保用户体验
+                self.window[event].set_focus()
+
+    def _on_article_format(self, event, values):
+        """切换文章格式时启用/禁用格式化发布"""
+        if values["-ARTICLE_FORMAT-"] == "html":
+            # HTML格式禁用格式化勾选框
+            self.window["-FORMAT_PUBLISH-"].update(disabled=True)
+        else:
+            # 其他格式（markdown, text）启用格式化勾选框
+            self.window["-FORMAT_PUBLISH-"].update(disabled=False)
+
+    def _on_use_template(self, event, values):
+        """动态启用/禁用模板下拉列表"""
+        is_enabled = values["-USE_TEMPLATE-"]
+        self.window["-TEMPLATE_CATEGORY-"].update(disabled=not is_enabled)
+        self.window["-TEMPLATE-"].update(disabled=not is_enabled)
+        if not is_enabled:
+            self.window["-TEMPLATE_CATEGORY-"].update(value="随机分类")
+            self.window["-TEMPLATE-"].update(value="随机模板")
+        self.window.refresh()
 
-            # 切换API TAB
-            elif event == "-API_TYPE-":
-                tab_group = self.window["-API_TAB_GROUP-"]
-                # 遍历 TabGroup 的子 TAB，找到匹配的标题
-                for tab in tab_group.Widget.tabs():  # type: ignore
-                    tab_text = tab_group.Widget.tab(tab, "text")  # type: ignore
-                    if tab_text == values["-API_TYPE-"]:
-                        tab_group.Widget.select(tab)  # type: ignore
-                        break
-                self.window.refresh()
+    def _on_template_category(self, event, values):
+        """切换模板分类时更新模板列表"""
+        selected_category = values["-TEMPLATE_CATEGORY-"]
+
+        if selected_category == "随机分类":
+            templates = ["随机模板"]
+            self.window["-TEMPLATE-"].update(values=templates, value="随机模板", disabled=False)
+        else:
+            templates = PathManager.get_templates_by_category(selected_category)
 
-            # 添加微信凭证
-            elif event == "-ADD_WECHAT-":
-                credentials = self.config.wechat_credentials  # 直接使用内存中的 credentials
-                credentials.append(
-                    {
-                        "appid": "",
-                        "appsecret": "",
-                        "author": "",
-                        "call_sendall": False,
-                        "sendall": True,
-                        "tag_id": 0,
-                    }
+            if not templates:
+                self._err(f"分类 『{selected_category}』 的模板数量为0，不可选择")
+                self.window["-TEMPLATE_CATEGORY-"].update(value="随机分类")
+                self.window["-TEMPLATE-"].update(
+                    values=["随机模板"], value="随机模板", disabled=False
                 )
-                self.wechat_count = len(credentials)
+            else:
+                template_options = ["随机模板"] + templates
+                self.window["-TEMPLATE-"].update(
+                    values=template_options, value="随机模板", disabled=False
+                )
+
+        self.window.refresh()
+
+    def _on_api_type(self, event, values):
+        """切换API TAB"""
+        # 通过预先建立的标题映射找到对应的子 TAB
+        tab_id = self._api_tab_ids.get(values["-API_TYPE-"])
+        if tab_id:
+            self.window["-API_TAB_GROUP-"].Widget.select(tab_id)  # type: ignore
+        self.window.refresh()
+
+    def _on_add_wechat(self, event, values):
+        """添加微信凭证"""
+        # 直接修改内存中的 credentials，持锁避免与后台线程序列化配置同时进行
+        with self.config.locked():
+            credentials = self.config.wechat_credentials
+            credentials.append(
+                {
+                    "appid": "",
+                    "appsecret": "",
+                    "author": "",
+                    "call_sendall": False,
+                    "sendall": True,
+                    "tag_id": 0,
+                }
+            )
+            self.wechat_count = len(credentials)
+        self._invalidate_mac_clipboard_cache()
+        try:
+            self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
+            self.window["-WECHAT_CREDENTIALS_COLUMN-"].contents_changed()  # type: ignore
+            self.window["-WECHAT_CREDENTIALS_COLUMN-"].Widget.canvas.yview_moveto(1.0)  # type: ignore # noqa 501
+            self.window.refresh()
+        except Exception as e:
+            self._err(f"添加凭证失败: {e}")
+
+    def _on_delete_wechat(self, event, values):
+        """删除微信凭证"""
+        match = _DELETE_WECHAT_RE.match(event)
+        if match:
+            row_id = int(match.group(1))
+            if row_id in self._wechat_row_ids:
                 try:
-                    self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
-                    self.window["-WECHAT_CREDENTIALS_COLUMN-"].contents_changed()  # type: ignore
-                    self.window["-WECHAT_CREDENTIALS_COLUMN-"].Widget.canvas.yview_moveto(1.0)  # type: ignore # noqa 501
-                    self.window.TKroot.update_idletasks()
-                    self.window.TKroot.update()
+                    # 只隐藏被删除的凭证行，其余行保持原 key，无需重建 TAB
+                    index = self._wechat_row_ids.index(row_id)
+                    # 直接修改内存中的 credentials，持锁避免与后台线程序列化配置同时进行
+                    with self.config.locked():
+                        self.config.wechat_credentials.pop(index)
+                    self._wechat_row_ids.pop(index)
+                    self.wechat_count = len(self._wechat_row_ids)
+                    self._invalidate_mac_clipboard_cache()
+                    self.window[f"-WECHAT_ROW_{row_id}-"].hide_row()
+                    # 后续凭证的序号前移
+                    for i in range(index, self.wechat_count):
+                        title_key = f"-WECHAT_TITLE_{self._wechat_row_ids[i]}-"
+                        self.window[title_key].update(value=f"凭证 {i+1}:")
+                    self.window["-WECHAT_CREDENTIALS_COLUMN-"].contents_changed()  # type: ignore # noqa 501
                     self.window.refresh()
-                    self.window["-TAB_WECHAT-"].Widget.update()  # type: ignore
-                    self.window["-WECHAT_CREDENTIALS_COLUMN-"].Widget.update()  # type: ignore
                 except Exception as e:
-                    sg.popup_error(
-                        f"添加凭证失败: {e}",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-            # 删除微信凭证
-            elif event.startswith("-DELETE_WECHAT_"):
-                match = re.search(r"-DELETE_WECHAT_(\d+)", event)
-                if match:
-                    index = int(match.group(1))
-                    credentials = self.config.wechat_credentials  # 直接使用内存中的 credentials
-                    if 0 <= index < len(credentials):
-                        try:
-                            credentials.pop(index)
-                            self.wechat_count = len(credentials)
-                            self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
-                            self.window.TKroot.update_idletasks()
-                            self.window.TKroot.update()
-                            self.window.refresh()
-                            self.window["-TAB_WECHAT-"].Widget.update()  # type: ignore
-                            self.window["-WECHAT_CREDENTIALS_COLUMN-"].Widget.update()  # type: ignore # noqa 501
-                        except Exception as e:
-                            sg.popup_error(
-                                f"删除凭证失败: {e}",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                    else:
-                        sg.popup_error(
-                            f"无效的凭证索引: {index}",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-
-            # 保存平台配置
-            elif event.startswith("-SAVE_PLATFORMS-"):
-                config = self.config.get_config().copy()
-                platforms = []
-                total_weight = 0.0
-                # 动态检测界面上实际的平台数量
-                i = 0
-                while f"-PLATFORM_NAME_{i}-" in values:
-                    try:
-                        weight = float(values[f"-PLATFORM_WEIGHT_{i}-"])
-                        # 限定weight范围
-                        if weight < 0:
-                            weight = 0
-                            sg.popup_error(
-                                f"平台 {values[f'-PLATFORM_NAME_{i}-']} 权重小于0，将被设为0",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                            # 更新界面上的权重值
-                            self.window[f"-PLATFORM_WEIGHT_{i}-"].update(value=str(weight))
-                        elif weight > 1:
-                            weight = 1
-                            sg.popup_error(
-                                f"平台 {values[f'-PLATFORM_NAME_{i}-']} 权重大于1，将被设为1",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                            # 更新界面上的权重值
-                            self.window[f"-PLATFORM_WEIGHT_{i}-"].update(value=str(weight))
-
-                        total_weight += weight
-                        platforms.append({"name": values[f"-PLATFORM_NAME_{i}-"], "weight": weight})
-                    except ValueError:
-                        sg.popup_error(
-                            f"平台 {values[f'-PLATFORM_NAME_{i}-']} 权重必须是数字",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        break
-                    i += 1
-                else:
-                    if total_weight > 1.0:
-                        sg.popup(
-                            "平台权重之和超过1，将默认选取微博热搜。",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                    config["platforms"] = platforms
-                    if self.config.save_config(config):
-                        self.platform_count = len(platforms)  # 同步更新计数器
-                        sg.popup(
-                            "平台配置已保存",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                    else:
-                        sg.popup_error(
-                            self.config.error_message,
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-
-            # 保存微信配置
-            elif event.startswith("-SAVE_WECHAT-"):
-                config = self.config.get_config().copy()
-                credentials = []
-                # 遍历窗口中所有可能的微信凭证键
-                max_index = -1
-                for key in self.window.AllKeysDict:
-                    if isinstance(key, str) and key.startswith("-WECHAT_APPID_"):  # 添加类型检查
-                        try:
-                            # 提取索引，移除尾部连字符
-                            index = int(key.split("_")[-1].rstrip("-"))
-                            max_index = max(max_index, index)
-                        except ValueError:
-                            continue  # 跳过无效键
-                max_index = max_index + 1 if max_index >= 0 else 0
-                i = 0
-                while i <= max_index:
-                    appid_key = f"-WECHAT_APPID_{i}-"
-                    secret_key = f"-WECHAT_SECRET_{i}-"
-                    author_key = f"-WECHAT_AUTHOR_{i}-"
-                    call_sendall_key = f"-WECHAT_CALL_SENDALL_{i}-"
-                    sendall_key = f"-WECHAT_SENDALL_{i}-"
-                    tag_id_key = f"-WECHAT_TAG_ID_{i}-"
-                    if (
-                        appid_key in self.window.AllKeysDict
-                        and secret_key in self.window.AllKeysDict
-                        and author_key in self.window.AllKeysDict
-                        and call_sendall_key in self.window.AllKeysDict
-                        and sendall_key in self.window.AllKeysDict
-                        and tag_id_key in self.window.AllKeysDict
-                        and self.window[appid_key].visible
-                    ):
-                        tag_id_value = values.get(tag_id_key, 0)
-                        appid = values.get(appid_key, "")
-                        appsecret = values.get(secret_key, "")
-                        call_sendall = values.get(call_sendall_key, False)
-                        sendall = values.get(sendall_key, False)
-
-                        # 只有真正使用tag_id，才校验
-                        tag_id = 0
-                        if appid and appsecret and call_sendall and not sendall:
-                            try:
-                                tag_id = int(tag_id_value) if str(tag_id_value).isdigit() else 0
-                                if tag_id < 1:
-                                    tag_id = 0
-                                    sg.popup_error(
-                                        f"【凭证 {i+1} 】标签组ID必须 ≥ 1，已设为0（即无效，如果未勾选群发将发布失败）",
-                                        title="系统提示",
-                                        icon=utils.get_gui_icon(),
-                                        keep_on_top=True,
-                                    )
-                                    self.window[tag_id_key].update(value=str(tag_id))
-                            except ValueError:
-                                tag_id = 0
-                                sg.popup_error(
-                                    f"【凭证 {i+1} 】标签组ID必须为数字，已设为0（即无效，如果未勾选群发将发布失败）",
-                                    title="系统提示",
-                                    icon=utils.get_gui_icon(),
-                                    keep_on_top=True,
-                                )
-                                self.window[tag_id_key].update(value=str(tag_id))
-
-                        credentials.append(
-                            {
-                                "appid": values.get(appid_key, ""),
-                                "appsecret": values.get(secret_key, ""),
-                                "author": values.get(author_key, ""),
-                                "call_sendall": values.get(call_sendall_key, False),
-                                "sendall": values.get(sendall_key, False),
-                                "tag_id": tag_id,
-                            }
-                        )
-                    i += 1
-                config["wechat"]["credentials"] = credentials
-                if self.config.save_config(config):
-                    self.wechat_count = len(credentials)  # 同步更新计数器
-                    # 刷新界面以确保一致
-                    self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
-                    self.window.TKroot.update_idletasks()
-                    self.window.TKroot.update()
-                    self.window.refresh()
-                    self.window["-TAB_WECHAT-"].Widget.update()  # type: ignore
-                    self.window["-WECHAT_CREDENTIALS_COLUMN-"].Widget.update()  # type: ignore
-                    sg.popup(
-                        "微信配置已保存",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+                    self._err(f"删除凭证失败: {e}")
+            else:
+                self._err(f"无效的凭证索引: {row_id}")
+
+    def _on_save_platforms(self, event, values):
+        """保存平台配置"""
+        config = {}
+        platforms = []
+        total_weight = 0.0
+        errors = []  # 汇总所有校验问题，统一提示一次
+        has_invalid = False
+        for i in range(self.platform_count):
+            name = values[f"-PLATFORM_NAME_{i}-"]
+            weight_key = f"-PLATFORM_WEIGHT_{i}-"
+            try:
+                weight = float(values[weight_key])
+            except ValueError:
+                errors.append(f"平台 {name} 权重必须是数字")
+                has_invalid = True
+                continue
 
-            # 保存 API 配置
-            elif event.startswith("-SAVE_API-"):
-                config = self.config.get_config().copy()
-                api_type = values["-API_TYPE-"]
-                if api_type == "硅基流动":
-                    api_type = "SiliconFlow"
-
-                config["api"]["api_type"] = api_type
-                for api_name in self.config.api_list:
-                    try:
-                        model_index = int(values[f"-{api_name}_MODEL_INDEX-"])
-                        key_index = int(values[f"-{api_name}_KEY_INDEX-"])
-                        models = [
-                            m.strip()
-                            for m in re.split(r",|，", values[f"-{api_name}_MODEL-"])
-                            if m.strip()
-                        ]
-                        api_keys = [
-                            k.strip()
-                            for k in re.split(r",|，", values[f"-{api_name}_API_KEYS-"])
-                            if k.strip()
-                        ]
-                        if not api_keys:
-                            api_keys = [""]  # 确保至少有一个空密钥
-                        if key_index >= len(api_keys):
-                            raise ValueError(f"{api_name} API KEY 索引超出范围")
-                        if model_index >= len(models):
-                            raise ValueError(f"{api_name} 模型索引超出范围")
-                        api_data = {
-                            "key": values[f"-{api_name}_KEY-"],
-                            "key_index": key_index,
-                            "api_key": api_keys,
-                            "model_index": model_index,
-                            "api_base": values[f"-{api_name}_API_BASE-"],
-                            "model": models,
-                        }
-                        config["api"][api_name].update(api_data)
-                    except ValueError as e:
-                        sg.popup_error(
-                            f"{api_name} 配置错误: {e}",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        break
-                else:
-                    if self.config.save_config(config):
-                        sg.popup(
-                            "API 配置已保存",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                    else:
-                        sg.popup_error(
-                            self.config.error_message,
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-            elif event == "-API_TAB_GROUP-":
-                try:
-                    tab_group = self.window["-API_TAB_GROUP-"]
-                    selected_tab_index = tab_group.Widget.index("current")  # type: ignore
-                    selected_tab_text = tab_group.Widget.tab(selected_tab_index, "text")  # type: ignore # noqa 501
-
-                    # 转换 tab 文本为显示名称（保持一致性）
-                    if selected_tab_text == "硅基流动":
-                        display_api_type = "硅基流动"
-                    else:
-                        display_api_type = selected_tab_text
-
-                    # 更新 API TYPE 下拉框，避免触发循环事件
-                    current_value = self.window["-API_TYPE-"].get()
-                    if current_value != display_api_type:
-                        self.window["-API_TYPE-"].update(value=display_api_type)
-
-                except Exception:
-                    # 静默处理异常，避免影响用户体验
-                    pass
-
-            # 保存图像 API 配置
-            elif event.startswith("-SAVE_IMG_API-"):
-                config = self.config.get_config().copy()
-                config["img_api"]["api_type"] = values["-IMG_API_TYPE-"]
-                config["img_api"]["ali"].update(
-                    {"api_key": values["-ALI_API_KEY-"], "model": values["-ALI_MODEL-"]}
-                )
-                config["img_api"]["picsum"].update(
-                    {"api_key": values["-PICSUM_API_KEY-"], "model": values["-PICSUM_MODEL-"]}
-                )
-                if self.config.save_config(config):
-                    sg.popup(
-                        "图像 API 配置已保存",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
+            # 限定weight范围
+            if weight < 0:
+                weight = 0
+                errors.append(f"平台 {name} 权重小于0，将被设为0")
+                # 更新界面上的权重值
+                self.window[weight_key].update(value=str(weight))
+            elif weight > 1:
+                weight = 1
+                errors.append(f"平台 {name} 权重大于1，将被设为1")
+                # 更新界面上的权重值
+                self.window[weight_key].update(value=str(weight))
+
+            total_weight += weight
+            platforms.append({"name": name, "weight": weight})
+
+        if errors:
+            self._err("\n".join(errors))
+        # 存在非数字权重时不保存
+        if has_invalid:
+            return
+
+        if total_weight > 1.0:
+            self._info("平台权重之和超过1，将默认选取微博热搜。")
+        config["platforms"] = platforms
+
+        def on_saved():
+            self.platform_count = len(platforms)  # 同步更新计数器
+
+        self._save_async(config, "平台配置已保存", on_saved)
+
+    def _on_save_wechat(self, event, values):
+        """保存微信配置"""
+        config = {"wechat": self._clone_subtree("wechat")}
+        credentials = []
+        # 只遍历当前显示的凭证行，保存时按显示顺序重新连续编号
+        for i, row_id in enumerate(self._wechat_row_ids):
+            (
+                appid_key,
+                secret_key,
+                author_key,
+                call_sendall_key,
+                sendall_key,
+                tag_id_key,
+            ) = self._wechat_keys[row_id]
+            tag_id_value = values.get(tag_id_key, 0)
+            appid = values.get(appid_key, "")
+            appsecret = values.get(secret_key, "")
+            call_sendall = values.get(call_sendall_key, False)
+            sendall = values.get(sendall_key, False)
+
+            # 只有真正使用tag_id，才校验
+            tag_id = 0
+            if appid and appsecret and call_sendall and not sendall:
+                tag_id = _to_int(tag_id_value)
+                if tag_id is None:
+                    tag_id = 0
+                    self._err(
+                        f"【凭证 {i+1} 】标签组ID必须为数字，已设为0（即无效，如果未勾选群发将发布失败）"
                     )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
+                    self.window[tag_id_key].update(value=str(tag_id))
+                elif tag_id < 1:
+                    tag_id = 0
+                    self._err(
+                        f"【凭证 {i+1} 】标签组ID必须 ≥ 1，已设为0（即无效，如果未勾选群发将发布失败）"
                     )
+                    self.window[tag_id_key].update(value=str(tag_id))
+
+            credentials.append(
+                {
+                    "appid": values.get(appid_key, ""),
+                    "appsecret": values.get(secret_key, ""),
+                    "author": values.get(author_key, ""),
+                    "call_sendall": values.get(call_sendall_key, False),
+                    "sendall": values.get(sendall_key, False),
+                    "tag_id": tag_id,
+                }
+            )
+        config["wechat"]["credentials"] = credentials
+
+        def on_saved():
+            self.wechat_count = len(credentials)  # 同步更新计数器
+            # 刷新界面以确保一致（update_tab 内已统一刷新一次）
+            self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
+
+        self._save_async(config, "微信配置已保存", on_saved)
+
+    def _on_save_api(self, event, values):
+        """保存 API 配置"""
+        config = {"api": self._clone_subtree("api")}
+        api_type = values["-API_TYPE-"]
+        api_type = _API_DISPLAY_TO_KEY.get(api_type, api_type)
+
+        config["api"]["api_type"] = api_type
+        inputs_by_api = {}
+        for api_name in self.config.api_list:
+            inputs = (
+                values[f"-{api_name}_KEY-"],
+                values[f"-{api_name}_KEY_INDEX-"],
+                values[f"-{api_name}_API_KEYS-"],
+                values[f"-{api_name}_MODEL_INDEX-"],
+                values[f"-{api_name}_API_BASE-"],
+                values[f"-{api_name}_MODEL-"],
+            )
+            inputs_by_api[api_name] = inputs
+            # 输入与上次保存时一致，配置中已是解析结果，无需重新解析校验
+            if inputs == self._api_saved_inputs.get(api_name):
+                continue
+            try:
+                model_index = int(values[f"-{api_name}_MODEL_INDEX-"])
+                key_index = int(values[f"-{api_name}_KEY_INDEX-"])
+                models = _split_list_input(values[f"-{api_name}_MODEL-"])
+                api_keys = _split_list_input(values[f"-{api_name}_API_KEYS-"])
+                if not api_keys:
+                    api_keys = [""]  # 确保至少有一个空密钥
+                if key_index >= len(api_keys):
+                    raise ValueError(f"{api_name} API KEY 索引超出范围")
+                if model_index >= len(models):
+                    raise ValueError(f"{api_name} 模型索引超出范围")
+                api_data = {
+                    "key": values[f"-{api_name}_KEY-"],
+                    "key_index": key_index,
+                    "api_key": api_keys,
+                    "model_index": model_index,
+                    "api_base": values[f"-{api_name}_API_BASE-"],
+                    "model": models,
+                }
+                config["api"][api_name].update(api_data)
+            except ValueError as e:
+                self._err(f"{api_name} 配置错误: {e}")
+                break
+        else:
 
-            # 保存基础配置
-            elif event == "-SYS_FONT-":
-                if values["-SYS_FONT-"]:
-                    self.window["-FONT_COMBO-"].update(disabled=True)
-                else:
-                    self.window["-FONT_COMBO-"].update(disabled=False)
-            elif event.startswith("-SAVE_BASE-"):
-                config = self.config.get_config().copy()
-                config["publish_platform"] = self._get_platform_key(values["-PUBLISH_PLATFORM-"])
-                config["auto_publish"] = values["-AUTO_PUBLISH-"]
-                config["format_publish"] = values["-FORMAT_PUBLISH-"]
-                config["use_template"] = values["-USE_TEMPLATE-"]
-                config["use_compress"] = values["-USE_COMPRESS-"]
-                config["article_format"] = values["-ARTICLE_FORMAT-"]
-
-                if values["-SYS_FONT-"]:
-                    self.set_global_font("Helvetica")
-                else:
-                    if values["-FONT_COMBO-"]:
-                        if self._validate_font_selection(values["-FONT_COMBO-"]):
-                            self.set_global_font(values["-FONT_COMBO-"])
-                        else:
-                            sg.popup_error(
-                                "所选字体不适合界面显示，已重置为默认字体",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                            self.window["-FONT_COMBO-"].update(disabled=True)
-                            self.set_global_font("Helvetica")
-                    else:
-                        self.set_global_font("Helvetica")
-
-                if str(values["-AIFORGE_SEARCH_MAX_RESULTS-"]).isdigit():
-                    input_value = int(values["-AIFORGE_SEARCH_MAX_RESULTS-"])
-                    config["aiforge_search_max_results"] = (
-                        input_value
-                        if 1 < input_value <= 20
-                        else self.config.default_config["aiforge_search_max_results"]
-                    )
-                    if not (1 < input_value <= 20):
-                        self.window["-AIFORGE_SEARCH_MAX_RESULTS-"].update(
-                            value=self.config.default_config["aiforge_search_max_results"]
-                        )
-                else:
-                    config["aiforge_search_max_results"] = self.config.default_config[
-                        "aiforge_search_max_results"
-                    ]
-                    self.window["-AIFORGE_SEARCH_MAX_RESULTS-"].update(
-                        value=self.config.default_config["aiforge_search_max_results"]
-                    )
+            def on_saved():
+                self._api_saved_inputs = inputs_by_api
 
-                if str(values["-AIFORGE_SEARCH_MIN_RESULTS-"]).isdigit():
-                    input_value = int(values["-AIFORGE_SEARCH_MIN_RESULTS-"])
-                    config["aiforge_search_min_results"] = (
-                        input_value
-                        if 1
-                        < input_value
-                        <= self.config.default_config["aiforge_search_max_results"]
-                        and input_value
-                        < config["aiforge_search_max_results"]  # 最大为10且不能比最大值大
-                        else self.config.default_config["aiforge_search_min_results"]
-                    )
-                    if not (
-                        1 < input_value <= self.config.default_config["aiforge_search_max_results"]
-                    ):
-                        self.window["-AIFORGE_SEARCH_MIN_RESULTS-"].update(
-                            value=self.config.default_config["aiforge_search_min_results"]
-                        )
-                else:
-                    config["aiforge_search_min_results"] = self.config.default_config[
-                        "aiforge_search_min_results"
-                    ]
-                    self.window["-AIFORGE_SEARCH_MIN_RESULTS-"].update(
-                        value=self.config.default_config["aiforge_search_min_results"]
-                    )
+            self._save_async(config, "API 配置已保存", on_saved)
 
-                # 文章字数控制
-                min_len_input = values["-MIN_ARTICLE_LEN-"]
-                max_len_input = values["-MAX_ARTICLE_LEN-"]
-                parsed_min_len = None
-                parsed_max_len = None
+    def _on_api_tab_group(self, event, values):
+        """切换 API 子 TAB 时同步 API 类型下拉框"""
+        try:
+            # values 中已是当前选中子 TAB 的 key，无需再向 Tk 查询
+            display_api_type = self._api_tab_titles.get(values["-API_TAB_GROUP-"])
+            if display_api_type is None:
+                return
 
-                try:
-                    if isinstance(min_len_input, str) and min_len_input.isdigit():
-                        parsed_min_len = int(min_len_input)
-                    if isinstance(max_len_input, str) and max_len_input.isdigit():
-                        parsed_max_len = int(max_len_input)
-                except ValueError:
-                    pass
-
-                if (
-                    parsed_min_len is not None
-                    and parsed_max_len is not None
-                    and parsed_min_len >= 500
-                    and parsed_max_len <= 5000
-                    and parsed_min_len <= parsed_max_len
-                ):
-                    config["min_article_len"] = parsed_min_len
-                    config["max_article_len"] = parsed_max_len
-                else:
-                    config["min_article_len"] = self.config.default_config["min_article_len"]
-                    config["max_article_len"] = self.config.default_config["max_article_len"]
-                    self.window["-MIN_ARTICLE_LEN-"].update(
-                        value=self.config.default_config["min_article_len"]
-                    )
-                    self.window["-MAX_ARTICLE_LEN-"].update(
-                        value=self.config.default_config["max_article_len"]
-                    )
+            # 更新 API TYPE 下拉框，避免触发循环事件
+            current_value = self.window["-API_TYPE-"].get()
+            if current_value != display_api_type:
+                self.window["-API_TYPE-"].update(value=display_api_type)
 
-                # 处理 template 保存逻辑
-                if values["-USE_TEMPLATE-"]:
-                    category_value = values["-TEMPLATE_CATEGORY-"]
-                    template_value = values["-TEMPLATE-"]
+        except Exception:
+            # 静默处理异常，避免影响用户体验
+            pass
+
+    def _on_save_img_api(self, event, values):
+        """保存图像 API 配置"""
+        config = {"img_api": self._clone_subtree("img_api")}
+        config["img_api"]["api_type"] = values["-IMG_API_TYPE-"]
+        config["img_api"]["ali"].update(
+            {"api_key": values["-ALI_API_KEY-"], "model": values["-ALI_MODEL-"]}
+        )
+        config["img_api"]["picsum"].update(
+            {"api_key": values["-PICSUM_API_KEY-"], "model": values["-PICSUM_MODEL-"]}
+        )
+        self._save_async(config, "图像 API 配置已保存")
 
-                    config["template_category"] = (
-                        category_value if category_value != "随机分类" else ""
-                    )
-                    config["template"] = template_value if template_value != "随机模板" else ""
-                else:
-                    config["template_category"] = ""
-                    config["template"] = ""
-
-                if self.config.save_config(config):
-                    sg.popup(
-                        "基础配置已保存",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+    def _on_sys_font(self, event, values):
+        """切换默认字体时启用/禁用字体下拉框"""
+        if values["-SYS_FONT-"]:
+            self.window["-FONT_COMBO-"].update(disabled=True)
+        else:
+            self.window["-FONT_COMBO-"].update(disabled=False)
+
+    def _on_save_base(self, event, values):
+        """保存基础配置"""
+        config = {}
+        config["publish_platform"] = self._get_platform_key(values["-PUBLISH_PLATFORM-"])
+        config["auto_publish"] = values["-AUTO_PUBLISH-"]
+        config["format_publish"] = values["-FORMAT_PUBLISH-"]
+        config["use_template"] = values["-USE_TEMPLATE-"]
+        config["use_compress"] = values["-USE_COMPRESS-"]
+        config["article_format"] = values["-ARTICLE_FORMAT-"]
+
+        if values["-SYS_FONT-"]:
+            self.set_global_font("Helvetica")
+        else:
+            if values["-FONT_COMBO-"]:
+                if self._validate_font_selection(values["-FONT_COMBO-"]):
+                    self.set_global_font(values["-FONT_COMBO-"])
                 else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+                    self._err("所选字体不适合界面显示，已重置为默认字体")
+                    self.window["-FONT_COMBO-"].update(disabled=True)
+                    self.set_global_font("Helvetica")
+            else:
+                self.set_global_font("Helvetica")
 
-            # 恢复默认配置 - 平台
-            elif event.startswith("-RESET_PLATFORMS-"):
-                config = self.config.get_config().copy()
-                config["platforms"] = copy.deepcopy(self.config.default_config["platforms"])
-                if self.config.save_config(config):
-                    self.platform_count = len(config["platforms"])
-                    # 清空并重建平台 tab
-                    self.update_tab("-TAB_PLATFORM-", self.create_platforms_tab())
-                    sg.popup(
-                        "已恢复默认平台配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        input_value = _to_int(values["-AIFORGE_SEARCH_MAX_RESULTS-"])
+        if input_value is not None:
+            config["aiforge_search_max_results"] = (
+                input_value
+                if 1 < input_value <= 20
+                else self.config.default_config["aiforge_search_max_results"]
+            )
+            if not (1 < input_value <= 20):
+                self._set(
+                    "-AIFORGE_SEARCH_MAX_RESULTS-",
+                    self.config.default_config["aiforge_search_max_results"],
+                )
+        else:
+            config["aiforge_search_max_results"] = self.config.default_config[
+                "aiforge_search_max_results"
+            ]
+            self._set(
+                "-AIFORGE_SEARCH_MAX_RESULTS-",
+                self.config.default_config["aiforge_search_max_results"],
+            )
 
-            # 恢复默认配置 - 微信
-            elif event.startswith("-RESET_WECHAT-"):
-                config = self.config.get_config().copy()
-                config["wechat"]["credentials"] = copy.deepcopy(
-                    self.config.default_config["wechat"]["credentials"]
+        input_value = _to_int(values["-AIFORGE_SEARCH_MIN_RESULTS-"])
+        if input_value is not None:
+            config["aiforge_search_min_results"] = (
+                input_value
+                if 1 < input_value <= self.config.default_config["aiforge_search_max_results"]
+                and input_value < config["aiforge_search_max_results"]  # 最大为10且不能比最大值大
+                else self.config.default_config["aiforge_search_min_results"]
+            )
+            if not (1 < input_value <= self.config.default_config["aiforge_search_max_results"]):
+                self._set(
+                    "-AIFORGE_SEARCH_MIN_RESULTS-",
+                    self.config.default_config["aiforge_search_min_results"],
                 )
-                if self.config.save_config(config):
-                    self.wechat_count = len(config["wechat"]["credentials"])
-                    # 清空并重建微信 tab
-                    self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
-                    sg.popup(
-                        "已恢复默认微信配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        else:
+            config["aiforge_search_min_results"] = self.config.default_config[
+                "aiforge_search_min_results"
+            ]
+            self._set(
+                "-AIFORGE_SEARCH_MIN_RESULTS-",
+                self.config.default_config["aiforge_search_min_results"],
+            )
 
-            # 恢复默认配置 - API
-            elif event.startswith("-RESET_API-"):
-                config = self.config.get_config().copy()
-                config["api"] = copy.deepcopy(self.config.default_config["api"])
-                if self.config.save_config(config):
-                    # 清空并重建 API tab
-                    self.update_tab("-TAB_API-", self.create_api_tab())
-                    self.__default_select_api_tab()
-                    sg.popup(
-                        "已恢复默认API配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        # 文章字数控制
+        parsed_min_len = _to_int(values["-MIN_ARTICLE_LEN-"])
+        parsed_max_len = _to_int(values["-MAX_ARTICLE_LEN-"])
+
+        if (
+            parsed_min_len is not None
+            and parsed_max_len is not None
+            and parsed_min_len >= 500
+            and parsed_max_len <= 5000
+            and parsed_min_len <= parsed_max_len
+        ):
+            config["min_article_len"] = parsed_min_len
+            config["max_article_len"] = parsed_max_len
+        else:
+            config["min_article_len"] = self.config.default_config["min_article_len"]
+            config["max_article_len"] = self.config.default_config["max_article_len"]
+            self._set("-MIN_ARTICLE_LEN-", self.config.default_config["min_article_len"])
+            self._set("-MAX_ARTICLE_LEN-", self.config.default_config["max_article_len"])
+
+        # 处理 template 保存逻辑
+        if values["-USE_TEMPLATE-"]:
+            category_value = values["-TEMPLATE_CATEGORY-"]
+            template_value = values["-TEMPLATE-"]
+
+            config["template_category"] = category_value if category_value != "随机分类" else ""
+            config["template"] = template_value if template_value != "随机模板" else ""
+        else:
+            config["template_category"] = ""
+            config["template"] = ""
+
+        self._save_async(config, "基础配置已保存")
+
+    def _on_reset_platforms(self, event, values):
+        """恢复默认配置 - 平台"""
+        config = {}
+        config["platforms"] = self.config.get_default_config("platforms")
+
+        def on_saved():
+            self.platform_count = len(config["platforms"])
+            # 清空并重建平台 tab
+            self.update_tab("-TAB_PLATFORM-", self.create_platforms_tab())
+
+        self._save_async(config, "已恢复默认平台配置", on_saved)
+
+    def _on_reset_wechat(self, event, values):
+        """恢复默认配置 - 微信"""
+        config = {"wechat": self._clone_subtree("wechat")}
+        default_wechat = self.config.get_default_config("wechat")
+        config["wechat"]["credentials"] = default_wechat["credentials"]
+
+        def on_saved():
+            self.wechat_count = len(config["wechat"]["credentials"])
+            # 清空并重建微信 tab
+            self.update_tab("-TAB_WECHAT-", self.create_wechat_tab())
+
+        self._save_async(config, "已恢复默认微信配置", on_saved)
+
+    def _on_reset_api(self, event, values):
+        """恢复默认配置 - API"""
+        config = {}
+        config["api"] = self.config.get_default_config("api")
+
+        def on_saved():
+            # 清空并重建 API tab
+            self.update_tab("-TAB_API-", self.create_api_tab())
+            self.__default_select_api_tab()
+
+        self._save_async(config, "已恢复默认API配置", on_saved)
+
+    def _on_reset_img_api(self, event, values):
+        """恢复默认配置 - 图像 API"""
+        config = {}
+        config["img_api"] = self.config.get_default_config("img_api")
+
+        def on_saved():
+            # 清空并重建图像 API tab
+            self.update_tab("-TAB_IMG_API-", self.create_img_api_tab())
+
+        self._save_async(config, "已恢复默认图像API配置", on_saved)
+
+    def _on_reset_base(self, event, values):
+        """恢复默认配置 - 基础"""
+        config = {}
+        config["auto_publish"] = self.config.default_config["auto_publish"]
+        config["format_publish"] = self.config.default_config["format_publish"]
+        config["use_template"] = self.config.default_config["use_template"]
+        config["use_compress"] = self.config.default_config["use_compress"]
+        config["article_format"] = self.config.default_config["article_format"]
+        config["aiforge_search_max_results"] = self.config.default_config[
+            "aiforge_search_max_results"
+        ]
+        config["aiforge_search_min_results"] = self.config.default_config[
+            "aiforge_search_min_results"
+        ]
+        config["min_article_len"] = self.config.default_config["min_article_len"]
+        config["max_article_len"] = self.config.default_config["max_article_len"]
+        config["template"] = self.config.default_config["template"]
+        self.set_global_font("Helvetica")
+        self._save_async(config, "已恢复默认基础配置", lambda: self._reset_base_widgets(config))
+
+    def _reset_base_widgets(self, config):
+        """就地更新基础 TAB 的控件值（控件集合不变，无需重建整个 TAB）"""
+        for key, name in self._BASE_VALUE_WIDGETS.items():
+            self.window[key].update(value=config[name])
+        self.window["-FORMAT_PUBLISH-"].update(disabled=config["article_format"].lower() == "html")
+
+        # 模板：分类保持当前配置，模板恢复为随机
+        use_template = config["use_template"] and not self._is_template_empty
+        category = self.config.template_category if use_template else ""
+        templates = PathManager.get_templates_by_category(category) if category else []
+        self.window["-USE_TEMPLATE-"].update(value=use_template)
+        self.window["-TEMPLATE_CATEGORY-"].update(
+            value=category or "随机分类", disabled=not use_template
+        )
+        self.window["-TEMPLATE-"].update(
+            values=["随机模板"] + templates, value="随机模板", disabled=not use_template
+        )
 
-            # 恢复默认配置 - 图像 API
-            elif event.startswith("-RESET_IMG_API-"):
-                config = self.config.get_config().copy()
-                config["img_api"] = copy.deepcopy(self.config.default_config["img_api"])
-                if self.config.save_config(config):
-                    # 清空并重建图像 API tab
-                    self.update_tab("-TAB_IMG_API-", self.create_img_api_tab())
-                    sg.popup(
-                        "已恢复默认图像API配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        # 字体恢复为系统默认
+        self.window["-SYS_FONT-"].update(value=True)
+        self.window["-FONT_COMBO-"].update(value="", disabled=True)
 
-            # 恢复默认配置 - 基础
-            elif event.startswith("-RESET_BASE-"):
-                config = self.config.get_config().copy()
-                config["auto_publish"] = self.config.default_config["auto_publish"]
-                config["format_publish"] = self.config.default_config["format_publish"]
-                config["use_template"] = self.config.default_config["use_template"]
-                config["use_compress"] = self.config.default_config["use_compress"]
-                config["article_format"] = self.config.default_config["article_format"]
-                config["aiforge_search_max_results"] = self.config.default_config[
-                    "aiforge_search_max_results"
-                ]
-                config["aiforge_search_min_results"] = self.config.default_config[
-                    "aiforge_search_min_results"
-                ]
-                config["min_article_len"] = self.config.default_config["min_article_len"]
-                config["max_article_len"] = self.config.default_config["max_article_len"]
-                config["template"] = self.config.default_config["template"]
-                self.set_global_font("Helvetica")
-                if self.config.save_config(config):
-                    self.update_tab("-TAB_BASE-", self.create_base_tab())
-                    sg.popup(
-                        "已恢复默认基础配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+    def _on_aiforge_provider(self, event, values):
+        """动态更新 AIForge 提供商的所有参数"""
+        try:
+            selected_provider = values["-AIFORGE_DEFAULT_LLM_PROVIDER-"]
+            # 获取新选中的提供商的配置
+            provider_config = self.config.aiforge_config["llm"].get(selected_provider, {})
+            # 更新所有参数的输入框
+            self._set("-AIFORGE_TYPE-", provider_config.get("type", ""))
+            self._set("-AIFORGE_MODEL-", provider_config.get("model", ""))
+            self._set("-AIFORGE_API_KEY-", provider_config.get("api_key", ""))
+            self._set("-AIFORGE_BASE_URL-", provider_config.get("base_url", ""))
+            self._set("-AIFORGE_TIMEOUT-", provider_config.get("timeout", 30))
+            self._set("-AIFORGE_MAX_TOKENS-", provider_config.get("max_tokens", 8192))
+            self.window.refresh()
+        except Exception as e:
+            self._err(f"更新 AIForge 提供商配置失败: {e}")
+
+    def _on_save_aiforge(self, event, values):
+        """保存 AIForge 配置"""
+        from copy import deepcopy
+
+        # 在深拷贝上修改，嵌套的提供商/缓存配置不会在界面线程被原地改动
+        with self.config.locked():
+            aiforge_config = deepcopy(self.config.aiforge_config)
+        v = values.get
+        try:
+            selected_provider = values["-AIFORGE_DEFAULT_LLM_PROVIDER-"]
+            aiforge_config["default_llm_provider"] = selected_provider
+
+            # 不支持修改AIForge的内置语言
+            # aiforge_config["locale"] = values["-AIFORGE_LOCALE-"]
+
+            # 处理通用配置
+            try:
+                max_rounds = int(values["-AIFORGE_MAXROUNDS-"])
+                if 1 <= max_rounds <= 16:
+                    aiforge_config["max_rounds"] = max_rounds
                 else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+                    aiforge_config["max_rounds"] = 5  # 默认值
+                    self._set("-AIFORGE_MAXROUNDS-", 5)
+            except (ValueError, TypeError):
+                aiforge_config["max_rounds"] = 5  # 默认值
+                self._set("-AIFORGE_MAXROUNDS-", 5)
+
+            # 保存默认最大Tokens
+            try:
+                default_max_tokens = int(v("-AIFORGE_DEFAULT_MAX_TOKENS-", 4096))
+                aiforge_config["max_tokens"] = default_max_tokens
+            except (ValueError, TypeError):
+                aiforge_config["max_tokens"] = 4096
+
+            # 先完成数值校验，避免校验失败时提供商配置只被更新了一部分
+            try:
+                timeout = int(v("-AIFORGE_TIMEOUT-", 30))
+                max_tokens = int(v("-AIFORGE_MAX_TOKENS-", 8192))
+            except (ValueError, TypeError):
+                self._err("超时时间或最大 Tokens 必须是整数")
+                return
+
+            # 更新选中的提供商的所有参数
+            llm_cfg = aiforge_config["llm"].setdefault(selected_provider, {})
+            llm_cfg["type"] = v("-AIFORGE_TYPE-", "")
+            llm_cfg["model"] = v("-AIFORGE_MODEL-", "")
+            llm_cfg["api_key"] = v("-AIFORGE_API_KEY-", "")
+            llm_cfg["base_url"] = v("-AIFORGE_BASE_URL-", "")
+            llm_cfg["timeout"] = timeout
+            llm_cfg["max_tokens"] = max_tokens
+
+            # 处理缓存配置
+            if "cache" not in aiforge_config:
+                aiforge_config["cache"] = {}
+            if "code" not in aiforge_config["cache"]:
+                aiforge_config["cache"]["code"] = {}
+
+            cache_config = aiforge_config["cache"]["code"]
+            cache_config["enabled"] = v("-CACHE_ENABLED-", True)
+
+            try:
+                cache_config["max_modules"] = int(v("-CACHE_MAX_MODULES-", 20))
+                cache_config["failure_threshold"] = float(v("-CACHE_FAILURE_THRESHOLD-", 0.8))
+                cache_config["max_age_days"] = int(v("-CACHE_MAX_AGE_DAYS-", 30))
+                cache_config["cleanup_interval"] = int(v("-CACHE_CLEANUP_INTERVAL-", 10))
+            except (ValueError, TypeError):
+                self._err("缓存配置参数必须是有效的数值")
+                return
+
+            # 保存配置
+            self._save_async({}, "AIForge 配置已保存", aiforge_config=aiforge_config)
+
+        except Exception as e:
+            self._err(f"保存配置时发生错误: {str(e)}")
+
+    def _on_reset_aiforge(self, event, values):
+        """恢复默认 AIForge 配置"""
+        from copy import deepcopy
+
+        aiforge_config = deepcopy(self.config.default_aiforge_config)
+        self._save_async(
+            {},
+            "已恢复默认 AIForge 配置",
+            lambda: self.update_tab("-TAB_AIFORGE-", self.create_aiforge_tab()),
+            aiforge_config=aiforge_config,
+        )
 
-            # 动态更新 AIForge 提供商的所有参数
-            elif event == "-AIFORGE_DEFAULT_LLM_PROVIDER-":
-                try:
-                    selected_provider = values["-AIFORGE_DEFAULT_LLM_PROVIDER-"]
-                    # 获取新选中的提供商的配置
-                    provider_config = self.config.aiforge_config["llm"].get(selected_provider, {})
-                    # 更新所有参数的输入框
-                    self.window["-AIFORGE_TYPE-"].update(value=provider_config.get("type", ""))
-                    self.window["-AIFORGE_MODEL-"].update(value=provider_config.get("model", ""))
-                    self.window["-AIFORGE_API_KEY-"].update(
-                        value=provider_config.get("api_key", "")
-                    )
-                    self.window["-AIFORGE_BASE_URL-"].update(
-                        value=provider_config.get("base_url", "")
-                    )
-                    self.window["-AIFORGE_TIMEOUT-"].update(
-                        value=provider_config.get("timeout", 30)
-                    )
-                    self.window["-AIFORGE_MAX_TOKENS-"].update(
-                        value=provider_config.get("max_tokens", 8192)
-                    )
-                    self.window.refresh()
-                except Exception as e:
-                    sg.popup_error(
-                        f"更新 AIForge 提供商配置失败: {e}",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+    def _on_wechat_sendall(self, event, values):
+        """切换群发选项时启用/禁用群发、标签组ID"""
+        match = _TRAILING_INDEX.search(event)
+        if not match:
+            return
+        # 控件 key 在构建凭证行时已缓存，存在即保证控件存在
+        keys = self._wechat_keys.get(int(match.group(1)))
+        if keys is None:
+            return
+        call_sendall_key, sendall_key, tag_id_key = keys[3:]
+
+        if values.get(call_sendall_key, False):
+            self.window[sendall_key].update(disabled=False)
+            self.window[tag_id_key].update(disabled=values.get(sendall_key, False))
+        else:
+            self.window[sendall_key].update(disabled=True)
+            self.window[tag_id_key].update(disabled=True)
+
+    def _on_dimensional_creative_enabled(self, event, values):
+        """维度化创意总开关：启用/禁用所有相关控件"""
+        enabled = values["-DIMENSIONAL_CREATIVE_ENABLED-"]
+        # 启用/禁用所有相关控件
+        self.window["-CREATIVE_INTENSITY-"].update(disabled=not enabled)
+        self.window["-PRESERVE_CORE_INFO-"].update(disabled=not enabled)
+        self.window["-ALLOW_EXPERIMENTAL-"].update(disabled=not enabled)
+        self.window["-AUTO_DIMENSION_SELECTION-"].update(disabled=not enabled)
+        auto_selection = values["-AUTO_DIMENSION_SELECTION-"]
+        self.window["-MAX_DIMENSIONS-"].update(disabled=not enabled or not auto_selection)
+        self.window["-COMPATIBILITY_THRESHOLD-"].update(disabled=not enabled or not auto_selection)
+
+        # 更新维度选择控件的启用状态
+        self._apply_dimension_disabled_state(enabled, auto_selection)
+
+        self._update_slider_display("-INTENSITY_DISPLAY-", values["-CREATIVE_INTENSITY-"])
+        self._update_slider_display("-THRESHOLD_DISPLAY-", values["-COMPATIBILITY_THRESHOLD-"])
+
+    def _on_auto_dimension_selection(self, event, values):
+        """自动选择维度：启用/禁用最大维度数、兼容性阈值及各维度控件"""
+        enabled = values["-DIMENSIONAL_CREATIVE_ENABLED-"]
+        auto_selection = values["-AUTO_DIMENSION_SELECTION-"]
+        max_dimensions_disabled = not enabled or not auto_selection
+        self.window["-MAX_DIMENSIONS-"].update(disabled=max_dimensions_disabled)
+        compatibility_threshold_disabled = not enabled or not auto_selection
+        self.window["-COMPATIBILITY_THRESHOLD-"].update(disabled=compatibility_threshold_disabled)
+
+        # 更新维度选择控件的启用状态
+        self._apply_dimension_disabled_state(enabled, auto_selection)
+
+    def _update_slider_display(self, key, value):
+        """更新滑块旁的数值显示，拖动中显示文本未变化时不触发 Tk 更新"""
+        text = f"{value:.1f}"
+        if self._display_texts.get(key) != text:
+            self._display_texts[key] = text
+            self.window[key].update(value=text)
+
+    def _on_creative_intensity(self, event, values):
+        """更新创意强度显示值"""
+        self._update_slider_display("-INTENSITY_DISPLAY-", values["-CREATIVE_INTENSITY-"])
+
+    def _on_compatibility_threshold(self, event, values):
+        """更新兼容性阈值显示值"""
+        self._update_slider_display("-THRESHOLD_DISPLAY-", values["-COMPATIBILITY_THRESHOLD-"])
+
+    def _on_dimension_option(self, event, values):
+        """切换维度选项时启用/禁用自定义输入框"""
+        # 当用户选择"自定义"选项时，启用相应的输入框；否则禁用
+        dimension_key = self._dim_key_by_event.get(event)
+        if dimension_key is None:
+            return
+        custom = self._dimension_widgets[dimension_key][2]
+        # 输入框状态已符合且无残留内容时不再更新，在预设选项之间切换不触发任何 Tk 调用
+        if values[event] == _CUSTOM_OPTION:
+            if custom.Disabled:
+                custom.update(disabled=False)
+        elif not custom.Disabled:
+            custom.update(disabled=True, value="")
+        elif custom.get():
+            # 已被总开关/自动选择禁用的输入框也要清掉之前填写的自定义内容
+            custom.update(value="")
+
+    def _on_smart_recommendation(self, event, values):
+        """智能推荐主开关事件"""
+        enabled = values["-SMART_RECOMMENDATION-"]
+        self.window["-TOPIC_BASED-"].update(disabled=not enabled)
+        self.window["-AUDIENCE_BASED-"].update(disabled=not enabled)
+        self.window["-PLATFORM_BASED-"].update(disabled=not enabled)
+
+    def _on_save_creative_config(self, event, values):
+        """保存维度化创意配置"""
+        config = {}
+
+        # 获取现有的维度化创意配置：只复制会被修改的层级，预设选项等大列表不做深拷贝
+        dimensional_creative_config = dict(self.config.get_config().get("dimensional_creative", {}))
+        dimensional_creative_config["dimension_options"] = {
+            key: dict(data)
+            for key, data in dimensional_creative_config.get("dimension_options", {}).items()
+        }
 
-            # 保存 AIForge 配置
-            elif event.startswith("-SAVE_AIFORGE-"):
-                aiforge_config = self.config.aiforge_config.copy()
-                try:
-                    selected_provider = values["-AIFORGE_DEFAULT_LLM_PROVIDER-"]
-                    aiforge_config["default_llm_provider"] = selected_provider
-
-                    # 不支持修改AIForge的内置语言
-                    # aiforge_config["locale"] = values["-AIFORGE_LOCALE-"]
-
-                    # 处理通用配置
-                    try:
-                        max_rounds = int(values["-AIFORGE_MAXROUNDS-"])
-                        if 1 <= max_rounds <= 16:
-                            aiforge_config["max_rounds"] = max_rounds
-                        else:
-                            aiforge_config["max_rounds"] = 5  # 默认值
-                            self.window["-AIFORGE_MAXROUNDS-"].update(value=5)
-                    except (ValueError, TypeError):
-                        aiforge_config["max_rounds"] = 5  # 默认值
-                        self.window["-AIFORGE_MAXROUNDS-"].update(value=5)
-
-                    # 保存默认最大Tokens
-                    try:
-                        default_max_tokens = int(values.get("-AIFORGE_DEFAULT_MAX_TOKENS-", 4096))
-                        aiforge_config["max_tokens"] = default_max_tokens
-                    except (ValueError, TypeError):
-                        aiforge_config["max_tokens"] = 4096
-
-                    # 更新选中的提供商的所有参数
-                    aiforge_config["llm"][selected_provider]["type"] = values.get(
-                        "-AIFORGE_TYPE-", ""
-                    )
-                    aiforge_config["llm"][selected_provider]["model"] = values.get(
-                        "-AIFORGE_MODEL-", ""
-                    )
-                    aiforge_config["llm"][selected_provider]["api_key"] = values.get(
-                        "-AIFORGE_API_KEY-", ""
-                    )
-                    aiforge_config["llm"][selected_provider]["base_url"] = values.get(
-                        "-AIFORGE_BASE_URL-", ""
-                    )
+        # 更新基础配置项
+        dimensional_creative_config.update(
+            {
+                "enabled": values["-DIMENSIONAL_CREATIVE_ENABLED-"],
+                "creative_intensity": values["-CREATIVE_INTENSITY-"],
+                "preserve_core_info": values["-PRESERVE_CORE_INFO-"],
+                "allow_experimental": values["-ALLOW_EXPERIMENTAL-"],
+                "auto_dimension_selection": values["-AUTO_DIMENSION_SELECTION-"],
+                # 转为列表写入，YAML 中保持普通序列
+                "priority_categories": list(_PRIORITY_CATEGORIES),
+                "max_dimensions": int(values["-MAX_DIMENSIONS-"]),
+                "compatibility_threshold": values["-COMPATIBILITY_THRESHOLD-"],
+                "available_categories": list(_AVAILABLE_CATEGORIES),
+            }
+        )
 
-                    try:
-                        aiforge_config["llm"][selected_provider]["timeout"] = int(
-                            values.get("-AIFORGE_TIMEOUT-", 30)
-                        )
-                        aiforge_config["llm"][selected_provider]["max_tokens"] = int(
-                            values.get("-AIFORGE_MAX_TOKENS-", 8192)
-                        )
-                    except (ValueError, TypeError):
-                        sg.popup_error(
-                            "超时时间或最大 Tokens 必须是整数",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        return
-
-                    # 处理缓存配置
-                    if "cache" not in aiforge_config:
-                        aiforge_config["cache"] = {}
-                    if "code" not in aiforge_config["cache"]:
-                        aiforge_config["cache"]["code"] = {}
-
-                    cache_config = aiforge_config["cache"]["code"]
-                    cache_config["enabled"] = values.get("-CACHE_ENABLED-", True)
-
-                    try:
-                        cache_config["max_modules"] = int(values.get("-CACHE_MAX_MODULES-", 20))
-                        cache_config["failure_threshold"] = float(
-                            values.get("-CACHE_FAILURE_THRESHOLD-", 0.8)
-                        )
-                        cache_config["max_age_days"] = int(values.get("-CACHE_MAX_AGE_DAYS-", 30))
-                        cache_config["cleanup_interval"] = int(
-                            values.get("-CACHE_CLEANUP_INTERVAL-", 10)
-                        )
-                    except (ValueError, TypeError):
-                        sg.popup_error(
-                            "缓存配置参数必须是有效的数值",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        return
-
-                    # 保存配置
-                    if self.config.save_config(self.config.get_config(), aiforge_config):
-                        sg.popup(
-                            "AIForge 配置已保存",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                    else:
-                        sg.popup_error(
-                            self.config.error_message,
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
+        # 获取维度选项配置并更新选中选项
+        dimension_options = dimensional_creative_config["dimension_options"]
 
-                except Exception as e:
-                    sg.popup_error(
-                        f"保存配置时发生错误: {str(e)}",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-            # 恢复默认 AIForge 配置
-            elif event.startswith("-RESET_AIFORGE-"):
-                aiforge_config = copy.deepcopy(self.config.default_aiforge_config)
-                if self.config.save_config(self.config.get_config(), aiforge_config):
-                    self.update_tab("-TAB_AIFORGE-", self.create_aiforge_tab())
-                    sg.popup(
-                        "已恢复默认 AIForge 配置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        # 创建启用维度的配置，以及启用维度中选定了预设选项的维度列表
+        enabled_dimensions = {}
+        selected_dimensions = []
 
-            elif event.startswith("-WECHAT_CALL_SENDALL_") or event.startswith("-WECHAT_SENDALL_"):
-                match = re.search(r"_(\d+)-$", event)
-                if match:
-                    index = int(match.group(1))
-                    call_sendall_key = f"-WECHAT_CALL_SENDALL_{index}-"
-                    sendall_key = f"-WECHAT_SENDALL_{index}-"
-                    tag_id_key = f"-WECHAT_TAG_ID_{index}-"
-
-                    if all(
-                        key in self.window.AllKeysDict
-                        for key in [call_sendall_key, sendall_key, tag_id_key]
-                    ):
-                        call_sendall_enabled = values.get(call_sendall_key, False)
-                        sendall_enabled = values.get(sendall_key, False)
-
-                        if call_sendall_enabled:
-                            self.window[sendall_key].update(disabled=False)
-                            if sendall_enabled:
-                                self.window[tag_id_key].update(disabled=True)
-                            else:
-                                self.window[tag_id_key].update(disabled=False)
-                        else:
-                            self.window[sendall_key].update(disabled=True)
-                            self.window[tag_id_key].update(disabled=True)
-
-            # 创意模式相关事件
-            elif event in [
-                "-DIMENSIONAL_CREATIVE_ENABLED-",
-                "-AUTO_DIMENSION_SELECTION-",
-                "-CREATIVE_INTENSITY-",
-                "-COMPATIBILITY_THRESHOLD-",
-            ]:
-                # 动态启用/禁用相关控件
-                if event == "-DIMENSIONAL_CREATIVE_ENABLED-":
-                    enabled = values["-DIMENSIONAL_CREATIVE_ENABLED-"]
-                    # 启用/禁用所有相关控件
-                    self.window["-CREATIVE_INTENSITY-"].update(disabled=not enabled)
-                    self.window["-PRESERVE_CORE_INFO-"].update(disabled=not enabled)
-                    self.window["-ALLOW_EXPERIMENTAL-"].update(disabled=not enabled)
-                    self.window["-AUTO_DIMENSION_SELECTION-"].update(disabled=not enabled)
-                    auto_selection = values["-AUTO_DIMENSION_SELECTION-"]
-                    self.window["-MAX_DIMENSIONS-"].update(
-                        disabled=not enabled or not auto_selection
-                    )
-                    self.window["-COMPATIBILITY_THRESHOLD-"].update(
-                        disabled=not enabled or not auto_selection
-                    )
+        # 一次遍历同时更新每个维度的选中选项、启用状态和选中维度
+        for dimension_key, dimension_data in dimension_options.items():
+            dim_keys = self._dim_keys[dimension_key]
+            # 获取选中的选项显示文本
+            selected_display = values[dim_keys.combo]
+            option = None
+
+            # 如果是"自动选择"，则selected_option为空
+            if selected_display == _AUTO_OPTION:
+                dimension_data["selected_option"] = ""
+            # 如果是"自定义"，则selected_option为"custom"
+            elif selected_display == _CUSTOM_OPTION:
+                dimension_data["selected_option"] = "custom"
+                # 获取自定义输入值
+                custom_input = values[dim_keys.custom]
+                dimension_data["custom_input"] = custom_input
+            else:
+                # 通过构建 TAB 时建立的显示文本索引找到对应的预设选项
+                option = self._dim_option_index[dimension_key].get(selected_display)
+                if option:
+                    dimension_data["selected_option"] = option["name"]
+                    # 清除自定义输入
+                    dimension_data["custom_input"] = ""
+
+            # 获取维度启用状态
+            enabled_state = values[dim_keys.enabled]
+            enabled_dimensions[dimension_key] = enabled_state
+            if option and enabled_state:
+                selected_dimensions.append({"category": dimension_key, "option": option["name"]})
 
-                    # 更新维度选择控件的启用状态 - 修正配置获取路径
-                    config = self.config.get_config()
-                    dimensional_config = config.get("dimensional_creative", {})  # 直接获取
-                    dimension_options = dimensional_config.get("dimension_options", {})
-
-                    for dimension_key in dimension_options.keys():
-                        # 禁用/启用维度下拉框
-                        self.window[f"-DIMENSION_{dimension_key.upper()}-"].update(
-                            disabled=not enabled or auto_selection
-                        )
-                        # 禁用/启用维度勾选框
-                        self.window[f"-DIMENSION_ENABLED_{dimension_key.upper()}-"].update(
-                            disabled=not enabled or auto_selection
-                        )
-
-                    intensity_text = f"{values['-CREATIVE_INTENSITY-']:.1f}"
-                    threshold_text = f"{values['-COMPATIBILITY_THRESHOLD-']:.1f}"
-                    self.window["-INTENSITY_DISPLAY-"].update(value=intensity_text)
-                    self.window["-THRESHOLD_DISPLAY-"].update(value=threshold_text)
-
-                elif event == "-AUTO_DIMENSION_SELECTION-":
-                    enabled = values["-DIMENSIONAL_CREATIVE_ENABLED-"]
-                    auto_selection = values["-AUTO_DIMENSION_SELECTION-"]
-                    max_dimensions_disabled = not enabled or not auto_selection
-                    self.window["-MAX_DIMENSIONS-"].update(disabled=max_dimensions_disabled)
-                    compatibility_threshold_disabled = not enabled or not auto_selection
-                    self.window["-COMPATIBILITY_THRESHOLD-"].update(
-                        disabled=compatibility_threshold_disabled
-                    )
+        # 将更新后的维度选项配置添加到维度化创意配置中
+        dimensional_creative_config["dimension_options"] = dimension_options
+        dimensional_creative_config["enabled_dimensions"] = enabled_dimensions
+        dimensional_creative_config["selected_dimensions"] = selected_dimensions
 
-                    # 更新维度选择控件的启用状态 - 修正配置获取路径
-                    config = self.config.get_config()
-                    dimensional_config = config.get("dimensional_creative", {})  # 直接获取
-                    dimension_options = dimensional_config.get("dimension_options", {})
-
-                    for dimension_key in dimension_options.keys():
-                        self.window[f"-DIMENSION_{dimension_key.upper()}-"].update(
-                            disabled=not enabled or auto_selection
-                        )
-                        self.window[f"-DIMENSION_ENABLED_{dimension_key.upper()}-"].update(
-                            disabled=not enabled or auto_selection
-                        )
-
-                elif event == "-CREATIVE_INTENSITY-":
-                    intensity_text = f"{values['-CREATIVE_INTENSITY-']:.1f}"
-                    self.window["-INTENSITY_DISPLAY-"].update(value=intensity_text)
-
-                elif event == "-COMPATIBILITY_THRESHOLD-":
-                    threshold_text = f"{values['-COMPATIBILITY_THRESHOLD-']:.1f}"
-                    self.window["-THRESHOLD_DISPLAY-"].update(value=threshold_text)
-            elif event.startswith("-DIMENSION_") and event.endswith("-"):
-                # 处理维度选项选择事件
-                # 当用户选择"自定义"选项时，启用相应的输入框；否则禁用
-                try:
-                    selected_option = values.get(event, "自动选择")
-                    # 构造对应的自定义输入框键名
-                    # 从事件名中提取维度键名，例如：-DIMENSION_STYLE- -> STYLE
-                    if "-DIMENSION_" in event and event.endswith("-"):
-                        # 查找"-DIMENSION_"和最后一个"-"的位置
-                        start_idx = event.find("-DIMENSION_") + len("-DIMENSION_")
-                        end_idx = event.rfind("-")
-                        if start_idx < end_idx:
-                            dimension_key = event[start_idx:end_idx]
-                            custom_input_key = f"-DIMENSION_{dimension_key}_CUSTOM-"
-
-                            # 直接根据选项值设置输入框的disabled状态
-                            if custom_input_key in self.window.AllKeysDict:
-                                if selected_option == "自定义":
-                                    self.window[custom_input_key].update(disabled=False)
-                                else:
-                                    self.window[custom_input_key].update(disabled=True, value="")
+        config["dimensional_creative"] = dimensional_creative_config
 
-                    self.window.refresh()
-                except Exception:
-                    # 忽略可能的错误，避免程序崩溃
-                    pass
+        intensity = values["-CREATIVE_INTENSITY-"]
+        threshold = values["-COMPATIBILITY_THRESHOLD-"]
 
-            elif event.startswith("-DIMENSION_ENABLED_") and event.endswith("-"):
-                # 处理维度启用/禁用事件
-                try:
-                    # 安全地提取维度键名
-                    prefix = "-DIMENSION_ENABLED_"
-                    suffix = "-"
-                    if len(event) > len(prefix) + len(suffix):
-                        dimension_key = event[len(prefix) : -len(suffix)].lower()  # noqa 501
-                        enabled = values.get(event, False)
-
-                        # 构造对应的维度选择下拉框键名
-                        combo_key = f"-DIMENSION_{dimension_key.upper()}-"
-                        dimensional_enabled = values.get("-DIMENSIONAL_CREATIVE_ENABLED-", True)
-
-                        # 使用更安全的方式访问窗口元素
-                        # 检查键是否在AllKeysDict中（PySimpleGUI内部维护的所有键）
-                        if combo_key in self.window.AllKeysDict:
-                            # 通过AllKeysDict获取元素引用
-                            element = self.window.AllKeysDict[combo_key]
-                            # 检查元素是否有update方法且可调用
-                            has_update = hasattr(element, "update")
-                            is_callable = callable(getattr(element, "update", None))
-                            if has_update and is_callable:
-                                # 获取自动选择状态
-                                auto_selection = values.get("-AUTO_DIMENSION_SELECTION-", False)
-                                self.window[combo_key].update(
-                                    disabled=(
-                                        not dimensional_enabled or not enabled or auto_selection
-                                    )
-                                )
-                        # 如果键不在AllKeysDict中，可以添加一些调试信息
-                        # 但为了避免影响用户体验，这里只是静默处理
-                except Exception:
-                    # 忽略可能的错误，避免程序崩溃
-                    pass
-            elif event == "-SMART_RECOMMENDATION-":
-                # 智能推荐主开关事件
-                enabled = values["-SMART_RECOMMENDATION-"]
-                self.window["-TOPIC_BASED-"].update(disabled=not enabled)
-                self.window["-AUDIENCE_BASED-"].update(disabled=not enabled)
-                self.window["-PLATFORM_BASED-"].update(disabled=not enabled)
-
-            elif event == "-SAVE_CREATIVE_CONFIG-":
-                config = self.config.get_config().copy()
-
-                # 获取现有的维度化创意配置
-                dimensional_creative_config = config.get("dimensional_creative", {}).copy()
-
-                # 更新基础配置项
-                dimensional_creative_config.update(
-                    {
-                        "enabled": values["-DIMENSIONAL_CREATIVE_ENABLED-"],
-                        "creative_intensity": values["-CREATIVE_INTENSITY-"],
-                        "preserve_core_info": values["-PRESERVE_CORE_INFO-"],
-                        "allow_experimental": values["-ALLOW_EXPERIMENTAL-"],
-                        "auto_dimension_selection": values["-AUTO_DIMENSION_SELECTION-"],
-                        "selected_dimensions": self._collect_selected_dimensions(
-                            values, dimensional_creative_config.get("dimension_options", {})
-                        ),
-                        "priority_categories": ["emotion", "audience", "style", "theme"],
-                        "max_dimensions": int(values["-MAX_DIMENSIONS-"]),
-                        "compatibility_threshold": values["-COMPATIBILITY_THRESHOLD-"],
-                        "available_categories": [
-                            "style",  # 文体风格
-                            "culture",  # 文化视角
-                            "time",  # 时空背景
-                            "personality",  # 人格角色
-                            "emotion",  # 情感调性
-                            "format",  # 表达格式
-                            "scene",  # 场景环境
-                            "audience",  # 目标受众
-                            "theme",  # 主题内容
-                            "technique",  # 表现技法
-                            "language",  # 语言风格
-                            "tone",  # 语调语气
-                            "perspective",  # 叙述视角
-                            "structure",  # 文章结构
-                            "rhythm",  # 节奏韵律
-                        ],
-                    }
-                )
+        def on_saved():
+            # 更新显示值
+            self._update_slider_display("-INTENSITY_DISPLAY-", intensity)
+            self._update_slider_display("-THRESHOLD_DISPLAY-", threshold)
 
-                # 获取维度选项配置并更新选中选项
-                dimension_options = dimensional_creative_config.get("dimension_options", {})
+        self._save_async(config, "维度化创意配置已保存", on_saved)
 
-                # 创建启用维度的配置
-                enabled_dimensions = {}
+    def _on_reset_creative_config(self, event, values):
+        """恢复默认维度化创意配置"""
+        # 重置为默认配置
+        config = {}
+        config["dimensional_creative"] = self.config.get_default_config("dimensional_creative")
 
-                # 更新每个维度的选中选项和启用状态
-                for dimension_key, dimension_data in dimension_options.items():
-                    # 获取选中的选项显示文本
-                    selected_display = values.get(
-                        f"-DIMENSION_{dimension_key.upper()}-", "自动选择"
-                    )
+        def on_saved():
+            # 维度及预设选项结构未变化时只更新控件状态，否则重建整个 TAB
+            if not self._apply_creative_config(config["dimensional_creative"]):
+                self.update_tab("-TAB_CREATIVE-", self.create_creative_tab())
 
-                    # 如果是"自动选择"，则selected_option为空
-                    if selected_display == "自动选择":
-                        dimension_options[dimension_key]["selected_option"] = ""
-                    # 如果是"自定义"，则selected_option为"custom"
-                    elif selected_display == "自定义":
-                        dimension_options[dimension_key]["selected_option"] = "custom"
-                        # 获取自定义输入值
-                        custom_input = values.get(f"-DIMENSION_{dimension_key.upper()}_CUSTOM-", "")
-                        dimension_options[dimension_key]["custom_input"] = custom_input
-                    else:
-                        # 从显示文本中提取选项名称
-                        # 通过遍历预设选项找到匹配的选项
-                        for option in dimension_data.get("preset_options", []):
-                            display_text = f"{option['value']} ({option['description']})"
-                            if display_text == selected_display:
-                                dimension_options[dimension_key]["selected_option"] = option["name"]
-                                # 清除自定义输入
-                                dimension_options[dimension_key]["custom_input"] = ""
-                                break
-
-                    # 获取维度启用状态
-                    enabled_state = values.get(f"-DIMENSION_ENABLED_{dimension_key.upper()}-", True)
-                    enabled_dimensions[dimension_key] = enabled_state
-
-                # 将更新后的维度选项配置添加到维度化创意配置中
-                dimensional_creative_config["dimension_options"] = dimension_options
-                dimensional_creative_config["enabled_dimensions"] = enabled_dimensions
-
-                config["dimensional_creative"] = dimensional_creative_config
-
-                if self.config.save_config(config):
-                    # 更新显示值
-                    intensity_text = f"{values['-CREATIVE_INTENSITY-']:.1f}"
-                    threshold_text = f"{values['-COMPATIBILITY_THRESHOLD-']:.1f}"
-                    self.window["-INTENSITY_DISPLAY-"].update(value=intensity_text)
-                    self.window["-THRESHOLD_DISPLAY-"].update(value=threshold_text)
-
-                    sg.popup(
-                        "维度化创意配置已保存",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        self._save_async(config, "维度化创意配置已重置", on_saved)
 
-            elif event == "-RESET_CREATIVE_CONFIG-":
-                # 重置为默认配置
-                config = self.config.get_config().copy()
-                config["dimensional_creative"] = self.config.default_config["dimensional_creative"]
-
-                if self.config.save_config(config):
-                    # 更新界面
-                    self.update_tab("-TAB_CREATIVE-", self.create_creative_tab())
-                    sg.popup(
-                        "维度化创意配置已重置",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    sg.popup_error(
-                        self.config.error_message,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+    def _apply_creative_config(self, dimensional_config):
+        """按配置就地更新创意 TAB 的控件，结构与当前控件不一致时返回 False 由调用方重建"""
+        if not self._tab_built.get("-TAB_CREATIVE-", True):
+            # 尚未构建的 TAB 首次选中时会按最新配置构建
+            return True
+
+        dimension_options = dimensional_config.get("dimension_options", {})
+        if list(dimension_options) != list(self._dim_keys):
+            return False
+        option_indexes = {}
+        for dimension_key, dimension_data in dimension_options.items():
+            display_to_option = {
+                f"{option['value']} ({option['description']})": option
+                for option in dimension_data.get("preset_options", [])
+            }
+            if list(display_to_option) != list(self._dim_option_index[dimension_key]):
+                return False
+            option_indexes[dimension_key] = display_to_option
+
+        enabled_dimensions = dimensional_config.get("enabled_dimensions", {})
+        dim_enabled = dimensional_config.get("enabled", True)
+        auto_select = dimensional_config.get("auto_dimension_selection", False)
+        dim_disabled = not dim_enabled or auto_select
+        auto_disabled = not dim_enabled or not auto_select
+        intensity = dimensional_config.get("creative_intensity", 1.0)
+        threshold = dimensional_config.get("compatibility_threshold", 0.6)
+
+        window = self.window
+        window["-DIMENSIONAL_CREATIVE_ENABLED-"].update(value=dim_enabled)
+        window["-CREATIVE_INTENSITY-"].update(value=intensity, disabled=not dim_enabled)
+        window["-PRESERVE_CORE_INFO-"].update(
+            value=dimensional_config.get("preserve_core_info", True), disabled=not dim_enabled
+        )
+        window["-ALLOW_EXPERIMENTAL-"].update(
+            value=dimensional_config.get("allow_experimental", False), disabled=not dim_enabled
+        )
+        window["-AUTO_DIMENSION_SELECTION-"].update(value=auto_select, disabled=not dim_enabled)
+        window["-MAX_DIMENSIONS-"].update(
+            value=dimensional_config.get("max_dimensions", 0), disabled=auto_disabled
+        )
+        window["-COMPATIBILITY_THRESHOLD-"].update(value=threshold, disabled=auto_disabled)
+        self._update_slider_display("-INTENSITY_DISPLAY-", intensity)
+        self._update_slider_display("-THRESHOLD_DISPLAY-", threshold)
+
+        for dimension_key, dimension_data in dimension_options.items():
+            checkbox, combo, custom = self._dimension_widgets[dimension_key]
+            display_to_option = option_indexes[dimension_key]
+            selected_option = dimension_data.get("selected_option", "")
+            selected_display = _AUTO_OPTION
+            if selected_option == "custom":
+                selected_display = _CUSTOM_OPTION
+            elif selected_option:
+                selected_display = next(
+                    (
+                        display
+                        for display, option in display_to_option.items()
+                        if option["name"] == selected_option
+                    ),
+                    _AUTO_OPTION,
+                )
+            dimension_enabled = enabled_dimensions.get(dimension_key, True)
+
+            checkbox.update(value=dimension_enabled, disabled=dim_disabled)
+            combo.update(value=selected_display, disabled=dim_disabled)
+            custom.update(
+                value=dimension_data.get("custom_input", ""),
+                disabled=(
+                    not dim_enabled or not dimension_enabled or selected_display != _CUSTOM_OPTION
+                ),
+            )
+        self._dim_option_index = option_indexes
+        self._last_dim_disabled = dim_disabled
+        return True
+
+    def run(self):
+        while True:
+            # 有未完成的保存时定时醒来取回结果，否则一直阻塞等待界面事件
+            event, values = self.window.read(  # type: ignore
+                timeout=_SAVE_POLL_MS if self._saves_pending else None
+            )
+            if event in (sg.WIN_CLOSED, "-EXIT-"):
+                break
+            handler = self._get_event_handler(event)
+            if handler is not None:
+                handler(event, values)
 
+        # 后台线程不依赖界面线程，可先关闭窗口再等待它写完积压的配置并退出，
+        # 之后仍提示关闭前后完成的保存中失败的部分
+        self._save_queue.put(_SAVE_STOP)
         self.window.close()
+        self._save_thread.join()
+        self._handle_save_results(closing=True)
 
 
 def gui_start():
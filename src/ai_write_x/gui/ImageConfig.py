@@ -6,14 +6,20 @@
 
 import sys
 import os
+import atexit
 import glob
+import hashlib
 import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 import PySimpleGUI as sg
 from PIL import Image
 import io
 import subprocess
 import tempfile
+from pathlib import Path
 
 
 from ai_write_x.utils import utils
@@ -25,6 +31,133 @@ __author__ = "iniwaper@gmail.com"
 __copyright__ = "Copyright (C) 2025 iniwap"
 __date__ = "2025/07/10"
 
+# 图库支持的图片扩展名，列表显示与添加图片使用同一组格式
+# 元组供 str.endswith 一次匹配整组后缀，集合供已拆出的扩展名做常数时间查找
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".bmp")
+_IMAGE_EXTENSION_SET = frozenset(_IMAGE_EXTENSIONS)
+
+# 缩略图磁盘缓存最多保留的文件数
+_THUMB_CACHE_LIMIT = 500
+# 内存中保留的最近使用缩略图数量，来回切换预览同几张图片时不必再读磁盘
+_THUMB_MEMORY_LIMIT = 32
+# 图片列表刷新的合并等待时间（毫秒），连续的增删操作只重绘一次列表
+_LIST_REFRESH_DELAY_MS = 50
+
+# 默认预览图片内容固定不变，首次使用时绘制并缓存
+_DEFAULT_PREVIEW_PNG = None
+
+# 各平台按优先级尝试的文章编辑器命令（第一个为可执行文件，其余为参数）
+_EDITORS_BY_PLATFORM = {
+    "win32": (
+        "cursor",
+        "qoder",
+        "trae",
+        "windsurf",
+        "zed",
+        "tabby",
+        "code",
+        "subl",
+        "notepad++",
+        "webstorm",
+        "phpstorm",
+        "pycharm",
+        "idea",
+        "brackets",
+        "gvim",
+        "emacs",
+        "notepad",
+    ),
+    "darwin": (
+        "cursor",
+        "trae",
+        "qoder",
+        "windsurf",
+        "zed",
+        "tabby",
+        "code",
+        "subl",
+        "webstorm",
+        "phpstorm",
+        "pycharm",
+        "idea",
+        "brackets",
+        "open -a TextEdit",
+        "vim",
+        "emacs",
+    ),
+    "linux": (
+        "cursor",
+        "trae",
+        "qoder",
+        "windsurf",
+        "zed",
+        "tabby",
+        "code",
+        "subl",
+        "webstorm",
+        "phpstorm",
+        "pycharm",
+        "idea",
+        "brackets",
+        "gvim",
+        "emacs",
+        "gedit",
+        "nano",
+    ),
+}
+
+
+def _get_default_preview():
+    """获取默认预览图片（白色背景，带文字提示），只绘制一次后复用"""
+    global _DEFAULT_PREVIEW_PNG
+    if _DEFAULT_PREVIEW_PNG is None:
+        _DEFAULT_PREVIEW_PNG = _render_default_preview()
+    return _DEFAULT_PREVIEW_PNG
+
+
+def _render_default_preview():
+    """绘制默认预览图片，返回 PNG 字节数据"""
+    try:
+        # 创建白色背景图片
+        img = Image.new("RGB", (400, 200), (255, 255, 255))
+
+        # 添加文字提示
+        from PIL import ImageDraw, ImageFont
+
+        draw = ImageDraw.Draw(img)
+
+        text = "选中图片以预览"
+
+        # 尝试使用系统字体，如果失败则使用默认字体
+        try:
+            # Windows 系统字体
+            font = ImageFont.truetype("msyh.ttc", 16)  # 微软雅黑
+        except Exception:
+            try:
+                font = ImageFont.truetype("arial.ttf", 16)
+            except Exception:
+                font = ImageFont.load_default()
+
+        # 获取文字尺寸并居中
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        x = (400 - text_width) // 2
+        y = (200 - text_height) // 2
+
+        # 绘制文字
+        draw.text((x, y), text, fill=(128, 128, 128), font=font)
+
+        bio = io.BytesIO()
+        img.save(bio, format="PNG")
+        return bio.getvalue()
+    except Exception:
+        # 如果出错，返回纯白色背景
+        img = Image.new("RGB", (400, 200), (255, 255, 255))
+        bio = io.BytesIO()
+        img.save(bio, format="PNG")
+        return bio.getvalue()
+
 
 class ImageConfigWindow:
     def __init__(self, article):
@@ -36,142 +169,315 @@ class ImageConfigWindow:
         self.right_clicked_item = None  # 存储右键点击的项目
         self.current_preview_file = None  # 当前预览的文件路径
         self.current_preview_filename = None  # 当前预览的文件名
+        self._current_preview_html_path = None  # 当前预览图片写入文章时使用的正斜杠路径
         self.current_cover_filename = None  # 当前封面文件名
+        # 按钮组当前的启用状态（与布局中的初始 disabled=True 一致），状态不变时不再更新控件
+        self._cover_buttons_enabled = False  # 预览封面 / 清除封面
+        self._preview_buttons_enabled = False  # 预览图→封面 / 预览图→替换链接
+        self._preferred_editor = None  # 上次成功打开文章的编辑器命令
+        self._icon = utils.get_gui_icon()  # 窗口和各弹窗共用的图标
+        self.temp_files = []  # 预览文章生成的临时文件
+        self._temp_dir = None  # 存放预览临时文件的专用目录，首次预览时创建
+        # 窗口未正常结束（如异常退出）时，进程退出前同样清理临时文件
+        atexit.register(self._cleanup_temp_files)
 
         # 确保图片目录存在
         if not os.path.exists(self.image_dir):
             os.makedirs(self.image_dir)
 
-        # 读取文章内容
+        # 以分隔符结尾的图片目录，图库内文件路径直接拼接文件名，无需每次调用 os.path.join
+        self._image_prefix = self.image_dir.rstrip("/\\") + os.sep
+
+        # 统一为正斜杠并以 "/" 结尾的图片目录，用于判断文章中的图片是否来自本地图库
+        self._norm_image_dir = self.image_dir.replace("\\", "/").rstrip("/") + "/"
+
+        # 预览缩略图磁盘缓存目录，避免每次选中图片都重新解码、缩放原图。
+        # 放在临时目录而非图库内：图库目录会作为静态资源对外提供，且其修改时间用于判断列表缓存是否失效
+        self._thumb_dir = os.path.join(str(PathManager.get_temp_dir()), "image_thumbs")
+        os.makedirs(self._thumb_dir, exist_ok=True)
+
+        # 后台任务线程池：预览图解码缩放（只显示最近一次选中图片的结果）、批量删除等
+        self._worker_pool = ThreadPoolExecutor(max_workers=2)
+        self._closing = False  # 窗口关闭后后台任务不再向窗口投递事件
+        self._preview_gen = 0
+        # 各线程独立复用的图片编码缓冲区
+        self._encode_local = threading.local()
+        # 缩略图内存 LRU，键为磁盘缓存路径（已包含原图、修改时间、大小和目标尺寸）
+        self._thumb_memory = OrderedDict()
+        self._thumb_memory_lock = threading.Lock()
+
+        # 图片列表缓存，目录修改时间变化或本窗口增删改图片后重新扫描
+        self._image_files = []
+        self._image_files_mtime = None
+        self._image_index_files = None  # 生成 _image_index 时对应的文件列表
+        self._image_index = {}  # 文件名 -> 列表框行号，显示的列表变化后按需重建
+        self._displayed_image_files = None  # 图片库列表框当前显示的文件列表
+        self._pending_list_refresh = False
+
+        # 图片URL提取结果及其对应的文章内容，内容被替换为新字符串后重新提取
+        self._image_urls_content = None
+        self._image_urls = []
+
+        # 读取文章内容，同时记录文件修改时间和大小，恢复默认时文件未变化则不再重新读取
+        self._article_content = ""
+        self._article_stamp = None
         try:
-            with open(self.article["path"], "r", encoding="utf-8") as f:
-                self.modified_content = f.read()
+            self.modified_content = self._load_article()
         except Exception:
             self.modified_content = ""
 
         self.original_image_urls = self._get_article_image_urls()  # 保存初始URL列表
         self.replacement_mapping = {}  # 跟踪每个位置的替换情况
+        # 图片URL位置表及其对应的文章内容，内容被替换为新字符串后重新计算
+        self._url_positions_content = None
+        self._url_positions_urls = []
+        self._url_positions = []
 
-        sg.theme("systemdefault")
+        self._init_event_handlers()
 
-    def _reset_preview_to_default(self):
-        """重置预览图片为默认白色背景，带文字提示"""
-        try:
-            # 创建白色背景图片
-            img = Image.new("RGB", (400, 200), (255, 255, 255))
-
-            # 添加文字提示
-            from PIL import ImageDraw, ImageFont
+        # 缩略图缓存超过上限时在后台清理最久未使用的条目
+        self._worker_pool.submit(self._sweep_thumbs)
 
-            draw = ImageDraw.Draw(img)
+        sg.theme("systemdefault")
 
-            text = "选中图片以预览"
+    def _get_article_stamp(self):
+        """获取文章文件的 (修改时间, 大小)，用于判断文件是否变化"""
+        stat = os.stat(self.article["path"])
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_article(self):
+        """读取文章内容，文件自上次读取或保存后未变化时直接返回内存中的内容"""
+        stamp = self._get_article_stamp()
+        if stamp != self._article_stamp:
+            self._article_content = Path(self.article["path"]).read_text(encoding="utf-8")
+            self._article_stamp = stamp
+        return self._article_content
+
+    def _open_in_editor(self, path):
+        """依次尝试已安装的编辑器打开文章，上次成功的编辑器优先，成功返回 True"""
+        editors = _EDITORS_BY_PLATFORM.get(sys.platform, _EDITORS_BY_PLATFORM["linux"])
+        if self._preferred_editor:
+            editors = (self._preferred_editor, *editors)
+
+        for editor_cmd in editors:
+            program, *args = editor_cmd.split()
+            # 未安装的编辑器直接跳过，不再为每个候选启动一次 shell
+            executable = shutil.which(program)
+            if not executable:
+                continue
+            try:
+                subprocess.Popen([executable, *args, path], stderr=subprocess.DEVNULL)
+            except OSError:
+                continue
+            self._preferred_editor = editor_cmd
+            return True
+        return False
 
-            # 尝试使用系统字体，如果失败则使用默认字体
+    def _reset_preview_to_default(self):
+        """重置预览图片为默认白色背景，带文字提示"""
+        return _get_default_preview()
+
+    def _set_current_preview(self, filename):
+        """记录当前预览的图片，同时算好其完整路径和写入文章用的路径（None 表示清空）"""
+        self.current_preview_filename = filename
+        if filename is None:
+            self.current_preview_file = None
+            self._current_preview_html_path = None
+        else:
+            self.current_preview_file = self._image_prefix + filename
+            self._current_preview_html_path = self.current_preview_file.replace("\\", "/")
+
+    def _cleanup_temp_files(self, keep=0):
+        """删除预览文章的临时文件，只保留最近的 keep 个（keep 为 0 时整个临时目录一并删除）"""
+        if not keep and self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+            self.temp_files = []
+            return
+
+        while len(self.temp_files) > keep:
+            temp_file = self.temp_files.pop(0)
             try:
-                # Windows 系统字体
-                font = ImageFont.truetype("msyh.ttc", 16)  # 微软雅黑
-            except Exception:
-                try:
-                    font = ImageFont.truetype("arial.ttf", 16)
-                except Exception:
-                    font = ImageFont.load_default()
-
-            # 获取文字尺寸并居中
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            x = (400 - text_width) // 2
-            y = (200 - text_height) // 2
-
-            # 绘制文字
-            draw.text((x, y), text, fill=(128, 128, 128), font=font)
-
-            bio = io.BytesIO()
-            img.save(bio, format="PNG")
-            return bio.getvalue()
-        except Exception:
-            # 如果出错，返回纯白色背景
-            img = Image.new("RGB", (400, 200), (255, 255, 255))
-            bio = io.BytesIO()
-            img.save(bio, format="PNG")
-            return bio.getvalue()
+                os.remove(temp_file)
+            except OSError:
+                pass
 
     def _rename_image(self, old_filename, new_filename):
         """重命名图片文件"""
-        old_path = os.path.join(self.image_dir, old_filename)
-        new_path = os.path.join(self.image_dir, new_filename)
+        old_path = self._image_prefix + old_filename
+        new_path = self._image_prefix + new_filename
 
         try:
             os.rename(old_path, new_path)
+            self._image_files_mtime = None
+            self._invalidate_thumbs(old_path)
             return True
         except Exception:
             return False
 
     def _delete_images(self, filenames):
         """批量删除图片文件，如果删除的是封面则清空封面设置"""
-        deleted_count = 0
-        cover_deleted = False
+        deleted_files = self._unlink_images(filenames)
+        self._on_images_deleted(filenames, deleted_files)
+        return len(deleted_files)
 
-        for filename in filenames:
-            file_path = os.path.join(self.image_dir, filename)
-            try:
-                # 检查是否删除的是当前封面
-                if filename == self.current_cover_filename:
-                    cover_deleted = True
+    def _delete_images_async(self, filenames, preview_in_selection):
+        """在后台线程删除图片，完成后通过 -DELETE_DONE- 事件交回界面线程更新"""
 
-                os.remove(file_path)
-                deleted_count += 1
-            except Exception:
-                continue
+        def job():
+            deleted_files = self._unlink_images(filenames)
+            self._post_event("-DELETE_DONE-", (filenames, deleted_files, preview_in_selection))
+
+        self._worker_pool.submit(job)
 
-        # 如果删除了封面文件，清空封面设置
-        if cover_deleted:
+    def _post_event(self, key, value):
+        """从后台任务向窗口投递事件；窗口关闭中不再投递，避免等待已不再处理事件的界面线程"""
+        if self._closing:
+            return
+        try:
+            self.window.write_event_value(key, value)  # type: ignore
+        except Exception:
+            pass
+
+    def _on_images_deleted(self, filenames, deleted_files):
+        """删除完成后使图片列表缓存失效，删除的是封面则清空封面设置（界面线程调用）"""
+        if deleted_files:
+            self._image_files_mtime = None
+
+        # 检查是否删除的是当前封面，只需判断一次
+        if self.current_cover_filename in filenames:
             self._clear_cover_setting()
 
-        return deleted_count
+    def _unlink_images(self, filenames):
+        """删除图片目录下的指定文件及其缩略图缓存，返回删除成功的文件名列表（可在后台线程调用）"""
+        deleted_files = []
+        dir_fd = None
+        if os.unlink in os.supports_dir_fd:
+            # 支持 dir_fd 的平台打开一次目录，逐个删除时由系统直接相对目录解析文件名
+            try:
+                dir_fd = os.open(self.image_dir, os.O_RDONLY)
+            except OSError:
+                dir_fd = None
+
+        try:
+            for filename in filenames:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(filename, dir_fd=dir_fd)
+                    else:
+                        os.remove(self._image_prefix + filename)
+                except OSError:
+                    continue
+                deleted_files.append(filename)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        for filename in deleted_files:
+            self._invalidate_thumbs(self._image_prefix + filename)
+        return deleted_files
 
     def _clear_cover_setting(self):
-        """清空封面设置"""
+        """清空封面设置（本就未设置封面时无需更新控件）"""
+        had_cover = self.current_cover_filename is not None
         self.current_cover_filename = None
-        if self.window and "-CURRENT_COVER_DISPLAY-" in self.window.AllKeysDict:
-            self.window["-CURRENT_COVER_DISPLAY-"].update(value="未设置")
-            self.window["-PREVIEW_COVER-"].update(disabled=True)
-            self.window["-CLEAR_COVER-"].update(disabled=True)
+        # 窗口以 finalize=True 创建，封面控件必定存在，直接使用缓存的元素
+        if self.window and had_cover:
+            self._cover_display.update(value="未设置")
+            self._set_cover_buttons_enabled(False)
+
+    def _set_cover_buttons_enabled(self, enabled):
+        """切换预览封面、清除封面按钮的启用状态，状态未变时跳过"""
+        if enabled != self._cover_buttons_enabled:
+            self._preview_cover_button.update(disabled=not enabled)
+            self._clear_cover_button.update(disabled=not enabled)
+            self._cover_buttons_enabled = enabled
+
+    def _set_preview_buttons_enabled(self, enabled):
+        """切换依赖当前预览图的操作按钮的启用状态，状态未变时跳过"""
+        if enabled != self._preview_buttons_enabled:
+            self.window["-SET_AS_COVER-"].update(disabled=not enabled)  # type: ignore
+            self.window["-REPLACE_WITH_PREVIEW-"].update(disabled=not enabled)  # type: ignore
+            self._preview_buttons_enabled = enabled
 
     def _open_image(self, filename):
         """打开图片文件"""
-        file_path = os.path.join(self.image_dir, filename)
+        file_path = self._image_prefix + filename
         try:
             os.startfile(file_path)
             return True
         except Exception:
             return False
 
+    def _iter_image_files(self):
+        """逐个产出图片目录中的图片文件名（未排序），只需遍历一次的调用方不必先生成列表"""
+        with os.scandir(self.image_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(_IMAGE_EXTENSIONS):
+                    yield entry.name
+
     def _get_image_files(self):
-        """获取图片目录中的所有图片文件"""
-        image_files = []
-        for ext in ["*.jpg", "*.jpeg", "*.png"]:
-            image_files.extend(glob.glob(os.path.join(self.image_dir, ext)))
-        return [os.path.basename(f) for f in image_files]
+        """获取图片目录中的所有图片文件（目录未变化时直接返回缓存）"""
+        try:
+            mtime = os.stat(self.image_dir).st_mtime_ns
+        except OSError:
+            return []
+        if mtime == self._image_files_mtime:
+            return self._image_files
+
+        # 单次遍历目录并按文件名排序，保证列表顺序稳定
+        try:
+            self._image_files = sorted(self._iter_image_files())
+        except OSError:
+            return []
+        self._image_files_mtime = mtime
+        return self._image_files
+
+    def _refresh_image_list(self):
+        """立即刷新图片库列表框，文件列表未变化时跳过重绘"""
+        self._pending_list_refresh = False
+        image_filenames = self._get_image_files()
+        if image_filenames is not self._displayed_image_files:
+            self.window["-IMAGE_LIST-"].update(values=image_filenames)  # type: ignore
+            self._displayed_image_files = image_filenames
+
+    def _schedule_image_list_refresh(self):
+        """标记图片库列表需要刷新，由主循环在短暂空闲后合并执行"""
+        self._pending_list_refresh = True
+
+    def _get_image_index(self, filename):
+        """返回图片在图片库列表框中的行号，不在列表中返回 None（只查内存，不访问图片目录）"""
+        # 按列表框实际显示的列表定位，合并刷新尚未执行时行号同样与界面一致
+        image_filenames = self._displayed_image_files or []
+        if image_filenames is not self._image_index_files:
+            self._image_index = {name: i for i, name in enumerate(image_filenames)}
+            self._image_index_files = image_filenames
+        return self._image_index.get(filename)
 
     def _get_article_image_urls(self):
-        """获取文章中的图片URLs"""
+        """获取文章中的图片URLs，文章内容未变化时复用上次提取结果"""
+        content = self.modified_content
+        if content is self._image_urls_content:
+            return self._image_urls
         try:
-            return utils.extract_image_urls(self.modified_content, False)
+            image_urls = utils.extract_image_urls(content, False)
         except Exception:
-            return []
+            image_urls = []
+        self._image_urls_content = content
+        self._image_urls = image_urls
+        return image_urls
 
     def _get_display_image_urls(self):
         urls = self._get_article_image_urls()
         display_urls = []
 
-        normalized_image_dir = self.image_dir.replace("\\", "/")
+        prefix = self._norm_image_dir
 
         for url in urls:
-            normalized_url = url.replace("\\", "/")
+            # 已是正斜杠的URL（最常见）无需再生成新字符串
+            normalized_url = url.replace("\\", "/") if "\\" in url else url
 
-            if os.path.isabs(normalized_url) and normalized_url.startswith(normalized_image_dir):
+            if normalized_url.startswith(prefix):
                 display_name = os.path.basename(url)
                 display_urls.append(display_name)
             else:
@@ -179,105 +485,285 @@ class ImageConfigWindow:
 
         return display_urls
 
-    def _replace_image_at_position(self, position_index, new_image_path):
-        """在指定位置替换图片"""
-        try:
-            current_urls = utils.extract_image_urls(self.modified_content, no_repeate=False)
+    def _get_url_position(self, position_index):
+        """获取第 position_index 个图片URL的 (起始, 结束) 位置，找不到时返回 None
 
-            if position_index >= len(current_urls):
-                return False
+        位置表只按需从左到右查找到目标序号为止，文章内容未变化时复用已找到的部分。
+        """
+        content = self.modified_content
+        if content is not self._url_positions_content:
+            self._url_positions_content = content
+            self._url_positions_urls = list(self._get_article_image_urls())
+            self._url_positions = []
 
-            # 找到所有URL在文档中的位置
-            url_positions = []
-            content = self.modified_content
-            search_start = 0
+        urls = self._url_positions_urls
+        if position_index >= len(urls):
+            return None
 
-            for i, url in enumerate(current_urls):
-                pos = content.find(url, search_start)  # type: ignore
-                if pos == -1:
-                    return False
-                url_positions.append((pos, pos + len(url), url, i))
-                search_start = pos + len(url)
+        url_positions = self._url_positions
+        search_start = url_positions[-1][1] if url_positions else 0
+        while len(url_positions) <= position_index:
+            url = urls[len(url_positions)]
+            pos = content.find(url, search_start)  # type: ignore
+            if pos == -1:
+                return None
+            search_start = pos + len(url)
+            url_positions.append((pos, search_start))
+        return url_positions[position_index]
 
-            # 按位置排序
-            url_positions.sort(key=lambda x: x[0])
+    def _replace_image_at_position(self, position_index, new_image_path):
+        """在指定位置替换图片"""
+        try:
+            url_position = self._get_url_position(position_index)
+            if url_position is None:
+                return False
 
             # 找到目标位置并替换
-            if position_index < len(url_positions):
-                start_pos, end_pos, _, _ = url_positions[position_index]
-                self.modified_content = (
-                    self.modified_content[:start_pos]  # type: ignore
-                    + new_image_path
-                    + self.modified_content[end_pos:]  # type: ignore
-                )
-                return True
-
-            return False
+            start_pos, end_pos = url_position
+            content = self.modified_content
+            self.modified_content = (
+                content[:start_pos] + new_image_path + content[end_pos:]  # type: ignore
+            )
+
+            # 替换只影响目标及其后URL的偏移，直接平移位置表，下次替换无需重新提取和查找
+            url_positions = self._url_positions
+            new_end = start_pos + len(new_image_path)
+            delta = new_end - end_pos
+            url_positions[position_index] = (start_pos, new_end)
+            for i in range(position_index + 1, len(url_positions)):
+                pos, pos_end = url_positions[i]
+                url_positions[i] = (pos + delta, pos_end + delta)
+            self._url_positions_urls[position_index] = new_image_path
+            self._url_positions_content = self.modified_content
+            return True
 
         except Exception:
             return False
 
+    @staticmethod
+    def _format_image_list(display_urls):
+        """生成文章图片链接列表的显示文本（序号. URL）"""
+        return [f"{i}. {url}" for i, url in enumerate(display_urls, 1)]
+
+    def _get_display_name(self, index, current_display_urls):
+        """基于替换映射获取第 index 张文章图片的显示名称"""
+        replaced_path = self.replacement_mapping.get(index)
+        if replaced_path is not None:
+            # 已替换的显示文件名
+            return os.path.basename(replaced_path)
+        if index < len(current_display_urls):
+            # 未替换的使用当前格式化后的显示URL
+            return current_display_urls[index]
+        # 备用方案：强制使用文件名格式（仅URL数量不一致时才会走到）
+        original_url = self.original_image_urls[index]
+        return os.path.basename(original_url) if os.path.isabs(original_url) else original_url
+
     def _update_display_based_on_mapping(self):
         """基于替换映射更新显示列表"""
-        display_list = []
-
         # 始终使用格式化后的显示URL，确保一致性
         current_display_urls = self._get_display_image_urls()
+        display_names = [
+            self._get_display_name(i, current_display_urls)
+            for i in range(len(self.original_image_urls))
+        ]
 
-        for i in range(len(self.original_image_urls)):
-            if i in self.replacement_mapping:
-                # 已替换的显示文件名
-                replaced_path = self.replacement_mapping[i]
-                display_name = os.path.basename(replaced_path)
-                display_list.append(f"{i+1}. {display_name}")
-            else:
-                # 未替换的使用当前格式化后的显示URL
-                if i < len(current_display_urls):
-                    display_list.append(f"{i+1}. {current_display_urls[i]}")
-                else:
-                    # 备用方案：强制使用文件名格式
-                    original_url = self.original_image_urls[i]
-                    display_name = (
-                        os.path.basename(original_url)
-                        if os.path.isabs(original_url)
-                        else original_url
-                    )
-                    display_list.append(f"{i+1}. {display_name}")
+        self.window["-ARTICLE_IMAGES-"].update(  # type: ignore
+            values=self._format_image_list(display_names)
+        )
+
+    def _update_display_row(self, index):
+        """只重写文章图片列表中的一行，行数不变时代替整表刷新"""
+        listbox = self.window["-ARTICLE_IMAGES-"]  # type: ignore
+        if index >= len(listbox.Values):
+            self._update_display_based_on_mapping()
+            return
+
+        display_name = self._get_display_name(index, self._get_display_image_urls())
+        label = f"{index + 1}. {display_name}"
+        # 同步元素保存的值列表（元素自有的副本），values[...] 与 get() 依赖它返回选中项文本
+        listbox.Values[index] = label
+        widget = listbox.Widget
+        widget.delete(index)
+        widget.insert(index, label)
+        widget.selection_set(index)
+
+    @staticmethod
+    def _thumb_prefix(file_path):
+        """缩略图缓存文件名前缀，由原图路径决定，用于按原图批量清理缓存"""
+        return hashlib.blake2b(file_path.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _thumb_cache_path(self, file_path, resize):
+        """缩略图缓存路径，原图修改时间、大小或目标尺寸变化时自然失效"""
+        stat = os.stat(file_path)
+        return os.path.join(
+            self._thumb_dir,
+            f"{self._thumb_prefix(file_path)}_{stat.st_mtime_ns}_{stat.st_size}"
+            f"_{resize[0]}x{resize[1]}.png",
+        )
 
-        self.window["-ARTICLE_IMAGES-"].update(values=display_list)  # type: ignore
+    def _invalidate_thumbs(self, file_path):
+        """删除指定原图的所有缩略图缓存"""
+        pattern = os.path.join(self._thumb_dir, f"{self._thumb_prefix(file_path)}_*.png")
+        for cache_file in glob.glob(pattern):
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+
+    def _sweep_thumbs(self, limit=_THUMB_CACHE_LIMIT):
+        """清理缩略图缓存：删除原图已不存在的条目，超过上限时再删除最久未访问的条目"""
+        try:
+            # 图库现存图片对应的缓存前缀，在本窗口外被删除或改名的图片其缓存不再有用
+            live_prefixes = {
+                self._thumb_prefix(self._image_prefix + name) for name in self._iter_image_files()
+            }
+            with os.scandir(self._thumb_dir) as entries:
+                cache_files = []
+                for entry in entries:
+                    if entry.name.split("_", 1)[0] not in live_prefixes:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                        continue
+                    stat = entry.stat()
+                    # 部分文件系统不更新访问时间，取其与修改时间的较大值
+                    cache_files.append((max(stat.st_atime, stat.st_mtime), entry.path))
+        except OSError:
+            return
+        if len(cache_files) <= limit:
+            return
+
+        cache_files.sort()
+        for _, cache_file in cache_files[: len(cache_files) - limit]:
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+
+    def _write_thumb(self, cache_path, data):
+        """写入缩略图缓存，先写临时文件再替换，避免读到写了一半的缓存"""
+        # 临时文件名带线程标识，后台生成同一缩略图时互不覆盖
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _get_encode_buffer(self):
+        """获取当前线程复用的编码缓冲区（已清空），避免每次预览都新建 BytesIO"""
+        bio = getattr(self._encode_local, "buffer", None)
+        if bio is None:
+            bio = self._encode_local.buffer = io.BytesIO()
+        else:
+            bio.seek(0)
+            bio.truncate()
+        return bio
+
+    def _get_memory_thumb(self, cache_path):
+        """从内存 LRU 取缩略图，命中时移到最近使用的位置"""
+        with self._thumb_memory_lock:
+            data = self._thumb_memory.get(cache_path)
+            if data is not None:
+                self._thumb_memory.move_to_end(cache_path)
+            return data
+
+    def _put_memory_thumb(self, cache_path, data):
+        """放入内存 LRU，超出上限时淘汰最久未使用的条目"""
+        with self._thumb_memory_lock:
+            self._thumb_memory[cache_path] = data
+            self._thumb_memory.move_to_end(cache_path)
+            while len(self._thumb_memory) > _THUMB_MEMORY_LIMIT:
+                self._thumb_memory.popitem(last=False)
 
     def _convert_to_bytes(self, file_path, resize=None):
-        """转换图片为字节数据用于显示，等比例缩放填充锁定区域"""
+        """转换图片为字节数据用于显示，等比例缩放填充锁定区域（缩放结果缓存到内存和磁盘）"""
+        cache_path = None
+        if resize:
+            try:
+                cache_path = self._thumb_cache_path(file_path, resize)
+            except OSError:
+                pass
+            if cache_path:
+                data = self._get_memory_thumb(cache_path)
+                if data is not None:
+                    return data
+                try:
+                    with open(cache_path, "rb") as f:
+                        data = f.read()
+                    self._put_memory_thumb(cache_path, data)
+                    return data
+                except OSError:
+                    pass
+
         try:
-            img = Image.open(file_path)
-            if resize:
-                # 等比例缩放并居中填充
-                new_width, new_height = resize
-                scale = min(new_height / img.height, new_width / img.width)
-                scaled_size = (int(img.width * scale), int(img.height * scale))
-                img = img.resize(scaled_size, Image.Resampling.LANCZOS)
-
-                # 创建固定大小的背景并居中粘贴
-                background = Image.new("RGB", resize, (255, 255, 255))
-                paste_x = (new_width - scaled_size[0]) // 2
-                paste_y = (new_height - scaled_size[1]) // 2
-                background.paste(img, (paste_x, paste_y))
-                img = background
-
-            bio = io.BytesIO()
-            img.save(bio, format="PNG")
-            return bio.getvalue()
+            with Image.open(file_path) as img:
+                if resize:
+                    # 等比例缩放并居中填充
+                    new_width, new_height = resize
+                    if img.format == "JPEG":
+                        # JPEG 解码时直接按 1/2~1/8 缩小，不再解码完整分辨率后丢弃大部分像素
+                        img.draft("RGB", (new_width * 2, new_height * 2))
+                    scale = min(new_height / img.height, new_width / img.width)
+                    if scale < 1:
+                        # 缩小时原地生成缩略图：先按整数倍快速缩减再精细重采样，不额外复制整幅大图
+                        img.thumbnail(resize, Image.Resampling.LANCZOS, reducing_gap=2.0)
+                    else:
+                        scaled_size = (int(img.width * scale), int(img.height * scale))
+                        img = img.resize(scaled_size, Image.Resampling.LANCZOS)
+                    scaled_size = img.size
+
+                    # 宽高比不一致时创建固定大小的背景并居中粘贴，恰好铺满的 RGB 图片无需再合成
+                    if scaled_size != resize or img.mode != "RGB":
+                        background = Image.new("RGB", resize, (255, 255, 255))
+                        paste_x = (new_width - scaled_size[0]) // 2
+                        paste_y = (new_height - scaled_size[1]) // 2
+                        background.paste(img, (paste_x, paste_y))
+                        img = background
+
+                # 预览图只有 400x200，对体积不敏感，采用最低压缩级别以加快编码
+                bio = self._get_encode_buffer()
+                img.save(bio, format="PNG", compress_level=1)
+                data = bio.getvalue()
         except Exception:
             return None
 
+        if cache_path:
+            self._put_memory_thumb(cache_path, data)
+            self._write_thumb(cache_path, data)
+        return data
+
+    def _request_preview(self, filename):
+        """在后台线程生成预览图，完成后通过 -PREVIEW_READY- 事件交回界面线程显示"""
+        self._preview_gen += 1
+        gen = self._preview_gen
+        file_path = self._image_prefix + filename
+
+        def job():
+            # 已有更新的预览请求时直接放弃
+            if gen != self._preview_gen:
+                return
+            image_data = self._convert_to_bytes(file_path, (400, 200))
+            if gen == self._preview_gen:
+                self._post_event("-PREVIEW_READY-", (gen, filename, file_path, image_data))
+
+        self._worker_pool.submit(job)
+
     def _add_images_to_library(self, source_files):
-        """批量添加图片到图片库，处理重名和格式验证"""
+        """批量添加图片到图片库，处理重名和格式验证（在后台线程池任务中调用）"""
         if not source_files:
             return 0, []
 
-        added_count = 0
         skipped_files = []
-        supported_formats = [".jpg", ".jpeg", ".png", ".gif", ".bmp"]
+        copy_jobs = []  # (源文件, 图库中的目标文件名)
+        # 图库已有文件名快照，重名检测只查集合，不再为每个候选名 stat 一次
+        # （统一按小写比较，Windows/macOS 等大小写不敏感的文件系统上同样能识别重名）
+        existing_names = {name.lower() for name in os.listdir(self.image_dir)}
 
         for source_file in source_files:
             if not os.path.exists(source_file):
@@ -285,38 +771,61 @@ class ImageConfigWindow:
 
             # 检查文件格式
             file_ext = os.path.splitext(source_file)[1].lower()
-            if file_ext not in supported_formats:
+            if file_ext not in _IMAGE_EXTENSION_SET:
                 skipped_files.append(f"{os.path.basename(source_file)} (不支持的格式)")
                 continue
 
             original_filename = os.path.basename(source_file)
-            dest_path = os.path.join(self.image_dir, original_filename)
+            dest_filename = original_filename
 
             # 处理重名文件
-            if os.path.exists(dest_path):
+            if dest_filename.lower() in existing_names:
                 # 自动重命名：在文件名后添加数字后缀
                 name, ext = os.path.splitext(original_filename)
                 counter = 1
-                while os.path.exists(dest_path):
-                    new_filename = f"{name}_{counter}{ext}"
-                    dest_path = os.path.join(self.image_dir, new_filename)
+                while dest_filename.lower() in existing_names:
+                    dest_filename = f"{name}_{counter}{ext}"
                     counter += 1
 
-                skipped_files.append(
-                    f"{original_filename} → {os.path.basename(dest_path)} (重命名)"
-                )
+                skipped_files.append(f"{original_filename} → {dest_filename} (重命名)")
 
-            try:
-                shutil.copy2(source_file, dest_path)
+            existing_names.add(dest_filename.lower())
+            copy_jobs.append((source_file, dest_filename))
+
+        # 已在后台线程池任务中，逐个复制即可，不再另起线程池
+        copy_errors = [self._copy_to_library(job) for job in copy_jobs]
+
+        added_count = 0
+        for (source_file, _), error in zip(copy_jobs, copy_errors):
+            if error is None:
                 added_count += 1
-            except Exception as e:
-                skipped_files.append(f"{original_filename} (复制失败: {str(e)})")
+            else:
+                skipped_files.append(f"{os.path.basename(source_file)} (复制失败: {error})")
 
         return added_count, skipped_files
 
+    def _copy_to_library(self, copy_job):
+        """复制单个图片到图库，成功返回 None，失败返回错误信息"""
+        source_file, dest_filename = copy_job
+        try:
+            shutil.copy2(source_file, self._image_prefix + dest_filename)
+            return None
+        except Exception as e:
+            return str(e)
+
+    def _add_images_async(self, source_files):
+        """在后台线程添加图片，完成后通过 -ADD_DONE- 事件交回界面线程显示结果"""
+
+        def job():
+            result = self._add_images_to_library(source_files)
+            self._post_event("-ADD_DONE-", result)
+
+        self._worker_pool.submit(job)
+
     def _create_layout(self):
         """创建配图配置窗口布局"""
         image_filenames = self._get_image_files()
+        self._displayed_image_files = image_filenames
         image_urls = self._get_display_image_urls()
 
         # 左侧图片库列表
@@ -399,7 +908,7 @@ class ImageConfigWindow:
                     [
                         [
                             sg.Listbox(
-                                values=[f"{i+1}. {url}" for i, url in enumerate(image_urls)],
+                                values=self._format_image_list(image_urls),
                                 key="-ARTICLE_IMAGES-",
                                 size=(53, 8),
                                 enable_events=True,
@@ -428,583 +937,558 @@ class ImageConfigWindow:
 
         return layout
 
-    def run(self):
-        """显示配图管理窗口"""
-        layout = self._create_layout()
+    def _init_event_handlers(self):
+        """建立事件分发表，主循环按事件 key 直接查表调用对应的处理方法"""
+        self._event_handlers = {
+            sg.TIMEOUT_KEY: self._on_refresh_images,
+            "-REFRESH_IMAGES-": self._on_refresh_images,
+            "-PREVIEW_ARTICLE-": self._on_preview_article,
+            "-SAVE_CONFIG-": self._on_save_config,
+            "-EDIT_ARTICLE-": self._on_edit_article,
+            "-RESTORE_DEFAULT-": self._on_restore_default,
+            "重命名": self._on_rename,
+            "-IMAGE_LIST-": self._on_image_list,
+            "-PREVIEW_READY-": self._on_preview_ready,
+            "-IMAGE_LIST-+RIGHT_CLICK+": self._on_image_list_right_click,
+            "删除": self._on_delete,
+            "打开": self._on_open,
+            "-BATCH_DELETE-": self._on_batch_delete,
+            "-DELETE_DONE-": self._on_delete_done,
+            "-SET_AS_COVER-": self._on_set_as_cover,
+            "-PREVIEW_COVER-": self._on_preview_cover,
+            "-CLEAR_COVER-": self._on_clear_cover,
+            "-REPLACE_WITH_PREVIEW-": self._on_replace_with_preview,
+            "-ADD_IMAGES-": self._on_add_images,
+            "-ADD_DONE-": self._on_add_done,
+        }
+
+    def _on_refresh_images(self, event, values):
+        """刷新图片库列表（也用于合并刷新的空闲超时事件）"""
+        self._refresh_image_list()
+
+    def _on_preview_article(self, event, values):
+        """将当前修改后的文章写入临时文件并在浏览器中预览"""
+        # 获取原文件扩展名
+        original_ext = os.path.splitext(self.article["path"])[1]
+
+        # 只保留最近两次的预览文件（浏览器可能仍在读取），更早的立即删除
+        self._cleanup_temp_files(keep=2)
 
-        self.window = sg.Window(
-            f'AIWriteX - 配图管理 - {self.article["title"]}',
-            layout,
-            size=(700, 660),
-            finalize=True,
-            resizable=False,
-            icon=utils.get_gui_icon(),
-            keep_on_top=True,
-        )
-        self.window["-PREVIEW-"].update(data=self._reset_preview_to_default())
-        self.window["-IMAGE_LIST-"].bind("<Button-3>", "+RIGHT_CLICK+")
+        try:
+            if self._temp_dir is None:
+                self._temp_dir = tempfile.mkdtemp(prefix="aiwritex_")
+            # 使用tempfile在专用目录中创建临时文件，保持原扩展名
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                suffix=original_ext,
+                prefix="preview_",
+                dir=self._temp_dir,
+                delete=False,
+            ) as temp_f:
+                temp_f.write(self.modified_content)  # type: ignore
+                temp_file = temp_f.name
+
+            # 存储临时文件路径用于后续清理
+            self.temp_files.append(temp_file)
+
+            if utils.open_url(temp_file):
+                sg.popup_error(
+                    "无法打开预览",
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
 
-        while True:
-            event, values = self.window.read()  # type: ignore
+        except Exception as e:
+            sg.popup_error(
+                f"预览失败: {str(e)}",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
 
-            if event in (sg.WIN_CLOSED, "-CLOSE-"):
-                break
+    def _on_save_config(self, event, values):
+        """保存配图配置到原文件"""
+        try:
+            with open(self.article["path"], "w", encoding="utf-8") as f:
+                f.write(self.modified_content)  # type: ignore
+            # 保存后的文件内容即当前内容，恢复默认时无需重新读取
+            self._article_content = self.modified_content
+            self._article_stamp = self._get_article_stamp()
+            sg.popup(
+                "配图设置已保存到文章文件",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+        except Exception as e:
+            sg.popup_error(
+                f"保存失败: {str(e)}",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_edit_article(self, event, values):
+        """使用系统默认编辑器打开文章文件（跨平台适配）"""
+        try:
+            if not self._open_in_editor(self.article["path"]):
+                # 如果所有编辑器都失败，使用系统默认方式
+                if sys.platform == "win32":
+                    os.system(f'start "" "{self.article["path"]}"')
+                elif sys.platform == "darwin":
+                    os.system(f'open "{self.article["path"]}"')
+                else:
+                    os.system(f'xdg-open "{self.article["path"]}"')
+
+        except Exception as e:
+            sg.popup_error(
+                f"打开编辑器失败: {str(e)}",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_restore_default(self, event, values):
+        """放弃未保存的修改，恢复到文章文件中的内容"""
+        if (
+            sg.popup_yes_no(
+                "确定要恢复到默认设置吗？所有未保存的更改将丢失。",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+            == "Yes"
+        ):
+            try:
+                self.modified_content = self._load_article()
 
-            elif event == "-REFRESH_IMAGES-":
-                # 刷新图片列表
-                image_filenames = self._get_image_files()
-                self.window["-IMAGE_LIST-"].update(values=image_filenames)
+                # 重置替换映射和原始URL列表
+                self.replacement_mapping = {}
+                self.original_image_urls = self._get_article_image_urls()
 
-            elif event == "-PREVIEW_ARTICLE-":
-                # 获取原文件扩展名
-                original_ext = os.path.splitext(self.article["path"])[1]
+                # 清空封面设置
+                self._clear_cover_setting()
 
-                try:
-                    # 使用tempfile创建临时文件，保持原扩展名
-                    with tempfile.NamedTemporaryFile(
-                        mode="w",
-                        encoding="utf-8",
-                        suffix=original_ext,
-                        prefix="preview_",
-                        delete=False,
-                    ) as temp_f:
-                        temp_f.write(self.modified_content)  # type: ignore
-                        temp_file = temp_f.name
-
-                    # 存储临时文件路径用于后续清理
-                    if not hasattr(self, "temp_files"):
-                        self.temp_files = []
-                    self.temp_files.append(temp_file)
-
-                    if utils.open_url(temp_file):
-                        sg.popup_error(
-                            "无法打开预览",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-
-                except Exception as e:
-                    sg.popup_error(
-                        f"预览失败: {str(e)}",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+                # 使用显示方法获取格式化的URL列表
+                display_urls = self._get_display_image_urls()
+                self.window["-ARTICLE_IMAGES-"].update(values=self._format_image_list(display_urls))
+
+                sg.popup(
+                    "已恢复到默认设置",
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
+            except Exception as e:
+                sg.popup_error(
+                    f"恢复失败: {str(e)}",
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
+
+    def _on_rename(self, event, values):
+        """右键菜单：重命名选中的单个图片"""
+        selected_files = values["-IMAGE_LIST-"]
+        if len(selected_files) == 1:
+            old_filename = selected_files[0]
+            new_filename = sg.popup_get_text(
+                "请输入新的文件名:",
+                default_text=old_filename,
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+            if new_filename and new_filename != old_filename:
+                if self._rename_image(old_filename, new_filename):
+                    # 检查是否重命名了当前预览的图片
+                    if old_filename == self.current_preview_filename:
+                        self._set_current_preview(new_filename)
+
+                    # 检查是否重命名了当前封面图片
+                    if old_filename == self.current_cover_filename:
+                        self.current_cover_filename = new_filename
+                        # 更新封面显示
+                        self._cover_display.update(new_filename)
 
-            elif event == "-SAVE_CONFIG-":
-                # 保存配图配置到原文件
-                try:
-                    with open(self.article["path"], "w", encoding="utf-8") as f:
-                        f.write(self.modified_content)  # type: ignore
                     sg.popup(
-                        "配图设置已保存到文章文件",
+                        f"重命名成功: {new_filename}",
                         title="系统提示",
-                        icon=utils.get_gui_icon(),
+                        icon=self._icon,
                         keep_on_top=True,
                     )
-                except Exception as e:
+                    # 刷新图片列表（合并到下一次空闲时执行）
+                    self._schedule_image_list_refresh()
+                else:
                     sg.popup_error(
-                        f"保存失败: {str(e)}",
+                        "重命名失败",
                         title="系统提示",
-                        icon=utils.get_gui_icon(),
+                        icon=self._icon,
                         keep_on_top=True,
                     )
-            elif event == "-EDIT_ARTICLE-":
-                # 使用系统默认编辑器打开文章文件（跨平台适配）
-                try:
-                    # 根据平台定义不同的编辑器列表
-                    if sys.platform == "win32":
-                        editors = [
-                            "cursor",
-                            "qoder",
-                            "trae",
-                            "windsurf",
-                            "zed",
-                            "tabby",
-                            "code",
-                            "subl",
-                            "notepad++",
-                            "webstorm",
-                            "phpstorm",
-                            "pycharm",
-                            "idea",
-                            "brackets",
-                            "gvim",
-                            "emacs",
-                            "notepad",
-                        ]
-                    elif sys.platform == "darwin":  # macOS
-                        editors = [
-                            "cursor",
-                            "trae",
-                            "qoder",
-                            "windsurf",
-                            "zed",
-                            "tabby",
-                            "code",
-                            "subl",
-                            "webstorm",
-                            "phpstorm",
-                            "pycharm",
-                            "idea",
-                            "brackets",
-                            "open -a TextEdit",
-                            "vim",
-                            "emacs",
-                        ]
-                    else:  # Linux
-                        editors = [
-                            "cursor",
-                            "trae",
-                            "qoder",
-                            "windsurf",
-                            "zed",
-                            "tabby",
-                            "code",
-                            "subl",
-                            "webstorm",
-                            "phpstorm",
-                            "pycharm",
-                            "idea",
-                            "brackets",
-                            "gvim",
-                            "emacs",
-                            "gedit",
-                            "nano",
-                        ]
-
-                    for editor_cmd in editors:
-                        try:
-                            if sys.platform == "darwin" and editor_cmd == "open -a TextEdit":
-                                subprocess.run(
-                                    f'open -a TextEdit "{self.article["path"]}"',
-                                    shell=True,
-                                    check=True,
-                                    stderr=subprocess.DEVNULL,
-                                )
-                            else:
-                                subprocess.run(
-                                    f'{editor_cmd} "{self.article["path"]}"',
-                                    shell=True,
-                                    check=True,
-                                    stderr=subprocess.DEVNULL,
-                                )
-                            return
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            continue
-
-                    # 如果所有编辑器都失败，使用系统默认方式
-                    if sys.platform == "win32":
-                        os.system(f'start "" "{self.article["path"]}"')
-                    elif sys.platform == "darwin":
-                        os.system(f'open "{self.article["path"]}"')
-                    else:
-                        os.system(f'xdg-open "{self.article["path"]}"')
-
-                except Exception as e:
-                    sg.popup_error(
-                        f"打开编辑器失败: {str(e)}",
+        else:
+            sg.popup_error(
+                "请选择单个文件进行重命名",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_image_list(self, event, values):
+        """统一处理图片选择事件（单选和多选）"""
+        selected_files = values["-IMAGE_LIST-"]
+        if selected_files:
+            # 获取最后选中的图片进行预览（兼容单选和多选）
+            self._request_preview(selected_files[-1])
+
+    def _on_preview_ready(self, event, values):
+        """显示后台生成的预览图"""
+        gen, filename, _, image_data = values[event]
+        # 只显示最近一次请求且仍处于选中状态的图片
+        selected_files = values["-IMAGE_LIST-"]
+        if (
+            image_data
+            and gen == self._preview_gen
+            and selected_files
+            and selected_files[-1] == filename
+        ):
+            self._preview_image.update(data=image_data)
+            # 启用操作按钮
+            self._set_preview_buttons_enabled(True)
+            # 存储当前预览的文件信息，用于后续操作
+            self._set_current_preview(filename)
+
+    def _on_image_list_right_click(self, event, values):
+        """记录右键点击位置对应的图片"""
+        # 获取右键点击时的鼠标位置对应的列表项
+        try:
+            listbox = self.window["-IMAGE_LIST-"].Widget
+            index = listbox.nearest(  # type: ignore
+                self.window["-IMAGE_LIST-"].Widget.winfo_pointery()  # type: ignore
+                - self.window["-IMAGE_LIST-"].Widget.winfo_rooty()  # type: ignore
+            )
+            # 行号对应列表框当前显示的内容，无需重新读取图片目录
+            image_filenames = self._displayed_image_files or []
+            if 0 <= index < len(image_filenames):
+                self.right_clicked_item = image_filenames[index]
+        except Exception:
+            self.right_clicked_item = None
+
+    def _on_delete(self, event, values):
+        """右键菜单：删除右键点击的单个图片"""
+        # 只删除右键点击的单个文件
+        if self.right_clicked_item:
+            # 检查是否要删除封面文件
+            warning_msg = f"确定要删除文件 '{self.right_clicked_item}' 吗？"
+            if self.right_clicked_item == self.current_cover_filename:
+                warning_msg += "\n\n注意：此文件是当前封面，删除后封面设置将被清空。"
+
+            if (
+                sg.popup_yes_no(
+                    warning_msg,
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
+                == "Yes"
+            ):
+                deleted_count = self._delete_images([self.right_clicked_item])
+                if deleted_count > 0:
+                    sg.popup(
+                        f"成功删除文件: {self.right_clicked_item}",
                         title="系统提示",
-                        icon=utils.get_gui_icon(),
+                        icon=self._icon,
                         keep_on_top=True,
                     )
+                    # 刷新图片列表（合并到下一次空闲时执行）
+                    self._schedule_image_list_refresh()
+                    # 清空预览
+                    self._preview_image.update(data=self._reset_preview_to_default())
 
-            elif event == "-RESTORE_DEFAULT-":
-                if (
-                    sg.popup_yes_no(
-                        "确定要恢复到默认设置吗？所有未保存的更改将丢失。",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                    == "Yes"
-                ):
-                    try:
-                        with open(self.article["path"], "r", encoding="utf-8") as f:
-                            self.modified_content = f.read()
-
-                        # 重置替换映射和原始URL列表
-                        self.replacement_mapping = {}
-                        self.original_image_urls = self._get_article_image_urls()
-
-                        # 清空封面设置
-                        self._clear_cover_setting()
-
-                        # 使用显示方法获取格式化的URL列表
-                        display_urls = self._get_display_image_urls()
-                        self.window["-ARTICLE_IMAGES-"].update(
-                            values=[f"{i+1}. {url}" for i, url in enumerate(display_urls)]
-                        )
-
-                        sg.popup(
-                            "已恢复到默认设置",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                    except Exception as e:
-                        sg.popup_error(
-                            f"恢复失败: {str(e)}",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-            # 添加右键菜单事件处理
-            elif event == "重命名":
-                selected_files = values["-IMAGE_LIST-"]
-                if len(selected_files) == 1:
-                    old_filename = selected_files[0]
-                    new_filename = sg.popup_get_text(
-                        "请输入新的文件名:",
-                        default_text=old_filename,
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                    if new_filename and new_filename != old_filename:
-                        if self._rename_image(old_filename, new_filename):
-                            # 检查是否重命名了当前预览的图片
-                            if old_filename == self.current_preview_filename:
-                                self.current_preview_filename = new_filename
-                                self.current_preview_file = os.path.join(
-                                    self.image_dir, new_filename
-                                )
-
-                            # 检查是否重命名了当前封面图片
-                            if old_filename == self.current_cover_filename:
-                                self.current_cover_filename = new_filename
-                                # 更新封面显示
-                                if (
-                                    self.window
-                                    and "-CURRENT_COVER_DISPLAY-" in self.window.AllKeysDict
-                                ):
-                                    self.window["-CURRENT_COVER_DISPLAY-"].update(new_filename)
-
-                            sg.popup(
-                                f"重命名成功: {new_filename}",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                            # 刷新图片列表
-                            image_filenames = self._get_image_files()
-                            self.window["-IMAGE_LIST-"].update(values=image_filenames)
-                        else:
-                            sg.popup_error(
-                                "重命名失败",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                else:
-                    sg.popup_error(
-                        "请选择单个文件进行重命名",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+                    if self.right_clicked_item == self.current_preview_filename:
+                        self._set_current_preview(None)
+                        self._set_preview_buttons_enabled(False)
 
-            elif event == "-IMAGE_LIST-" and values["-IMAGE_LIST-"]:
-                # 统一处理图片选择事件（单选和多选）
-                selected_files = values["-IMAGE_LIST-"]
-                if selected_files:
-                    # 获取最后选中的图片进行预览（兼容单选和多选）
-                    last_selected = selected_files[-1]
-                    file_path = os.path.join(self.image_dir, last_selected)
-                    image_data = self._convert_to_bytes(file_path, (400, 200))
-                    if image_data:
-                        self.window["-PREVIEW-"].update(data=image_data)
-                        # 启用操作按钮
-                        self.window["-SET_AS_COVER-"].update(disabled=False)
-                        self.window["-REPLACE_WITH_PREVIEW-"].update(disabled=False)
-                        # 存储当前预览的文件信息，用于后续操作
-                        self.current_preview_file = file_path
-                        self.current_preview_filename = last_selected
-                else:
-                    # 没有选中图片时禁用按钮
-                    self.window["-SET_AS_COVER-"].update(disabled=True)
-                    self.window["-REPLACE_WITH_PREVIEW-"].update(disabled=True)
-            elif event == "-IMAGE_LIST-+RIGHT_CLICK+":
-                # 获取右键点击时的鼠标位置对应的列表项
-                try:
-                    listbox = self.window["-IMAGE_LIST-"].Widget
-                    index = listbox.nearest(  # type: ignore
-                        self.window["-IMAGE_LIST-"].Widget.winfo_pointery()  # type: ignore
-                        - self.window["-IMAGE_LIST-"].Widget.winfo_rooty()  # type: ignore
-                    )
-                    if index >= 0:
-                        image_filenames = self._get_image_files()
-                        if index < len(image_filenames):
-                            self.right_clicked_item = image_filenames[index]
-                except Exception:
                     self.right_clicked_item = None
-
-            elif event == "删除":
-                # 只删除右键点击的单个文件
-                if self.right_clicked_item:
-                    # 检查是否要删除封面文件
-                    warning_msg = f"确定要删除文件 '{self.right_clicked_item}' 吗？"
-                    if self.right_clicked_item == self.current_cover_filename:
-                        warning_msg += "\n\n注意：此文件是当前封面，删除后封面设置将被清空。"
-
-                    if (
-                        sg.popup_yes_no(
-                            warning_msg,
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        == "Yes"
-                    ):
-                        deleted_count = self._delete_images([self.right_clicked_item])
-                        if deleted_count > 0:
-                            sg.popup(
-                                f"成功删除文件: {self.right_clicked_item}",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                            # 刷新图片列表
-                            image_filenames = self._get_image_files()
-                            self.window["-IMAGE_LIST-"].update(values=image_filenames)
-                            # 清空预览
-                            self.window["-PREVIEW-"].update(data=self._reset_preview_to_default())
-
-                            if self.right_clicked_item == self.current_preview_filename:
-                                self.current_preview_file = None
-                                self.current_preview_filename = None
-                                self.window["-SET_AS_COVER-"].update(disabled=True)
-                                self.window["-REPLACE_WITH_PREVIEW-"].update(disabled=True)
-
-                            self.right_clicked_item = None
-                        else:
-                            sg.popup_error(
-                                "删除失败",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
                 else:
                     sg.popup_error(
-                        "请先右键点击要删除的文件",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-
-            elif event == "打开":
-                selected_files = values["-IMAGE_LIST-"]
-                if len(selected_files) == 1:
-                    filename = selected_files[0]
-                    if not self._open_image(filename):
-                        sg.popup_error(
-                            "无法打开文件",
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                elif len(selected_files) > 1:
-                    sg.popup_error(
-                        "请选择单个文件进行打开",
+                        "删除失败",
                         title="系统提示",
-                        icon=utils.get_gui_icon(),
+                        icon=self._icon,
                         keep_on_top=True,
                     )
+        else:
+            sg.popup_error(
+                "请先右键点击要删除的文件",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_open(self, event, values):
+        """右键菜单：用系统程序打开选中的单个图片"""
+        selected_files = values["-IMAGE_LIST-"]
+        if len(selected_files) == 1:
+            filename = selected_files[0]
+            if not self._open_image(filename):
+                sg.popup_error(
+                    "无法打开文件",
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
+        elif len(selected_files) > 1:
+            sg.popup_error(
+                "请选择单个文件进行打开",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+        else:
+            sg.popup_error(
+                "请先选择要打开的文件",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_batch_delete(self, event, values):
+        """确认后在后台批量删除选中的图片"""
+        selected_files = values["-IMAGE_LIST-"]
+        if selected_files:
+            # 选中项转为集合，下面的成员判断不再逐个扫描列表
+            selected_set = set(selected_files)
+            # 检查是否包含封面文件
+            cover_in_selection = self.current_cover_filename in selected_set
+
+            # 检查是否包含当前预览的文件
+            preview_in_selection = self.current_preview_filename in selected_set
+
+            # 列表最多展示前 5 个文件名，整条提示一次拼接完成
+            listed = "\n".join([f"- {filename}" for filename in selected_files[:5]])
+            more = "..." if len(selected_files) > 5 else ""
+            confirm_message = f"确认删除以下 {len(selected_files)} 个图片？\n{listed}{more}"
+
+            # 如果包含封面，添加特别提示
+            if cover_in_selection:
+                confirm_message += f"\n\n⚠️ 注意：选中的文件包含当前封面图片 '{self.current_cover_filename}'，删除后封面设置将被清空。"  # noqa 501
+
+            if (
+                sg.popup_yes_no(
+                    confirm_message,
+                    title="系统提示",
+                    icon=self._icon,
+                    keep_on_top=True,
+                )
+                == "Yes"
+            ):
+                # 删除在后台进行，完成前禁用批量删除按钮，避免重复提交
+                self.window["-BATCH_DELETE-"].update(disabled=True)
+                self._delete_images_async(selected_files, preview_in_selection)
+        else:
+            sg.popup_error(
+                "请先选择要删除的文件",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_delete_done(self, event, values):
+        """批量删除完成后更新界面"""
+        filenames, deleted_files, preview_in_selection = values[event]
+        self._on_images_deleted(filenames, deleted_files)
+        self.window["-BATCH_DELETE-"].update(disabled=False)
+        if deleted_files:
+            # 如果删除了当前预览的图片，重置预览状态
+            if preview_in_selection:
+                self._set_current_preview(None)
+                self._set_preview_buttons_enabled(False)
+
+            sg.popup(
+                f"成功删除 {len(deleted_files)} 个文件",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+            # 刷新图片列表（合并到下一次空闲时执行）
+            self._schedule_image_list_refresh()
+
+            # 清空预览
+            self._preview_image.update(data=self._reset_preview_to_default())
+        else:
+            sg.popup_error(
+                "删除失败",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+    def _on_set_as_cover(self, event, values):
+        """将当前预览的图片设置为封面"""
+        if self.current_cover_filename != self.current_preview_filename:
+            self.current_cover_filename: Any | None = self.current_preview_filename
+            self._cover_display.update(value=self.current_cover_filename)
+            self._set_cover_buttons_enabled(True)
+
+    def _on_preview_cover(self, event, values):
+        """预览当前封面，并在左侧列表中选中它"""
+        if self.current_cover_filename:
+            file_path = self._image_prefix + self.current_cover_filename
+            image_data = self._convert_to_bytes(file_path, (400, 200))
+            if image_data:
+                self._preview_image.update(data=image_data)
+                # 同步左侧列表选中状态
+                cover_index = self._get_image_index(self.current_cover_filename)
+                if cover_index is not None:
+                    # 设置左侧列表选中封面图片
+                    self.window["-IMAGE_LIST-"].update(set_to_index=[cover_index])
+                    # 更新当前预览文件信息
+                    self._set_current_preview(self.current_cover_filename)
+
+    def _on_clear_cover(self, event, values):
+        """清除封面设置"""
+        self._clear_cover_setting()
+
+    def _on_replace_with_preview(self, event, values):
+        """使用当前预览的图片替换选中的文章链接图片"""
+        if not values["-ARTICLE_IMAGES-"]:
+            sg.popup_error(
+                "请先选择要替换的图片链接",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+        elif not self.current_preview_filename:
+            sg.popup_error(
+                "请先选择要用于替换的图片",
+                title="系统提示",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+        else:
+            # 列表行号与文章图片序号一一对应，直接取选中行位置，无需解析显示文本
+            selected_index = self.window["-ARTICLE_IMAGES-"].get_indexes()[0]
+
+            if selected_index < len(self.original_image_urls):
+                # 预览切换时已算好写入文章用的路径
+                html_image_path = self._current_preview_html_path
+
+                # 使用精确的位置替换
+                if self._replace_image_at_position(selected_index, html_image_path):
+                    # 更新替换映射
+                    self.replacement_mapping[selected_index] = html_image_path
+
+                    # 只更新被替换的那一行
+                    self._update_display_row(selected_index)
                 else:
                     sg.popup_error(
-                        "请先选择要打开的文件",
+                        "替换失败",
                         title="系统提示",
-                        icon=utils.get_gui_icon(),
+                        icon=self._icon,
                         keep_on_top=True,
                     )
 
-            elif event == "-BATCH_DELETE-":
-                selected_files = values["-IMAGE_LIST-"]
-                if selected_files:
-                    # 检查是否包含封面文件
-                    cover_in_selection = self.current_cover_filename in selected_files
-
-                    # 检查是否包含当前预览的文件
-                    preview_in_selection = self.current_preview_filename in selected_files
+    def _on_add_images(self, event, values):
+        """选择图片文件并在后台添加到图库"""
+        # 使用FilesBrowse的多选功能
+        files = sg.popup_get_file(
+            "选择要添加的图片文件",
+            multiple_files=True,
+            file_types=(
+                ("图片文件", "*.png *.jpg *.jpeg *.gif *.bmp"),
+                ("PNG文件", "*.png"),
+                ("JPEG文件", "*.jpg *.jpeg"),
+                ("所有文件", "*.*"),
+            ),
+            title="添加图片到图库",
+            keep_on_top=True,
+        )
 
-                    confirm_message = (
-                        f"确认删除以下 {len(selected_files)} 个图片？\n"
-                        + "\n".join(f"- {filename}" for filename in selected_files[:5])
-                        + ("..." if len(selected_files) > 5 else "")
-                    )
+        if files:
+            # files是分号分隔的字符串，需要分割（单个文件时得到单元素列表）
+            file_list = [f for f in files.split(";") if f]
+            # 复制在后台进行，完成前禁用添加按钮，避免重复提交
+            self.window["-ADD_IMAGES-"].update(disabled=True)
+            self._add_images_async(file_list)
+
+    def _on_add_done(self, event, values):
+        """添加图片完成后使图片列表缓存失效、显示结果并刷新列表"""
+        added_count, skipped_files = values[event]
+        self.window["-ADD_IMAGES-"].update(disabled=False)
+        if added_count > 0:
+            self._image_files_mtime = None
+
+        # 显示结果
+        if added_count > 0:
+            message = f"成功添加 {added_count} 个图片文件"
+            if skipped_files:
+                skipped_text = "\n".join(skipped_files)
+                message = f"{message}\n\n处理的文件：\n{skipped_text}"
+            sg.popup(
+                message,
+                title="添加完成",
+                icon=self._icon,
+                keep_on_top=True,
+            )
+
+            # 刷新图片列表（合并到下一次空闲时执行）
+            self._schedule_image_list_refresh()
+        else:
+            message = "没有添加任何文件"
+            if skipped_files:
+                skipped_text = "\n".join(skipped_files)
+                message = f"{message}\n\n跳过的文件：\n{skipped_text}"
+            sg.popup_error(
+                message,
+                title="添加失败",
+                icon=self._icon,
+                keep_on_top=True,
+            )
 
-                    # 如果包含封面，添加特别提示
-                    if cover_in_selection:
-                        confirm_message += f"\n\n⚠️ 注意：选中的文件包含当前封面图片 '{self.current_cover_filename}'，删除后封面设置将被清空。"  # noqa 501
-
-                    if (
-                        sg.popup_yes_no(
-                            confirm_message,
-                            title="系统提示",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-                        == "Yes"
-                    ):
-                        deleted_count = self._delete_images(selected_files)
-                        if deleted_count > 0:
-                            # 如果删除了当前预览的图片，重置预览状态
-                            if preview_in_selection:
-                                self.current_preview_file = None
-                                self.current_preview_filename = None
-                                self.window["-SET_AS_COVER-"].update(disabled=True)
-                                self.window["-REPLACE_WITH_PREVIEW-"].update(disabled=True)
-
-                            sg.popup(
-                                f"成功删除 {deleted_count} 个文件",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
+    def run(self):
+        """显示配图管理窗口"""
+        layout = self._create_layout()
 
-                            # 刷新图片列表
-                            image_filenames = self._get_image_files()
-                            self.window["-IMAGE_LIST-"].update(values=image_filenames)
-
-                            # 清空预览
-                            self.window["-PREVIEW-"].update(data=self._reset_preview_to_default())
-                        else:
-                            sg.popup_error(
-                                "删除失败",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-                else:
-                    sg.popup_error(
-                        "请先选择要删除的文件",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
+        self.window = sg.Window(
+            f'AIWriteX - 配图管理 - {self.article["title"]}',
+            layout,
+            size=(700, 660),
+            finalize=True,
+            resizable=False,
+            icon=self._icon,
+            keep_on_top=True,
+        )
+        # 缓存频繁更新的元素，避免每次都经 window[key] 查找
+        self._preview_image = self.window["-PREVIEW-"]
+        self._cover_display = self.window["-CURRENT_COVER_DISPLAY-"]
+        self._preview_cover_button = self.window["-PREVIEW_COVER-"]
+        self._clear_cover_button = self.window["-CLEAR_COVER-"]
 
-            elif event == "-SET_AS_COVER-":
-                self.current_cover_filename: Any | None = self.current_preview_filename
-                self.window["-CURRENT_COVER_DISPLAY-"].update(value=self.current_cover_filename)
-                self.window["-PREVIEW_COVER-"].update(disabled=False)
-                self.window["-CLEAR_COVER-"].update(disabled=False)
-            elif event == "-PREVIEW_COVER-":
-                if self.current_cover_filename:
-                    file_path = os.path.join(self.image_dir, self.current_cover_filename)
-                    image_data = self._convert_to_bytes(file_path, (400, 200))
-                    if image_data:
-                        self.window["-PREVIEW-"].update(data=image_data)
-                        # 同步左侧列表选中状态
-                        image_filenames = self._get_image_files()
-                        if self.current_cover_filename in image_filenames:
-                            # 设置左侧列表选中封面图片
-                            self.window["-IMAGE_LIST-"].update(
-                                set_to_index=[image_filenames.index(self.current_cover_filename)]
-                            )
-                            # 更新当前预览文件信息
-                            self.current_preview_file = file_path
-                            self.current_preview_filename = self.current_cover_filename
-            # 清除封面设置
-            elif event == "-CLEAR_COVER-":
-                self.current_cover_filename = None
-                self.window["-CURRENT_COVER_DISPLAY-"].update(value="未设置")
-                self.window["-PREVIEW_COVER-"].update(disabled=True)
-                self.window["-CLEAR_COVER-"].update(disabled=True)
-            elif event == "-REPLACE_WITH_PREVIEW-":
-                if not values["-ARTICLE_IMAGES-"]:
-                    sg.popup_error(
-                        "请先选择要替换的图片链接",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                elif not self.current_preview_filename:
-                    sg.popup_error(
-                        "请先选择要用于替换的图片",
-                        title="系统提示",
-                        icon=utils.get_gui_icon(),
-                        keep_on_top=True,
-                    )
-                else:
-                    selected_item = values["-ARTICLE_IMAGES-"][0]
-                    selected_index = int(selected_item.split(". ")[0]) - 1
-
-                    if selected_index < len(self.original_image_urls):
-                        # 生成新的完整路径
-                        full_image_path = os.path.join(
-                            self.image_dir, self.current_preview_filename
-                        )
-                        html_image_path = full_image_path.replace("\\", "/")
-
-                        # 使用精确的位置替换
-                        if self._replace_image_at_position(selected_index, html_image_path):
-                            # 更新替换映射
-                            self.replacement_mapping[selected_index] = html_image_path
-
-                            # 更新显示
-                            self._update_display_based_on_mapping()
-                        else:
-                            sg.popup_error(
-                                "替换失败",
-                                title="系统提示",
-                                icon=utils.get_gui_icon(),
-                                keep_on_top=True,
-                            )
-            elif event == "-ADD_IMAGES-":
-                # 使用FilesBrowse的多选功能
-                files = sg.popup_get_file(
-                    "选择要添加的图片文件",
-                    multiple_files=True,
-                    file_types=(
-                        ("图片文件", "*.png *.jpg *.jpeg *.gif *.bmp"),
-                        ("PNG文件", "*.png"),
-                        ("JPEG文件", "*.jpg *.jpeg"),
-                        ("所有文件", "*.*"),
-                    ),
-                    title="添加图片到图库",
-                    keep_on_top=True,
-                )
+        self._preview_image.update(data=self._reset_preview_to_default())
+        self.window["-IMAGE_LIST-"].bind("<Button-3>", "+RIGHT_CLICK+")
 
-                if files:
-                    # files是分号分隔的字符串，需要分割
-                    file_list = files.split(";") if ";" in files else [files]
-                    added_count, skipped_files = self._add_images_to_library(file_list)
-
-                    # 显示结果
-                    if added_count > 0:
-                        message = f"成功添加 {added_count} 个图片文件"
-                        if skipped_files:
-                            message += "\n\n处理的文件：\n" + "\n".join(skipped_files)
-                        sg.popup(
-                            message,
-                            title="添加完成",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
-
-                        # 刷新图片列表
-                        image_filenames = self._get_image_files()
-                        self.window["-IMAGE_LIST-"].update(values=image_filenames)
-                    else:
-                        message = "没有添加任何文件"
-                        if skipped_files:
-                            message += "\n\n跳过的文件：\n" + "\n".join(skipped_files)
-                        sg.popup_error(
-                            message,
-                            title="添加失败",
-                            icon=utils.get_gui_icon(),
-                            keep_on_top=True,
-                        )
+        while True:
+            # 有待刷新的列表时只等待片刻，期间没有新事件再统一刷新
+            event, values = self.window.read(  # type: ignore
+                timeout=_LIST_REFRESH_DELAY_MS if self._pending_list_refresh else None
+            )
+            if event in (sg.WIN_CLOSED, "-CLOSE-"):
+                break
+            handler = self._event_handlers.get(event)
+            if handler is not None:
+                handler(event, values)
+
+        # 后台任务投递事件需要界面线程配合，这里不能阻塞等待它们结束：
+        # 先标记关闭让任务不再投递事件，取消排队中的任务，进行中的任务在后台自行结束
+        self._closing = True
+        self._worker_pool.shutdown(wait=False, cancel_futures=True)
         self.window.close()
         # 清理临时文件
-        if hasattr(self, "temp_files"):
-            for temp_file in self.temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception:
-                    pass
+        self._cleanup_temp_files()
+        atexit.unregister(self._cleanup_temp_files)
 
 
 def gui_start(article):
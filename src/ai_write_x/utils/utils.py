@@ -14,6 +14,7 @@ import tempfile
 import urllib.parse
 from pathlib import Path
 import json
+from functools import lru_cache
 # 注意：不要在顶层导入 PathManager，以避免与 path_manager.py 的互相依赖造成循环导入。
 
 
@@ -567,8 +568,9 @@ def fix_mac_clipboard(value):
     return value
 
 
+@lru_cache(maxsize=1)
 def get_gui_icon():
-    """获取GUI窗口图标，支持跨平台和多种用途"""
+    """获取GUI窗口图标，支持跨平台和多种用途（结果只计算一次，图标文件不会反复读取）"""
     import sys
     import os
     import base64